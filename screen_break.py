@@ -28,6 +28,8 @@ import argparse
 # ─── tkinter check ────────────────────────────────────────────
 try:
     import tkinter as tk
+    import tkinter.font as tkfont
+    from tkinter import ttk
 except ImportError:
     _s = platform.system()
     print("Error: tkinter is required.")
@@ -40,13 +42,19 @@ except ImportError:
 # ─── Auto-install pip deps ────────────────────────────────────
 def _ensure_deps():
     import importlib, importlib.util, subprocess
-    needed = {"pystray": "pystray", "PIL": "Pillow"}
+    needed = {"pystray": "pystray", "PIL": "Pillow>=9.0"}  # floor matches pyproject
     missing = [pkg for mod, pkg in needed.items()
                if importlib.util.find_spec(mod) is None]
     if not missing:
         return True
     print(f"  Installing: {', '.join(missing)} ...")
-    for flags in [[], ["--user"]]:
+    # Try the likelier install mode first, so the usual case is one pip run.
+    # os.access can misjudge (Windows ACLs, root-owned venvs): keep the retry.
+    import sysconfig
+    modes = [[], ["--user"]]
+    if not os.access(sysconfig.get_paths()["purelib"], os.W_OK):
+        modes.reverse()
+    for flags in modes:
         try:
             subprocess.check_call(
                 [sys.executable, "-m", "pip", "install", "--quiet"] + flags + missing,
@@ -55,17 +63,24 @@ def _ensure_deps():
             return True
         except (subprocess.CalledProcessError, FileNotFoundError):
             continue
-    print(f"  [X] Failed.  Run:  pip install {' '.join(missing)}\n")
+    # Quoted: an unquoted ">=" is a redirect in both POSIX shells and cmd.exe
+    reqs = " ".join('"%s"' % pkg for pkg in missing)
+    print(f"  [X] Failed.  Run:  pip install {reqs}\n")
     return False
 
 HAS_TRAY = _ensure_deps()
 
 # ─── Imports ──────────────────────────────────────────────────
-import threading, datetime, json, math, random, time
+import atexit, threading, datetime, json, math, random, re, time, zlib
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from copy import deepcopy
+from functools import lru_cache, wraps
+from operator import itemgetter
 from typing import Any, Callable, NamedTuple, Optional
 
 try:
-    from PIL import Image, ImageDraw, ImageFilter, ImageTk
+    from PIL import Image, ImageDraw, ImageTk
     HAS_PIL = True
 except ImportError:
     HAS_PIL = False
@@ -81,6 +96,8 @@ IS_MAC = platform.system() == "Darwin"
 IS_WIN = platform.system() == "Windows"
 FONT = "Helvetica Neue" if IS_MAC else "Segoe UI" if IS_WIN else "DejaVu Sans"
 MONO = "Menlo" if IS_MAC else "Consolas" if IS_WIN else "DejaVu Sans Mono"
+# Named Tk fonts for the settings UI, created per root by _create_named_fonts()
+F_BODY, F_SMALL, F_BOLD, F_HEAD, F_MONO = "SBBody", "SBSmall", "SBBold", "SBHead", "SBMono"
 # macOS trackpads send Button-2 for right-click; bind both for context menus
 RIGHT_CLICK = ("<Button-2>", "<Button-3>") if IS_MAC else ("<Button-3>",)
 
@@ -126,8 +143,10 @@ SLEEP_DETECTION_MINUTES = 120      # If >2 hours since last check, assume laptop
 CATCHUP_WINDOW_SECONDS = 180       # Catch-up window for scheduled breaks (3 minutes)
 DEFAULT_COAST_MARGIN = 10          # Default coast margin (now configurable)
 STARTUP_DISMISS_MS = 6000          # Auto-dismiss startup notification after 6 seconds
+STATS_SAVE_DELAY_MS = 500          # Stats writes are coalesced into one save this long after the last change
 WARNING_ICON_SIZE = 124            # Size of warning clock icon (2x for visibility)
 WARNING_ICON_MARGIN = 18           # Margin from screen edge
+NOTES_TAIL = 500                   # Notes kept in memory; older ones stay on disk until export
 
 # ─── Config ───────────────────────────────────────────────────
 CONFIG_FILE = os.path.join(os.path.expanduser("~"), "screen_break_config.json")
@@ -154,6 +173,7 @@ DEO_PIN_UI_ENABLED = False
 
 # ─── Idle Detection ───────────────────────────────────────────
 IDLE_CHECK_INTERVAL = 5  # Check idle every 5 seconds
+IDLE_POLL_MAX = 60  # Longest back-off between idle checks
 DEFAULT_IDLE_THRESHOLD = 300  # 5 minutes of inactivity = idle
 
 _idle_impl = None  # Cached platform-specific idle detection function
@@ -170,11 +190,16 @@ def _init_idle_impl():
             class LASTINPUTINFO(Structure):
                 _fields_ = [("cbSize", c_uint), ("dwTime", c_uint)]
             _GetTickCount = getattr(windll.kernel32, 'GetTickCount64', windll.kernel32.GetTickCount)
+            _GetLastInputInfo = windll.user32.GetLastInputInfo
+            # One struct, reused by every poll
+            lii = LASTINPUTINFO()
+            lii.cbSize = sizeof(LASTINPUTINFO)
+            lii_ref = byref(lii)
             def _win_idle():
-                lii = LASTINPUTINFO()
-                lii.cbSize = sizeof(LASTINPUTINFO)
-                if windll.user32.GetLastInputInfo(byref(lii)):
-                    return (_GetTickCount() - lii.dwTime) / 1000.0
+                if _GetLastInputInfo(lii_ref):
+                    # dwTime is 32-bit (and GetTickCount64 comes back as a c_int):
+                    # take the difference mod 2**32 so it survives tick wraparound
+                    return ((_GetTickCount() - lii.dwTime) & 0xFFFFFFFF) / 1000.0
                 return 0.0
             _idle_impl = _win_idle
         elif IS_MAC:
@@ -190,17 +215,48 @@ def _init_idle_impl():
             # kCGEventSourceStateCombinedSessionState = 0, kCGAnyInputEventType = ~0
             _idle_impl = lambda: fn(0, 0xFFFFFFFF)
         else:  # Linux
-            import subprocess
-            def _linux_idle():
-                result = subprocess.run(
-                    ["xprintidle"], capture_output=True, text=True, timeout=2)
-                return int(result.stdout.strip()) / 1000.0
-            _idle_impl = _linux_idle
+            try:
+                _idle_impl = _xss_idle_impl()
+            except (OSError, AttributeError):
+                # No libXss / X display: fall back to the xprintidle binary
+                import subprocess
+                def _linux_idle():
+                    result = subprocess.run(
+                        ["xprintidle"], capture_output=True, text=True, timeout=2)
+                    return int(result.stdout.strip()) / 1000.0
+                _idle_impl = _linux_idle
     except Exception as _idle_err:
         if IS_MAC:
             print("  [!] Idle detection unavailable (grant Input Monitoring in System Settings > Privacy)")
         _idle_impl = lambda: 0.0
 
+def _xss_idle_impl():
+    """Idle time from the X screensaver extension, queried in-process — no
+    xprintidle fork per poll. Raises OSError if libXss or a display is missing."""
+    import ctypes, ctypes.util
+    from ctypes import c_int, c_ulong, c_void_p, c_char_p, POINTER
+    class XScreenSaverInfo(ctypes.Structure):
+        _fields_ = [("window", c_ulong), ("state", c_int), ("kind", c_int),
+                    ("til_or_since", c_ulong), ("idle", c_ulong), ("eventMask", c_ulong)]
+    xlib = ctypes.cdll.LoadLibrary(ctypes.util.find_library("X11") or "libX11.so.6")
+    xss = ctypes.cdll.LoadLibrary(ctypes.util.find_library("Xss") or "libXss.so.1")
+    xlib.XOpenDisplay.restype = c_void_p;  xlib.XOpenDisplay.argtypes = [c_char_p]
+    xlib.XDefaultRootWindow.restype = c_ulong;  xlib.XDefaultRootWindow.argtypes = [c_void_p]
+    xss.XScreenSaverAllocInfo.restype = POINTER(XScreenSaverInfo)
+    xss.XScreenSaverQueryInfo.argtypes = [c_void_p, c_ulong, POINTER(XScreenSaverInfo)]
+    dpy = xlib.XOpenDisplay(None)
+    if not dpy:
+        raise OSError("cannot open X display")
+    # Display, root window and info buffer are opened once and reused every poll
+    root, info = xlib.XDefaultRootWindow(dpy), xss.XScreenSaverAllocInfo()
+    if not info:
+        raise OSError("XScreenSaverAllocInfo failed")
+    def _xss_idle():
+        if xss.XScreenSaverQueryInfo(dpy, root, info):
+            return info.contents.idle / 1000.0
+        return 0.0
+    return _xss_idle
+
 def get_idle_seconds() -> float:
     """Get seconds since last user input. Returns 0 if detection unavailable."""
     if _idle_impl is None:
@@ -213,6 +269,26 @@ def get_idle_seconds() -> float:
 # ─── Sound System ─────────────────────────────────────────────
 _sound_counter = 0
 
+@lru_cache(maxsize=None)
+def _which(program: str) -> Optional[str]:
+    """shutil.which, remembered — the installed players don't change while we run."""
+    import shutil
+    return shutil.which(program)
+
+def _spawn_player(cmds: list[list[str]]) -> bool:
+    """Start the first installed player in cmds on a daemon thread, so the
+    fork never stalls the Tk thread. False if none is installed."""
+    import subprocess
+    def run(argv):
+        try: subprocess.Popen(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except OSError: pass
+    for cmd in cmds:
+        exe = _which(cmd[0])
+        if exe:
+            threading.Thread(target=run, args=([exe] + cmd[1:],), daemon=True).start()
+            return True
+    return False
+
 def play_sound(sound_type: str = "chime", custom_path: str = None) -> None:
     """Play a notification sound. Supports mp3, wav, and other common formats."""
     # Try custom sound first
@@ -237,11 +313,9 @@ def play_sound(sound_type: str = "chime", custom_path: str = None) -> None:
                 threading.Thread(target=cleanup, daemon=True).start()
                 return
             elif IS_MAC:
-                import subprocess
-                subprocess.Popen(["afplay", custom_path])
-                return
+                if _spawn_player([["afplay", custom_path]]):
+                    return
             else:  # Linux
-                import subprocess
                 # Try common Linux audio players in order of likelihood
                 players = [
                     ["mpv", "--no-terminal", "--no-video", custom_path],
@@ -251,12 +325,8 @@ def play_sound(sound_type: str = "chime", custom_path: str = None) -> None:
                     ["paplay", custom_path],  # PulseAudio (wav/ogg only usually)
                     ["aplay", "-q", custom_path],  # ALSA (wav only)
                 ]
-                for cmd in players:
-                    try:
-                        subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                        return
-                    except FileNotFoundError:
-                        continue
+                if _spawn_player(players):
+                    return
         except Exception:
             pass  # Fall through to default
 
@@ -271,18 +341,11 @@ def play_sound(sound_type: str = "chime", custom_path: str = None) -> None:
             else:
                 winsound.PlaySound("SystemHand", winsound.SND_ALIAS | winsound.SND_ASYNC)
         elif IS_MAC:
-            import subprocess
             sounds = {"chime": "Blow", "complete": "Glass", "warning": "Basso"}
-            subprocess.Popen(["afplay", f"/System/Library/Sounds/{sounds.get(sound_type, 'Blow')}.aiff"])
+            _spawn_player([["afplay", f"/System/Library/Sounds/{sounds.get(sound_type, 'Blow')}.aiff"]])
         else:  # Linux
-            import subprocess
-            for cmd in [["paplay", "/usr/share/sounds/freedesktop/stereo/message.oga"],
-                       ["aplay", "-q", "/usr/share/sounds/sound-icons/prompt.wav"]]:
-                try:
-                    subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                    break
-                except FileNotFoundError:
-                    continue
+            _spawn_player([["paplay", "/usr/share/sounds/freedesktop/stereo/message.oga"],
+                           ["aplay", "-q", "/usr/share/sounds/sound-icons/prompt.wav"]])
     except Exception:
         pass  # Silent fail - sound is optional
 
@@ -329,10 +392,25 @@ EXERCISES = {
     ],
 }
 
+_decks: dict[str, list[Any]] = {}  # name -> undealt items, shuffled
+_dealt: dict[str, Any] = {}        # name -> item dealt last
+
+def _deal(name: str, items: list[Any]) -> Any:
+    """Next item from a shuffled deck: every item comes up once before any
+    repeats, and a reshuffle never starts with the one just shown."""
+    deck = _decks.get(name)
+    if not deck:
+        deck = _decks[name] = random.sample(items, len(items))
+        if len(deck) > 1 and deck[-1] == _dealt.get(name):
+            deck[0], deck[-1] = deck[-1], deck[0]
+    item = _dealt[name] = deck.pop()
+    return item
+
 def get_exercise(category: str = "stretch") -> str:
     """Get a random exercise suggestion."""
-    exercises = EXERCISES.get(category, EXERCISES["stretch"])
-    return random.choice(exercises)
+    if category not in EXERCISES:
+        category = "stretch"
+    return _deal(f"exercise:{category}", EXERCISES[category])
 
 # ─── Mini Reminders ───────────────────────────────────────────
 MINI_REMINDERS = [
@@ -347,7 +425,7 @@ MINI_REMINDERS = [
 
 def get_mini_reminder() -> tuple[str, str, str]:
     """Get a random mini reminder (emoji, title, description)."""
-    return random.choice(MINI_REMINDERS)
+    return _deal("mini", MINI_REMINDERS)
 
 # ─── Guided Eye Exercise Patterns ──────────────────────────────
 EYE_EXERCISE_PATTERNS = [
@@ -657,9 +735,60 @@ DEFAULT_CONFIG = {
     "deo_grace_minutes": 10,              # bonus granted per parent unlock during a lockout
 }
 
+# path -> (text, (mtime_ns, size)) of our last successful write
+_last_written: dict[str, tuple[str, Optional[tuple[int, int]]]] = {}
+
+def _file_sig(path: str) -> Optional[tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def _tail_lines(f: Any, limit: int, block: int = 65536) -> list[bytes]:
+    """Last `limit` lines of binary file f, read backwards from EOF in blocks."""
+    f.seek(0, os.SEEK_END)
+    pos = f.tell();  chunks = [];  newlines = 0
+    # limit + 1 newlines guarantee the first kept line is complete
+    while pos > 0 and newlines <= limit:
+        step = min(block, pos);  pos -= step
+        f.seek(pos);  chunk = f.read(step)
+        chunks.append(chunk);  newlines += chunk.count(b"\n")
+    return b"".join(reversed(chunks)).splitlines()[-limit:]
+
+def _write_json(path: str, data: Any) -> None:
+    """Write data as JSON via a temp file and os.replace, so a crash mid-write
+    can't leave a truncated file. Skips the write if the text is unchanged
+    and the file on disk is still the one we wrote (not deleted or edited)."""
+    text = json.dumps(data, indent=2)
+    last = _last_written.get(path)
+    if last and last[1] and last[0] == text and last[1] == _file_sig(path):
+        return
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text);  f.flush();  os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except OSError:
+        try: os.remove(tmp)
+        except OSError: pass
+        raise
+    _last_written[path] = (text, _file_sig(path))
+
+# (key, minimum, fallback) for the numeric settings load_config repairs
+_CONFIG_MINIMUMS = (
+    ("eye_rest_interval", 1, 20),
+    ("micro_pause_interval", 1, 45),
+    ("minimum_break_gap", 1, 20),
+    ("warning_seconds", 5, 60),
+    ("snooze_minutes", 1, 5),
+    ("eye_rest_duration", 5, 20),
+    ("low_energy_multiplier", 1.0, 1.5),
+)
+
 def load_config() -> dict[str, Any]:
     """Load config from file, falling back to defaults for missing/invalid values."""
-    defaults = json.loads(json.dumps(DEFAULT_CONFIG))
+    defaults = deepcopy(DEFAULT_CONFIG)
     if os.path.exists(CONFIG_FILE):
         try:
             with open(CONFIG_FILE, encoding="utf-8") as f:
@@ -677,16 +806,9 @@ def load_config() -> dict[str, Any]:
         defaults["warning_seconds"] = 10
 
     # Validate numeric fields
-    for key, min_val, default in [
-        ("eye_rest_interval", 1, 20),
-        ("micro_pause_interval", 1, 45),
-        ("minimum_break_gap", 1, 20),
-        ("warning_seconds", 5, 60),
-        ("snooze_minutes", 1, 5),
-        ("eye_rest_duration", 5, 20),
-        ("low_energy_multiplier", 1.0, 1.5),
-    ]:
-        if not isinstance(defaults.get(key), (int, float)) or defaults[key] < min_val:
+    for key, min_val, default in _CONFIG_MINIMUMS:
+        val = defaults.get(key)
+        if not isinstance(val, (int, float)) or val < min_val:
             defaults[key] = default
 
     return defaults
@@ -694,8 +816,7 @@ def load_config() -> dict[str, Any]:
 def save_config(cfg: dict[str, Any]) -> None:
     """Save config to file."""
     try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(cfg, f, indent=2)
+        _write_json(CONFIG_FILE, cfg)
     except (IOError, OSError) as e:
         print(f"  [!] Config save error: {e}")
 
@@ -708,12 +829,16 @@ DEFAULT_STATS = {
         "micro_skipped": 0,
         "scheduled_taken": 0,
         "scheduled_skipped": 0,
+        "focus_sessions": 0,
     },
+    # Every counter the break handlers bump must be listed here: load_stats
+    # merges these in, so the handlers can use a plain `+= 1`.
     "today": {
         "date": None,
         "eye_rest_taken": 0,
         "micro_taken": 0,
         "scheduled_taken": 0,
+        "focus_sessions": 0,
     },
     "streak_days": 0,
     "last_active_date": None,
@@ -723,7 +848,7 @@ DEFAULT_STATS = {
 
 def load_stats() -> dict[str, Any]:
     """Load statistics from file."""
-    stats = json.loads(json.dumps(DEFAULT_STATS))
+    stats = deepcopy(DEFAULT_STATS)
     if os.path.exists(STATS_FILE):
         try:
             with open(STATS_FILE, encoding="utf-8") as f:
@@ -743,8 +868,7 @@ def load_stats() -> dict[str, Any]:
 def save_stats(stats: dict[str, Any]) -> None:
     """Save statistics to file."""
     try:
-        with open(STATS_FILE, "w", encoding="utf-8") as f:
-            json.dump(stats, f, indent=2)
+        _write_json(STATS_FILE, stats)
     except (IOError, OSError):
         pass
 
@@ -776,18 +900,13 @@ def update_stats_for_today(stats: dict[str, Any]) -> None:
         elif stats["last_active_date"] != today:
             stats["streak_days"] = 1
         # Reset today's counters
-        stats["today"] = {
-            "date": today,
-            "eye_rest_taken": 0,
-            "micro_taken": 0,
-            "scheduled_taken": 0,
-        }
+        stats["today"] = dict(DEFAULT_STATS["today"], date=today)
     stats["last_active_date"] = today
 
     # Deo mode usage resets independently, keyed on its own date field
     deo = stats.get("deo")
     if not isinstance(deo, dict):
-        deo = json.loads(json.dumps(DEFAULT_STATS["deo"]))
+        deo = deepcopy(DEFAULT_STATS["deo"])
         stats["deo"] = deo
     if deo.get("date") != today:
         deo["date"] = today
@@ -825,6 +944,27 @@ def _parse_hhmm_safe(s: str, fallback: datetime.time) -> datetime.time:
     except (ValueError, AttributeError, TypeError):
         return fallback
 
+@lru_cache(maxsize=128)
+def _parse_hhmm(s: str) -> datetime.time:
+    """Parse 'HH:MM' to datetime.time. Raises ValueError if invalid. Memoized:
+    the same few work-hour and break strings are parsed every tick."""
+    h, m = s.strip().split(":")
+    return datetime.time(int(h), int(m))
+
+@lru_cache(maxsize=128)
+def _fmt12_hhmm(s: str) -> str:
+    """'14:30' -> '2:30 PM'; returns s unchanged if it isn't HH:MM."""
+    try:
+        h, m = s.strip().split(":")
+        h, m = int(h), int(m)
+        suffix = "AM" if h < 12 else "PM"
+        h12 = h % 12
+        if h12 == 0:
+            h12 = 12
+        return f"{h12}:{m:02d} {suffix}"
+    except ValueError:
+        return s
+
 def deo_decide(now: datetime.datetime, cfg: dict[str, Any], usage: dict[str, Any]) -> DeoDecision:
     """Decide Deo mode's state for a given moment.
 
@@ -1006,6 +1146,164 @@ def apply_theme(theme_name: str) -> None:
     C_W_BG = theme["w_bg"];   C_W_GL = theme["w_gl"]
     C_OK = theme["ok"];       C_ERR = theme["err"];         C_GENTLE = theme["gentle"]
 
+    # Shared widget styling captures colours, so it is rebuilt with the theme
+    global SPIN_KW, CHK_KW, LBL_MUT_KW
+    SPIN_KW = dict(font=F_MONO, bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
+                   relief="flat", justify="center")
+    CHK_KW = dict(font=F_BODY, fg=C_TEXT_DIM, bg=C_BG, selectcolor=C_CARD_IN,
+                  activebackground=C_BG, activeforeground=C_TEXT_DIM)
+    LBL_MUT_KW = dict(font=F_BODY, fg=C_TEXT_MUT, bg=C_BG)
+
+# Shared widget options, rebuilt by apply_theme() since they bake in colours
+SPIN_KW: dict[str, Any] = {}
+CHK_KW: dict[str, Any] = {}
+LBL_MUT_KW: dict[str, Any] = {}
+
+# Settings → Features checkboxes: (config key, label, optional trailing
+# spinbox as (config key, min, max, unit, width)). Defaults come from DEFAULT_CONFIG.
+_FEATURE_SPEC = [
+    ("focus_mode", "Presentation mode (auto-pause during fullscreen/Zoom)", None),
+    ("idle_detection", "Pause when idle for", ("idle_threshold", 60, 1800, "sec", 4)),
+    ("sound_enabled", "Play sound when breaks start", None),
+    ("show_exercises", "Show exercise suggestions during breaks", None),
+    ("strict_mode", "Strict mode (snooze option only)", None),
+    ("screen_dim", "Dim screen during eye rest (fade in effect)", None),
+    ("pomodoro_mode", "Pomodoro mode (25 min work / 5 min break)", None),
+    ("mini_reminders", "Mini reminders (posture, hydration) every", ("mini_reminder_interval", 5, 60, "min", 3)),
+    ("multi_monitor_overlay", "Show overlay on all monitors", None),
+    ("show_floating_widget", "Floating countdown widget (always visible)", None),
+    ("show_in_taskbar", "Show in Dock (restart to apply)" if IS_MAC else "Show in taskbar (restart to apply)", None),
+    ("status_always_on_top", "Settings window always on top", None),
+]
+_EXERCISE_SPEC = [
+    ("guided_eye_exercises", "Guided eye exercise routines", None),
+    ("breathing_exercises", "Breathing exercises during breaks", None),
+    ("desk_exercises", "Animated desk exercises", None),
+]
+
+# Lower bounds _apply_settings enforces on integer settings, with the message shown
+_SPIN_MINIMUMS = [
+    ("eye_rest_interval", 1, "Intervals must be ≥ 1 min"),
+    ("micro_pause_interval", 1, "Intervals must be ≥ 1 min"),
+    ("eye_rest_duration", 5, "Eye rest duration must be ≥ 5 sec"),
+    ("snooze_minutes", 1, "Snooze must be ≥ 1 min"),
+    ("warning_seconds", 10, "Warning must be ≥ 10 sec"),
+    ("idle_threshold", 60, "Idle threshold must be ≥ 60 sec"),
+    ("mini_reminder_interval", 5, "Mini reminders must be ≥ 5 min"),
+]
+
+_TIME_RE = re.compile(r"([01]?\d|2[0-3]):([0-5]?\d)")
+
+
+def _norm_hhmm(ts: str) -> str:
+    """Validates a typed 'H:MM' time and returns it as 'HH:MM'; ValueError if invalid."""
+    m = _TIME_RE.fullmatch(ts)
+    if not m:
+        raise ValueError(f"Invalid time {ts!r}")
+    return f"{int(m[1]):02d}:{int(m[2]):02d}"
+
+
+# Settings whose change restarts the eye-rest/micro-pause countdowns on save
+_TIMER_KEYS = frozenset({
+    "eye_rest_interval", "micro_pause_interval", "minimum_break_gap", "eye_rest_enabled",
+    "micro_pause_enabled", "pomodoro_mode", "breaks", "work_start", "work_end",
+})
+
+# Breathing circle spinbox rows: ([(label, breathing_widget_* suffix, min, max,
+# width, step), ...], trailing unit). Float steps get a one-decimal format.
+_BREATH_SPIN_ROWS = [
+    ([("In:", "inhale", 1, 20, 4, 0.5), ("s Hold:", "hold_in", 0, 15, 4, 0.5)], "s"),
+    ([("Out:", "exhale", 1, 20, 4, 0.5), ("s Hold:", "hold_out", 0, 15, 4, 0.5)], "s"),
+    ([("Size:", "size", 60, 9999, 4, 10), ("px  Opacity:", "alpha", 1, 100, 3, 5)], "%"),
+]
+
+
+def _breath_spin_text(name: str, value: Any) -> str:
+    """Config value -> spinbox text (opacity is shown as a percentage)."""
+    if name == "alpha":
+        return str(int(value * 100))
+    return str(value) if name == "size" else str(float(value))
+
+
+def _breath_spin_value(name: str, text: str) -> Any:
+    """Spinbox text -> clamped config value; raises ValueError if unparsable."""
+    if name == "alpha":
+        return max(0.01, min(1.0, int(text) / 100))
+    if name == "size":
+        return max(60, int(text))
+    return max(0 if name.startswith("hold") else 1, round(float(text), 1))
+
+
+def _spin(parent: tk.Widget, lo: float, hi: float, var: tk.StringVar, width: int = 4,
+          inc: Optional[float] = None, fmt: Optional[str] = None) -> tk.Spinbox:
+    """Unpacked Spinbox with the shared styling, bound to var."""
+    kw = dict(SPIN_KW, from_=lo, to=hi, width=width)
+    if inc is not None:
+        kw["increment"] = inc
+    if fmt:
+        kw["format"] = fmt
+    value = var.get()
+    spin = tk.Spinbox(parent, textvariable=var, **kw)
+    var.set(value)  # a new spinbox snaps its variable to from_
+    return spin
+
+
+def _create_named_fonts(root: tk.Misc) -> list:
+    """Creates the F_* named fonts on root. Keep the returned objects alive:
+    Tk drops a named font once its Font object is collected."""
+    return [tkfont.Font(root=root, name=name, family=family, size=size, weight=weight)
+            for name, family, size, weight in [
+                (F_BODY, FONT, 10, "normal"), (F_SMALL, FONT, 9, "normal"), (F_BOLD, FONT, 10, "bold"),
+                (F_HEAD, FONT, 11, "bold"), (F_MONO, MONO, 10, "normal")]]
+
+
+def _grid_row(widget: tk.Widget, sticky: str = "w", **kw) -> tk.Widget:
+    """Grids widget into the next free row of its parent's first column."""
+    widget.grid(row=widget.master.grid_size()[1], column=0, sticky=sticky, **kw)
+    return widget
+
+
+def _tk_alive(attr: str) -> Callable:
+    """Method decorator for periodic callbacks: runs the method only while the
+    window held in self.<attr> still exists, clearing the attribute once it
+    has gone."""
+    def deco(fn: Callable) -> Callable:
+        @wraps(fn)
+        def wrap(self, *a, **kw):
+            win = getattr(self, attr, None)
+            if not win:
+                return None
+            try:
+                alive = win.winfo_exists()
+            except tk.TclError:
+                alive = False
+            if not alive:
+                setattr(self, attr, None)
+                return None
+            return fn(self, *a, **kw)
+        return wrap
+    return deco
+
+
+def _sv(var: tk.StringVar, value: str) -> None:
+    """StringVar.set that skips the Tcl write (and the label redraw it
+    triggers) when the value hasn't changed since the last _sv call."""
+    if getattr(var, "_last", None) != value:
+        var.set(value);  var._last = value
+
+
+_TWOD = [f"{i:02d}" for i in range(100)]  # zero-padded 00–99 for the 1 Hz countdowns
+
+
+def _mm_ss(m: int, s: int) -> str:
+    return (_TWOD[m] if m < 100 else str(m)) + ":" + _TWOD[s]
+
+
+def _clamp(v: int, lo: int, hi: int) -> int:
+    """max(lo, min(v, hi)) without the two builtin calls; lo wins if hi < lo."""
+    if v > hi: v = hi
+    return lo if v < lo else v
+
 # ─── Fullscreen Detection ────────────────────────────────────
 def _is_fullscreen_mac() -> bool:
     """Check if a fullscreen app is active on macOS via Quartz."""
@@ -1119,11 +1417,14 @@ class ScreenBreakApp:
     def __init__(self):
         self.root = tk.Tk()
         self.root.withdraw()  # Hide immediately; may be replaced by taskbar mode below
+        self._fonts = _create_named_fonts(self.root)
 
         self.config = load_config()
-        self.notes  = self._load_notes()
+        self.notes  = self._load_notes();  self._notes_pending = []
         self.stats  = load_stats()
         update_stats_for_today(self.stats)
+        self._stats_save_id = None  # pending debounced save, see _schedule_stats_save
+        atexit.register(self._flush_on_exit)
 
         # Apply theme from config
         apply_theme(self.config.get("theme", "nord"))
@@ -1145,17 +1446,28 @@ class ScreenBreakApp:
         self.paused = False;  self.low_energy = False
         self.pause_started = None  # Track when pause began for timer adjustment
         self.idle = False;  self.idle_since = None  # Idle detection state
+        self._idle_poll_s = IDLE_CHECK_INTERVAL  # backs off while idle, see _check_idle
+        self._idle_after_id = None  # the one pending _check_idle
         self.overlay_up = False;  self.warning_up = False
         self.current_overlay = None;  self.warning_window = None
         self.pending_break = None;  self.snooze_until = None
         self._mini_ind = None;  self._mini_ov = None;  self._mini_done_notif = None
-        self._break_rem = 0
+        self._break_rem = 0;  self._break_skip = None
         self.last_eye_rest = datetime.datetime.now()
         self.last_micro    = datetime.datetime.now()
         self.last_any_break = datetime.datetime.now()
         self.acked_today   = {};  self.today = datetime.date.today()
+        self._work_hours_cache = (None, None)  # (raw strings, parsed bounds), see _get_work_bounds
+        self._sched_cache = (None, None, [])   # (date, breaks signature, rows), see _get_sched_rows
+        self._tick_count = 0  # _tick runs the once-a-minute checks every 60 // TICK ticks
         self._warn_anim_id = None;  self._warn_rem = 0;  self._warn_total = 0
         self._status_win = None;  self._tip = None;  self._stats_win = None;  self._notes_win = None;  self._msg_editor_win = None
+        # Closed windows are withdrawn, not destroyed, so reopening skips the rebuild
+        self._status_win_cache = None;  self._stats_win_cache = None;  self._notes_win_cache = None
+        self._1hz_after_id = None;  self._confirm_win = None  # shared status/widget refresh, see _tick_1hz
+        self._1hz_deadline = 0.0  # time.monotonic() the next refresh is due at
+        self._features_built = False;  self._features_after_id = None
+        self._fb_after_id = None
 
         # Deo mode state (enforced screen-time limits; hidden feature, secret-gesture toggle)
         self._deo_locked = False
@@ -1198,7 +1510,6 @@ class ScreenBreakApp:
         if IS_WIN and not self.config.get("deo_mode_enabled", False):
             self._deo_set_task_mgr_disabled(False, True)
         if IS_WIN:
-            import atexit
             atexit.register(self._deo_emergency_restore)
             try:
                 import signal
@@ -1212,7 +1523,8 @@ class ScreenBreakApp:
 
         # Floating widget state
         self._widget_win = None
-        self._widget_label = None
+        self._widget_label = None;  self._widget_tv = None
+        self._pending_moves = {}  # window -> (x, y) awaiting _flush_moves
         self._widget_dragged = False
         self._widget_drag_x = 0
         self._widget_drag_y = 0
@@ -1222,6 +1534,15 @@ class ScreenBreakApp:
         self._breath_canvas = None
         self._breath_photo = None  # prevent GC of PhotoImage
         self._breath_running = False
+        self._breath_after_id = None  # the one pending animation frame
+        # Per-frame settings, read once per widget build (see _create_breathing_widget)
+        self._breath_click_through = True
+        self._breath_phase_ends = (4 * 10**9, 4 * 10**9, 12 * 10**9, 12 * 10**9)
+        # Rendered frames keyed by quantized core radius, see _breath_frame
+        self._breath_frame_cache = OrderedDict();  self._breath_last_key = None
+        self._breath_cache_bytes = 0  # stored size held in _breath_frame_cache
+        self._breath_pack = None  # how _breath_frame stores frames, see _breath_cache_mode
+        self._breath_scratch = None  # (image, draw) reused by the ring renderers
         self._breath_dragged = False
         self._breath_drag_x = 0
         self._breath_drag_y = 0
@@ -1233,9 +1554,11 @@ class ScreenBreakApp:
         self._breath_hbmp = None
         self._breath_ppv = None
         self._breath_old_bmp = None
+        self._breath_ulw_args = None  # (UpdateLayeredWindow, size, src point, blend) reused every frame
 
         self.last_mini_reminder = datetime.datetime.now()
-        self._mini_win = None
+        self._mini_win = None  # built once, withdrawn between reminders
+        self._mini_labels = None;  self._mini_dismiss_id = None
         self.last_hydration_reminder = datetime.datetime.now()
         self._hydration_win = None
         self.fullscreen_active = False  # Track fullscreen state
@@ -1244,6 +1567,8 @@ class ScreenBreakApp:
         self._eye_exercise = None
         self._breathing_exercise = None
         self._desk_exercise = None
+        self._fade_after_ids = []  # queued eye-rest dim steps, see _set_overlay_alpha
+        self._cd_after_id = None   # next step of the break countdown on screen
 
         # Focus session state
         self._focus_win = None
@@ -1261,8 +1586,6 @@ class ScreenBreakApp:
         if self.config.get("breathing_widget_enabled", True):
             self.root.after(600, self._create_breathing_widget)
         self._start_idle_monitor()
-        self._start_mini_reminders()
-        self._start_hydration_reminders()
         self._tick()
 
         if IS_MAC and HAS_TRAY:
@@ -1274,53 +1597,80 @@ class ScreenBreakApp:
         else:
             self.root.mainloop()
 
+    def _schedule_stats_save(self) -> None:
+        """Marks stats dirty; bursts of updates (break end + streak + today)
+        collapse into a single write STATS_SAVE_DELAY_MS later."""
+        if self._stats_save_id is None:
+            self._stats_save_id = self.root.after(STATS_SAVE_DELAY_MS, self._flush_stats)
+
+    def _flush_stats(self) -> None:
+        """Writes stats now, superseding any pending debounced save."""
+        if self._stats_save_id is not None:
+            try: self.root.after_cancel(self._stats_save_id)
+            except tk.TclError: pass
+            self._stats_save_id = None
+        save_stats(self.stats)
+
+    def _flush_on_exit(self) -> None:
+        """atexit hook: writes a still-pending stats save and unsaved notes."""
+        if self._stats_save_id is not None:
+            self._flush_stats()
+        self._flush_notes()
+
     def _is_work_hours(self) -> bool:
         """Check if current time is within configured work hours."""
-        try:
-            t = datetime.datetime.now().time()
-            ws = self._pt(self.config.get("work_start", "08:00"))
-            we = self._pt(self.config.get("work_end", "20:00"))
-            return ws <= t < we
-        except ValueError:
+        bounds = self._get_work_bounds()
+        if bounds is None:
             return True  # If parsing fails, assume work hours
+        return bounds[0] <= datetime.datetime.now().time() < bounds[1]
 
-    def _start_mini_reminders(self) -> None:
-        """Start mini reminder system (posture, hydration, blink nudges)."""
-        def check_mini():
-            if not self.config.get("mini_reminders", False):
-                self.root.after(60000, check_mini)  # Check again in 1 min
-                return
-            if self.paused or self.idle or self.overlay_up or self.warning_up:
-                self.root.after(60000, check_mini)
-                return
-            if not self._is_work_hours():
-                self.root.after(60000, check_mini)
-                return
-            if self.config.get("focus_mode", True) and self.fullscreen_active:
-                self.root.after(60000, check_mini)
-                return
-
-            interval = self.config.get("mini_reminder_interval", 10)
-            elapsed = (datetime.datetime.now() - self.last_mini_reminder).total_seconds() / 60
-
-            if elapsed >= interval:
-                self._show_mini_reminder()
-                self.last_mini_reminder = datetime.datetime.now()
+    def _nudges_allowed(self) -> bool:
+        """Gate shared by the mini and hydration reminders."""
+        if self.paused or self.idle or self.overlay_up or self.warning_up:
+            return False
+        if not self._is_work_hours():
+            return False
+        return not (self.config.get("focus_mode", True) and self.fullscreen_active)
 
-            self.root.after(60000, check_mini)  # Check every minute
+    def _check_mini_reminder(self, now: datetime.datetime) -> None:
+        """Mini reminder check (posture, hydration, blink nudges), once a minute from _tick."""
+        if not self.config.get("mini_reminders", False) or not self._nudges_allowed():
+            return
+        interval = self.config.get("mini_reminder_interval", 10)
+        elapsed = (now - self.last_mini_reminder).total_seconds() / 60
 
-        self.root.after(60000, check_mini)
+        if elapsed >= interval:
+            self._show_mini_reminder()
+            self.last_mini_reminder = datetime.datetime.now()
 
     def _show_mini_reminder(self) -> None:
-        """Show a brief mini reminder popup."""
-        if self._mini_win:
-            try:
-                self._mini_win.destroy()
-            except tk.TclError:
-                pass
-
+        """Show a brief mini reminder popup. The popup is built once and
+        withdrawn between reminders; each one just swaps the label text."""
         emoji, title, desc = get_mini_reminder()
+        try:
+            win = self._mini_win
+            if win is None or not win.winfo_exists():
+                win = self._build_mini_win()
+            title_lbl, desc_lbl = self._mini_labels
+            title_lbl.configure(text=f"{emoji}  {title}")
+            desc_lbl.configure(text=desc)
+
+            # Position in bottom-right corner (re-read: the screen may have changed)
+            sw = win.winfo_screenwidth()
+            sh = win.winfo_screenheight()
+            w, h = 420, 120
+            win.geometry(f"{w}x{h}+{sw-w-20}+{sh-h-60}")
+            win.deiconify();  win.attributes("-topmost", True)
+
+            # Auto-dismiss after 4 seconds, counted from this reminder
+            if self._mini_dismiss_id:
+                win.after_cancel(self._mini_dismiss_id)
+            self._mini_dismiss_id = win.after(4000, self._hide_mini_reminder)
+        except tk.TclError:
+            self._mini_win = None
 
+    def _build_mini_win(self) -> tk.Toplevel:
+        """Create the reusable mini reminder popup."""
         win = tk.Toplevel(self.root)
         win.overrideredirect(True)
         win.attributes("-topmost", True)
@@ -1330,57 +1680,36 @@ class ScreenBreakApp:
             pass
         win.configure(bg=C_CARD)
 
-        # Position in bottom-right corner
-        sw = win.winfo_screenwidth()
-        sh = win.winfo_screenheight()
-        w, h = 420, 120
-        win.geometry(f"{w}x{h}+{sw-w-20}+{sh-h-60}")
-
         f = tk.Frame(win, bg=C_CARD, padx=20, pady=14)
         f.pack(fill="both", expand=True)
 
-        tk.Label(f, text=f"{emoji}  {title}", font=(FONT, 16, "bold"),
-                 fg=C_ACCENT2, bg=C_CARD).pack(anchor="w")
-        tk.Label(f, text=desc, font=(FONT, 12), fg=C_TEXT_DIM, bg=C_CARD).pack(anchor="w", pady=(4, 0))
+        title_lbl = tk.Label(f, font=(FONT, 16, "bold"), fg=C_ACCENT2, bg=C_CARD)
+        title_lbl.pack(anchor="w")
+        desc_lbl = tk.Label(f, font=(FONT, 12), fg=C_TEXT_DIM, bg=C_CARD)
+        desc_lbl.pack(anchor="w", pady=(4, 0))
 
-        self._mini_win = win
+        win.bind("<Button-1>", lambda e: self._hide_mini_reminder())
+        self._mini_win = win;  self._mini_labels = (title_lbl, desc_lbl)
+        return win
 
-        # Auto-dismiss after 4 seconds
-        def dismiss():
+    def _hide_mini_reminder(self) -> None:
+        """Withdraw the mini reminder popup, keeping it for the next one."""
+        self._mini_dismiss_id = None
+        if self._mini_win:
             try:
-                win.destroy()
+                self._mini_win.withdraw()
             except tk.TclError:
-                pass
-            self._mini_win = None
-        win.after(4000, dismiss)
-        win.bind("<Button-1>", lambda e: dismiss())
-
-    def _start_hydration_reminders(self) -> None:
-        """Start hydration reminder system."""
-        def check_hydration():
-            if not self.config.get("hydration_tracking", False):
-                self.root.after(60000, check_hydration)  # Check again in 1 min
-                return
-            if self.paused or self.idle or self.overlay_up or self.warning_up:
-                self.root.after(60000, check_hydration)
-                return
-            if not self._is_work_hours():
-                self.root.after(60000, check_hydration)
-                return
-            # Check if fullscreen mode should block
-            if self.config.get("focus_mode", True) and self.fullscreen_active:
-                self.root.after(60000, check_hydration)
-                return
-
-            interval = self.config.get("hydration_reminder_interval", 30)
-            elapsed = (datetime.datetime.now() - self.last_hydration_reminder).total_seconds() / 60
-            if elapsed >= interval:
-                self.last_hydration_reminder = datetime.datetime.now()
-                self.root.after(0, self._show_hydration_popup)
+                self._mini_win = None
 
-            self.root.after(60000, check_hydration)
-
-        self.root.after(60000, check_hydration)
+    def _check_hydration_reminder(self, now: datetime.datetime) -> None:
+        """Hydration reminder check, once a minute from _tick."""
+        if not self.config.get("hydration_tracking", False) or not self._nudges_allowed():
+            return
+        interval = self.config.get("hydration_reminder_interval", 30)
+        elapsed = (now - self.last_hydration_reminder).total_seconds() / 60
+        if elapsed >= interval:
+            self.last_hydration_reminder = now
+            self.root.after(0, self._show_hydration_popup)
 
     def _show_hydration_popup(self) -> None:
         """Show hydration reminder popup with counter."""
@@ -1420,7 +1749,7 @@ class ScreenBreakApp:
 
         def log_drink():
             log_hydration(self.stats)
-            save_stats(self.stats)
+            self._schedule_stats_save()
             try:
                 win.destroy()
             except tk.TclError:
@@ -1509,13 +1838,11 @@ class ScreenBreakApp:
         df = tk.Frame(win, bg=C_BG)
         df.pack(fill="x", padx=20)
         tk.Label(df, text="Duration:", font=(FONT, 10), fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
-        dur_spin = tk.Spinbox(df, from_=5, to=120, width=4, font=(MONO, 10),
-                              bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-                              relief="flat", justify="center")
+        dur_spin = tk.Spinbox(df, from_=5, to=120, width=4, **SPIN_KW)
         dur_spin.pack(side="left", padx=4)
         dur_spin.delete(0, "end")
         dur_spin.insert(0, str(self.config.get("focus_session_duration", 25)))
-        tk.Label(df, text="minutes", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
+        tk.Label(df, text="minutes", **LBL_MUT_KW).pack(side="left")
 
         # Buttons
         bf = tk.Frame(win, bg=C_BG)
@@ -1599,9 +1926,9 @@ class ScreenBreakApp:
                 self._focus_win = None
             if completed:
                 # Track and trigger break
-                self.stats["lifetime"]["focus_sessions"] = self.stats["lifetime"].get("focus_sessions", 0) + 1
-                self.stats["today"]["focus_sessions"] = self.stats["today"].get("focus_sessions", 0) + 1
-                save_stats(self.stats)
+                self.stats["lifetime"]["focus_sessions"] += 1
+                self.stats["today"]["focus_sessions"] += 1
+                self._schedule_stats_save()
                 # Show micro-pause as reward
                 self._show_micro()
 
@@ -1643,47 +1970,66 @@ class ScreenBreakApp:
         f.bind("<B1-Motion>", do_drag)
 
     def _start_idle_monitor(self) -> None:
-        """Start idle detection monitoring."""
-        def check_idle():
-            if not self.config.get("idle_detection", True):
-                self.idle = False
-                self.root.after(IDLE_CHECK_INTERVAL * 1000, check_idle)
-                return
+        """Start (or restart, after a settings change) idle detection monitoring."""
+        if self._idle_after_id:
+            try: self.root.after_cancel(self._idle_after_id)
+            except tk.TclError: pass
+        self._idle_poll_s = IDLE_CHECK_INTERVAL
+        self._idle_after_id = self.root.after(IDLE_CHECK_INTERVAL * 1000, self._check_idle)
+
+    def _check_idle(self) -> None:
+        """Sample idle time, adjust timers on return, and schedule the next check."""
+        self._idle_after_id = None
+        if not self.config.get("idle_detection", True):
+            # Opted out: only look again now and then. Saving settings that
+            # turn it back on restarts the monitor straight away.
+            self.idle = False
+            self._idle_after_id = self.root.after(IDLE_POLL_MAX * 1000, self._check_idle)
+            return
 
-            threshold = self.config.get("idle_threshold", DEFAULT_IDLE_THRESHOLD)
-            idle_secs = get_idle_seconds()
-
-            was_idle = self.idle
-            self.idle = idle_secs >= threshold
-
-            if self.idle and not was_idle:
-                # Just became idle - record when
-                self.idle_since = datetime.datetime.now()
-            elif not self.idle and was_idle and self.idle_since:
-                # Returned from idle - reset or adjust timers
-                # (skip if paused; pause resume handles it)
-                if not self.paused:
-                    now = datetime.datetime.now()
-                    idle_duration = now - self.idle_since
-                    total_idle_secs = threshold + idle_duration.total_seconds()
-
-                    # Idle >= threshold counts as eye rest - reset 20-min timer
-                    self.last_eye_rest = now
-
-                    # Idle >= 5 min counts as a full break - reset 45-min timer
-                    if total_idle_secs >= 300:
-                        self.last_micro = now
-                    else:
-                        self.last_micro += idle_duration
+        threshold = self.config.get("idle_threshold", DEFAULT_IDLE_THRESHOLD)
+        idle_secs = get_idle_seconds()
 
-                    self.last_any_break = now
-                    self.last_mini_reminder += idle_duration
-                    self.last_hydration_reminder += idle_duration
-                self.idle_since = None
+        was_idle = self.idle
+        self.idle = idle_secs >= threshold
+        if self.idle and was_idle:
+            # Still away: back off 5 → 10 → 20 → 40 → 60s. Noticing the
+            # return a little late only delays the timer reset below.
+            self._idle_poll_s = min(self._idle_poll_s * 2, IDLE_POLL_MAX)
+        else:
+            self._idle_poll_s = IDLE_CHECK_INTERVAL
+        if not self.idle:
+            # Can't go idle before threshold - idle_secs: sleep until then
+            delay = min(max(IDLE_CHECK_INTERVAL, threshold - idle_secs), IDLE_POLL_MAX)
+        else:
+            delay = self._idle_poll_s
+
+        if self.idle and not was_idle:
+            # Just became idle - record when
+            self.idle_since = datetime.datetime.now()
+        elif not self.idle and was_idle and self.idle_since:
+            # Returned from idle - reset or adjust timers
+            # (skip if paused; pause resume handles it)
+            if not self.paused:
+                now = datetime.datetime.now()
+                idle_duration = now - self.idle_since
+                total_idle_secs = threshold + idle_duration.total_seconds()
+
+                # Idle >= threshold counts as eye rest - reset 20-min timer
+                self.last_eye_rest = now
+
+                # Idle >= 5 min counts as a full break - reset 45-min timer
+                if total_idle_secs >= 300:
+                    self.last_micro = now
+                else:
+                    self.last_micro += idle_duration
 
-            self.root.after(IDLE_CHECK_INTERVAL * 1000, check_idle)
+                self.last_any_break = now
+                self.last_mini_reminder += idle_duration
+                self.last_hydration_reminder += idle_duration
+            self.idle_since = None
 
-        self.root.after(IDLE_CHECK_INTERVAL * 1000, check_idle)
+        self._idle_after_id = self.root.after(int(delay * 1000), self._check_idle)
 
     # ━━━ Properties ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     @property
@@ -1705,22 +2051,48 @@ class ScreenBreakApp:
     @staticmethod
     def _pt(s: str) -> datetime.time:
         """Parse time string (HH:MM) to datetime.time. Raises ValueError if invalid."""
-        h, m = str(s).strip().split(":")
-        return datetime.time(int(h), int(m))
+        return _parse_hhmm(str(s))
+
+    def _get_work_bounds(self) -> Optional[tuple[datetime.time, datetime.time]]:
+        """Parsed (work_start, work_end), or None if either is malformed.
+        Cached against the raw config strings, so edits are picked up without
+        explicit invalidation."""
+        raw = (self.config.get("work_start", "08:00"), self.config.get("work_end", "20:00"))
+        if self._work_hours_cache[0] != raw:
+            try:
+                bounds = (self._pt(raw[0]), self._pt(raw[1]))
+            except ValueError:
+                bounds = None
+            self._work_hours_cache = (raw, bounds)
+        return self._work_hours_cache[1]
+
+    def _get_sched_rows(self, now: datetime.datetime) -> list[tuple[str, str, int, datetime.datetime]]:
+        """Today's well-formed scheduled breaks as (key, title, duration, when)
+        rows, sorted by time. Rebuilt only when the date or the configured
+        break list changes."""
+        breaks = self.config.get("breaks", ())
+        sig = tuple((b.get("time"), b.get("duration"), b.get("title")) if isinstance(b, dict) else None
+                    for b in breaks)
+        today = now.date()
+        date, cached_sig, rows = self._sched_cache
+        if date != today or cached_sig != sig:
+            rows = []
+            for brk in breaks:
+                if not isinstance(brk, dict) or "time" not in brk or "duration" not in brk or "title" not in brk:
+                    continue
+                try:
+                    when = datetime.datetime.combine(today, self._pt(brk["time"]))
+                except (ValueError, AttributeError, TypeError):
+                    continue
+                rows.append((brk["time"], brk["title"], brk["duration"], when))
+            rows.sort(key=itemgetter(3))
+            self._sched_cache = (today, sig, rows)
+        return rows
 
     @staticmethod
     def _fmt12(s: str) -> str:
         """Convert HH:MM string to 12-hour format (e.g., '14:30' -> '2:30 PM')."""
-        try:
-            h, m = s.strip().split(":")
-            h, m = int(h), int(m)
-            suffix = "AM" if h < 12 else "PM"
-            h12 = h % 12
-            if h12 == 0:
-                h12 = 12
-            return f"{h12}:{m:02d} {suffix}"
-        except (ValueError, AttributeError):
-            return s
+        return _fmt12_hhmm(s) if isinstance(s, str) else s
 
     # ━━━ Scheduling ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     def _tick(self):
@@ -1729,13 +2101,14 @@ class ScreenBreakApp:
             self.fullscreen_active = is_fullscreen_app_active()
         else:
             self.fullscreen_active = False
+        now = datetime.datetime.now()
 
         # Deo mode (Priority 0): must keep enforcing even while paused, idle, a
         # fullscreen app is focused, or an ordinary break is mid-flight — those are
         # exactly the states a child would use to dodge a lockout — so this runs
         # unconditionally, ahead of the gate below that guards ordinary breaks.
         if self.config.get("deo_mode_enabled", False):
-            self._deo_tick(datetime.datetime.now())
+            self._deo_tick(now)
 
         # Safety valve: if warning_up is stuck but window is gone, clear it
         if self.warning_up and not self.warning_window:
@@ -1756,7 +2129,14 @@ class ScreenBreakApp:
         if (not self.paused and not self.overlay_up and not self.warning_up
                 and not self.idle and not self._deo_locked):
             if not (self.config.get("focus_mode", True) and self.fullscreen_active):
-                self._check()
+                self._check(now)
+
+        # Mini and hydration reminders ride this loop once a minute rather
+        # than keeping their own after() chains
+        self._tick_count += 1
+        if self._tick_count % (60 // TICK) == 0:
+            self._check_mini_reminder(now)
+            self._check_hydration_reminder(now)
         self.root.after(TICK * 1000, self._tick)
 
     # ━━━ Deo mode (enforced screen-time limits) ━━━━━━━━━━━━━━━
@@ -1764,7 +2144,7 @@ class ScreenBreakApp:
         """Priority-0 evaluation for Deo mode. Called every tick from _tick(),
         unconditionally — see the comment there for why."""
         update_stats_for_today(self.stats)  # cheap + idempotent; rolls deo usage at midnight
-        deo = self.stats.setdefault("deo", json.loads(json.dumps(DEFAULT_STATS["deo"])))
+        deo = self.stats.setdefault("deo", deepcopy(DEFAULT_STATS["deo"]))
 
         decision = deo_decide(now, self.config, deo)
         if decision.state != DeoState.LOCK and not self.idle:
@@ -1772,7 +2152,7 @@ class ScreenBreakApp:
             self._deo_unsaved_ticks += 1
             if self._deo_unsaved_ticks >= max(1, 60 // TICK):
                 self._deo_unsaved_ticks = 0
-                save_stats(self.stats)
+                self._flush_stats()
             # Re-decide: if this tick's usage just exhausted the budget, lock
             # immediately rather than waiting for the next tick.
             decision = deo_decide(now, self.config, deo)
@@ -1837,8 +2217,8 @@ class ScreenBreakApp:
             except tk.TclError:
                 pass
             ov.protocol("WM_DELETE_WINDOW", lambda: None)
-            ov.bind("<Escape>", lambda e: None)
-            ov.bind("<Alt-F4>", lambda e: None)
+            ov.bind("<Escape>", self._on_escape_noop)
+            ov.bind("<Alt-F4>", self._on_escape_noop)
             overlays.append(ov)
         self._deo_overlays = overlays
 
@@ -2296,14 +2676,14 @@ class ScreenBreakApp:
         """Parent-authorized unlock: grant a grace window and clear the
         lockout. Works no matter *why* it locked (time window or budget) —
         override_until bypasses both in deo_decide."""
-        deo = self.stats.setdefault("deo", json.loads(json.dumps(DEFAULT_STATS["deo"])))
+        deo = self.stats.setdefault("deo", deepcopy(DEFAULT_STATS["deo"]))
         grace_min = self.config.get("deo_grace_minutes", 10)
         if not isinstance(grace_min, (int, float)) or grace_min <= 0:
             grace_min = 10
         until = datetime.datetime.now() + datetime.timedelta(minutes=grace_min)
         deo["override_until"] = until.isoformat()
         deo["unlocks"] = deo.get("unlocks", 0) + 1
-        save_stats(self.stats)
+        self._flush_stats()
         self._deo_locked = False
         self._deo_close_lockout()
 
@@ -2540,21 +2920,16 @@ class ScreenBreakApp:
         except Exception:
             pass
 
-    def _check(self) -> None:
-        now = datetime.datetime.now()
-        t = now.time()
+    def _check(self, now: datetime.datetime) -> None:
+        t = now.time();  today = now.date()
 
-        if now.date() != self.today:
-            self.today = now.date()
+        if today != self.today:
+            self.today = today
             self.acked_today.clear()
             update_stats_for_today(self.stats)
-            save_stats(self.stats)
+            self._schedule_stats_save()
 
-        try:
-            ws = self._pt(self.config.get("work_start", "08:00"))
-            we = self._pt(self.config.get("work_end",   "20:00"))
-        except ValueError:
-            ws, we = datetime.time(8), datetime.time(20)
+        ws, we = self._get_work_bounds() or (datetime.time(8), datetime.time(20))
         if t < ws or t >= we:
             return
 
@@ -2583,39 +2958,32 @@ class ScreenBreakApp:
         warn_s = self.config.get("warning_seconds", 60)
 
         # ── Helper: check if scheduled break is within N minutes ──
+        # Rows are sorted by time: bisect to the window that matters and stop
+        # at the first unacked break past it instead of scanning the whole day
+        sched = self._get_sched_rows(now);  acked = self.acked_today
+        by_time = itemgetter(3)
+        upcoming = sched[bisect_right(sched, now, key=by_time):]
+
         def sched_within(minutes: float) -> bool:
-            for brk in self.config.get("breaks", []):
-                if self.acked_today.get(brk["time"]) == now.date():
-                    continue
-                try:
-                    bt = datetime.datetime.combine(now.date(), self._pt(brk["time"]))
-                    diff = (bt - now).total_seconds() / 60
-                    if 0 < diff <= minutes:
-                        return True
-                except ValueError:
-                    continue
+            for key, _title, _dur, bt in upcoming:
+                if acked.get(key) != today:
+                    return (bt - now).total_seconds() / 60 <= minutes
             return False
 
         # ── Priority 1: Scheduled breaks ──
-        for brk in self.config.get("breaks", []):
-            if not isinstance(brk, dict) or "time" not in brk or "duration" not in brk or "title" not in brk:
-                continue
-            key = brk["time"]
-            if self.acked_today.get(key) == now.date():
-                continue
-            try:
-                bt = datetime.datetime.combine(now.date(), self._pt(brk["time"]))
-            except ValueError:
+        catchup = now - datetime.timedelta(seconds=CATCHUP_WINDOW_SECONDS)
+        for key, title, dur, bt in sched[bisect_left(sched, catchup, key=by_time):]:
+            if acked.get(key) == today:
                 continue
             diff = (bt - now).total_seconds()
+            if diff > warn_s:
+                break  # this and every later break is still beyond the warning
 
             if 0 < diff <= warn_s:
-                self._begin_warning(self._show_long_break,
-                    (brk["title"], brk["duration"], key), max(5, int(diff)))
+                self._begin_warning(self._show_long_break, (title, dur, key), max(5, int(diff)))
                 return
             if -CATCHUP_WINDOW_SECONDS <= diff <= 0:
-                self._begin_warning(self._show_long_break,
-                    (brk["title"], brk["duration"], key), 5)
+                self._begin_warning(self._show_long_break, (title, dur, key), 5)
                 return
 
         # ── Priority 2: Micro-pause (skip if scheduled break within coast margin) ──
@@ -2687,34 +3055,43 @@ class ScreenBreakApp:
         self._anim_warning(c, cx, cy, r)
 
     def _draw_clock(self, c, cx, cy, r, rem, tot):
-        c.delete("all")
-        gr = r + 10
-        c.create_oval(cx-gr, cy-gr, cx+gr, cy+gr, fill="", outline=C_W_GL, width=2)
-        c.create_oval(cx-r, cy-r, cx+r, cy+r, fill=C_CARD, outline=C_W_GL, width=3)
-        if tot > 0:
+        """Stopwatch face for the warning icon. The items are created on the
+        first call for a canvas; later ticks only move the elapsed arc."""
+        arc = getattr(c, "_clock_arc", None)
+        if arc is None:
+            gr = r + 10
+            c.create_oval(cx-gr, cy-gr, cx+gr, cy+gr, fill="", outline=C_W_GL, width=2)
+            c.create_oval(cx-r, cy-r, cx+r, cy+r, fill=C_CARD, outline=C_W_GL, width=3)
+            arc = 0
+            if tot > 0:
+                # stipple="gray50" is ignored on macOS Aqua; blend color manually
+                _arc_fill = C_W_GL
+                if IS_MAC:
+                    # Approximate 50% stipple by blending fill with card bg
+                    try:
+                        r1 = int(C_W_GL[1:3], 16); g1 = int(C_W_GL[3:5], 16); b1 = int(C_W_GL[5:7], 16)
+                        r2 = int(C_CARD[1:3], 16); g2 = int(C_CARD[3:5], 16); b2 = int(C_CARD[5:7], 16)
+                        _arc_fill = f"#{(r1+r2)//2:02x}{(g1+g2)//2:02x}{(b1+b2)//2:02x}"
+                    except (ValueError, IndexError):
+                        pass
+                    arc = c.create_arc(cx-r+8, cy-r+8, cx+r-8, cy+r-8,
+                                       start=90, extent=0, fill=_arc_fill, outline="")
+                else:
+                    arc = c.create_arc(cx-r+8, cy-r+8, cx+r-8, cy+r-8,
+                                       start=90, extent=0, fill=_arc_fill, outline="", stipple="gray50")
+            c.create_line(cx, cy, cx, cy-r+14, fill=C_TEXT, width=3)
+            hx = cx + int((r-18)*math.sin(math.radians(60)))
+            hy = cy - int((r-18)*math.cos(math.radians(60)))
+            c.create_line(cx, cy, hx, hy, fill=C_TEXT, width=3)
+            c.create_oval(cx-3, cy-3, cx+3, cy+3, fill=C_TEXT, outline="")
+            c._clock_arc = arc
+        if arc:
             # Stopwatch style: fill clockwise as time elapses (not counter-clockwise drain)
             elapsed = tot - rem
-            ext = (elapsed / tot) * 360
-            # stipple="gray50" is ignored on macOS Aqua; blend color manually
-            _arc_fill = C_W_GL
-            if IS_MAC:
-                # Approximate 50% stipple by blending fill with card bg
-                try:
-                    r1 = int(C_W_GL[1:3], 16); g1 = int(C_W_GL[3:5], 16); b1 = int(C_W_GL[5:7], 16)
-                    r2 = int(C_CARD[1:3], 16); g2 = int(C_CARD[3:5], 16); b2 = int(C_CARD[5:7], 16)
-                    _arc_fill = f"#{(r1+r2)//2:02x}{(g1+g2)//2:02x}{(b1+b2)//2:02x}"
-                except (ValueError, IndexError):
-                    pass
-                c.create_arc(cx-r+8, cy-r+8, cx+r-8, cy+r-8,
-                             start=90, extent=-ext, fill=_arc_fill, outline="")
-            else:
-                c.create_arc(cx-r+8, cy-r+8, cx+r-8, cy+r-8,
-                             start=90, extent=-ext, fill=_arc_fill, outline="", stipple="gray50")
-        c.create_line(cx, cy, cx, cy-r+14, fill=C_TEXT, width=3)
-        hx = cx + int((r-18)*math.sin(math.radians(60)))
-        hy = cy - int((r-18)*math.cos(math.radians(60)))
-        c.create_line(cx, cy, hx, hy, fill=C_TEXT, width=3)
-        c.create_oval(cx-3, cy-3, cx+3, cy+3, fill=C_TEXT, outline="")
+            c.itemconfigure(arc, extent=-(elapsed / tot) * 360)
+
+    # The icon's 4-second alpha pulse, one entry per tick: 0.82 + 0.13 * sin(2π·i/4)
+    _WARN_PULSE = tuple(round(0.82 + 0.13 * math.sin(i / 4 * 2 * math.pi), 2) for i in range(4))
 
     def _anim_warning(self, c: tk.Canvas, cx: int, cy: int, r: int) -> None:
         if not self.warning_up or not self.warning_window:
@@ -2722,35 +3099,36 @@ class ScreenBreakApp:
         if self._warn_rem <= 0:
             self._fire_pending();  return
         self._draw_clock(c, cx, cy, r, self._warn_rem, self._warn_total)
-        phase = (self._warn_total - self._warn_rem) % 4 / 4.0
-        alpha = 0.82 + 0.13 * math.sin(phase * 2 * math.pi)
+        alpha = self._WARN_PULSE[(self._warn_total - self._warn_rem) % 4]
         try:
             self.warning_window.attributes("-alpha", alpha)
         except tk.TclError:
             pass
         self._warn_rem -= 1
-        self._warn_anim_id = self.root.after(1000, lambda: self._anim_warning(c, cx, cy, r))
+        self._warn_anim_id = self.root.after(1000, self._anim_warning, c, cx, cy, r)
 
-    def _dismiss_warning(self) -> None:
+    def _teardown_warning(self) -> None:
+        """Stop the warning pulse and destroy the icon and its tooltip."""
         if self._warn_anim_id:
             try:
                 self.root.after_cancel(self._warn_anim_id)
-            except tk.TclError:
+            except (tk.TclError, ValueError):
                 pass
             self._warn_anim_id = None
-        if self._tip:
-            try:
-                self._tip.destroy()
-            except tk.TclError:
-                pass
-            self._tip = None
-        if self.warning_window:
-            try:
-                self.warning_window.destroy()
-            except tk.TclError:
-                pass
-            self.warning_window = None
-        self.root.after(100, self._fire_pending_safe)
+        for w in (self._tip, self.warning_window):
+            if w:
+                try:
+                    w.destroy()
+                except tk.TclError:
+                    pass
+        self._tip = None
+        self.warning_window = None
+
+    def _dismiss_warning(self) -> None:
+        self._teardown_warning()
+        # Fire as soon as the warning's teardown has been processed, not after
+        # a fixed wait
+        self.root.after_idle(self._fire_pending_safe)
 
     def _fire_pending_safe(self) -> None:
         if self.pending_break and self.warning_up:
@@ -2758,24 +3136,7 @@ class ScreenBreakApp:
 
     def _fire_pending(self) -> None:
         self.warning_up = False
-        if self._warn_anim_id:
-            try:
-                self.root.after_cancel(self._warn_anim_id)
-            except (tk.TclError, ValueError):
-                pass
-            self._warn_anim_id = None
-        if self._tip:
-            try:
-                self._tip.destroy()
-            except tk.TclError:
-                pass
-            self._tip = None
-        if self.warning_window:
-            try:
-                self.warning_window.destroy()
-            except tk.TclError:
-                pass
-            self.warning_window = None
+        self._teardown_warning()
         if self.pending_break:
             cb, args = self.pending_break;  self.pending_break = None
             cb(*args)
@@ -2837,16 +3198,9 @@ class ScreenBreakApp:
         m, s = divmod(max(0, sec), 60)
         return f"{m}:{s:02d}"
 
+    @_tk_alive("_mini_ind")
     def _mini_countdown_tick(self) -> None:
         """Tick the minimized-break countdown indicator."""
-        if not self._mini_ind:
-            return
-        try:
-            if not self._mini_ind.winfo_exists():
-                return
-        except tk.TclError:
-            return
-
         if self._mini_rem > 0:
             self._mini_rem -= 1
             self._mini_cd_var.set(self._fmt_mm_ss(self._mini_rem))
@@ -2934,6 +3288,14 @@ class ScreenBreakApp:
     def _dismiss(self, ov: tk.Toplevel) -> None:
         self.overlay_up = False
         self.current_overlay = None
+        self._break_skip = None
+        # Drop the overlay's queued countdown step and fade frames; after()
+        # callbacks outlive the window, so they'd otherwise still wake us
+        for aid in (self._cd_after_id, *self._fade_after_ids):
+            if aid:
+                try: self.root.after_cancel(aid)
+                except tk.TclError: pass
+        self._cd_after_id = None;  self._fade_after_ids = []
         # Also clean up any minimized-break state
         for w in (getattr(self, "_mini_ind", None),
                   getattr(self, "_mini_done_notif", None)):
@@ -2950,6 +3312,16 @@ class ScreenBreakApp:
         except tk.TclError:
             pass
 
+    # Escape handlers are bound methods rather than per-overlay lambdas; the
+    # skip action of the overlay currently up is held in self._break_skip.
+    def _on_escape_skip(self, _event=None) -> str:
+        if self._break_skip:
+            self._break_skip()
+        return "break"
+
+    def _on_escape_noop(self, _event=None) -> str:
+        return "break"
+
     def _snooze(self, ov: tk.Toplevel) -> None:
         sm = self.config.get("snooze_minutes", 5)
         self.snooze_until = datetime.datetime.now() + datetime.timedelta(minutes=sm)
@@ -3014,21 +3386,11 @@ class ScreenBreakApp:
         cf = tk.Frame(ov, bg=C_EYE_BG)
         cf.place(relx=0.5, rely=0.5, anchor="center")
 
-        # Fade in animation
+        # Fade in animation: the whole ramp is queued up front (0 → 0.88 in
+        # 0.08 steps every 40 ms, then 0.92) rather than each step queuing the next
         if use_dim:
-            def fade_in(alpha=0.0):
-                if alpha < 0.92:
-                    try:
-                        ov.attributes("-alpha", alpha)
-                        ov.after(30, lambda: fade_in(alpha + 0.05))
-                    except tk.TclError:
-                        pass
-                else:
-                    try:
-                        ov.attributes("-alpha", 0.92)
-                    except tk.TclError:
-                        pass
-            ov.after(50, lambda: fade_in(0.0))
+            self._fade_after_ids = [ov.after(50 + 40 * i, self._set_overlay_alpha, ov, a)
+                                    for i, a in enumerate(self._FADE_STEPS)]
 
         tk.Label(cf, text="🌿", font=(FONT, 56), fg=C_EYE_ACC, bg=C_EYE_BG).pack(pady=(0, 16))
 
@@ -3086,6 +3448,17 @@ class ScreenBreakApp:
         ov.bind("<Escape>", on_escape)
         ov.focus_force()
 
+    _FADE_STEPS = tuple(i * 0.08 for i in range(12)) + (0.92,)
+
+    def _set_overlay_alpha(self, ov: tk.Toplevel, alpha: float) -> None:
+        """One fade step; a no-op once the overlay has been dismissed."""
+        if self.current_overlay is not ov:
+            return
+        try:
+            ov.attributes("-alpha", alpha)
+        except tk.TclError:
+            pass
+
     def _eye_countdown(self, ov, rem):
         if self.current_overlay != ov:
             return
@@ -3095,7 +3468,7 @@ class ScreenBreakApp:
             self._eye_close_btn.pack()
             return
         self._eye_cd_var.set(str(rem))
-        ov.after(1000, lambda: self._eye_countdown(ov, rem - 1))
+        self._cd_after_id = ov.after(1000, self._eye_countdown, ov, rem - 1)
 
     def _close_eye_rest(self, ov, completed: bool = False):
         # Stop eye exercise animation if running
@@ -3116,11 +3489,11 @@ class ScreenBreakApp:
         self.last_any_break = now
         # Track statistics
         if completed:
-            self.stats["lifetime"]["eye_rest_taken"] = self.stats["lifetime"].get("eye_rest_taken", 0) + 1
-            self.stats["today"]["eye_rest_taken"] = self.stats["today"].get("eye_rest_taken", 0) + 1
+            self.stats["lifetime"]["eye_rest_taken"] += 1
+            self.stats["today"]["eye_rest_taken"] += 1
         else:
-            self.stats["lifetime"]["eye_rest_skipped"] = self.stats["lifetime"].get("eye_rest_skipped", 0) + 1
-        save_stats(self.stats)
+            self.stats["lifetime"]["eye_rest_skipped"] += 1
+        self._schedule_stats_save()
         self._dismiss(ov)
 
     # ── Micro-pause ───────────────────────────────────────────
@@ -3232,9 +3605,9 @@ class ScreenBreakApp:
             if self._desk_exercise:
                 self._desk_exercise.stop()
             # Track statistics
-            self.stats["lifetime"]["micro_taken"] = self.stats["lifetime"].get("micro_taken", 0) + 1
-            self.stats["today"]["micro_taken"] = self.stats["today"].get("micro_taken", 0) + 1
-            save_stats(self.stats)
+            self.stats["lifetime"]["micro_taken"] += 1
+            self.stats["today"]["micro_taken"] += 1
+            self._schedule_stats_save()
             self._reset_all_timers()
             self._dismiss(ov)
 
@@ -3244,8 +3617,8 @@ class ScreenBreakApp:
                 self._breathing_exercise.stop()
             if self._desk_exercise:
                 self._desk_exercise.stop()
-            self.stats["lifetime"]["micro_skipped"] = self.stats["lifetime"].get("micro_skipped", 0) + 1
-            save_stats(self.stats)
+            self.stats["lifetime"]["micro_skipped"] += 1
+            self._schedule_stats_save()
             self._reset_all_timers()
             self._dismiss(ov)
 
@@ -3275,11 +3648,12 @@ class ScreenBreakApp:
         # Start the 5-minute countdown
         self._micro_countdown(ov, 5 * 60)
 
-        # Escape = back from break (unless strict mode)
+        # Escape = skip break (unless strict mode)
         if self.config.get("strict_mode", False):
-            ov.bind("<Escape>", lambda e: None)  # Disable escape in strict mode
+            ov.bind("<Escape>", self._on_escape_noop)  # Disable escape in strict mode
         else:
-            ov.bind("<Escape>", lambda e: skip_break())
+            self._break_skip = skip_break
+            ov.bind("<Escape>", self._on_escape_skip)
         ov.focus_force()
 
     def _micro_countdown(self, ov, rem):
@@ -3291,7 +3665,7 @@ class ScreenBreakApp:
         m, s = divmod(rem, 60)
         self._micro_cd_var.set(f"{m}:{s:02d}")
         if rem > 0:
-            ov.after(1000, lambda: self._micro_countdown(ov, rem - 1))
+            self._cd_after_id = ov.after(1000, self._micro_countdown, ov, rem - 1)
 
     # ── Long / scheduled break ────────────────────────────────
     def _show_long_break(self, title: str, duration: int, break_key: str) -> None:
@@ -3349,16 +3723,16 @@ class ScreenBreakApp:
             self._grab_note(note)
             self.acked_today[break_key] = datetime.date.today()
             # Track statistics
-            self.stats["lifetime"]["scheduled_taken"] = self.stats["lifetime"].get("scheduled_taken", 0) + 1
-            self.stats["today"]["scheduled_taken"] = self.stats["today"].get("scheduled_taken", 0) + 1
-            save_stats(self.stats)
+            self.stats["lifetime"]["scheduled_taken"] += 1
+            self.stats["today"]["scheduled_taken"] += 1
+            self._schedule_stats_save()
             self._reset_all_timers()
             self._dismiss(ov)
 
         def skip_break():
             self.acked_today[break_key] = datetime.date.today()
-            self.stats["lifetime"]["scheduled_skipped"] = self.stats["lifetime"].get("scheduled_skipped", 0) + 1
-            save_stats(self.stats)
+            self.stats["lifetime"]["scheduled_skipped"] += 1
+            self._schedule_stats_save()
             self._reset_all_timers()
             self._dismiss(ov)
 
@@ -3383,9 +3757,10 @@ class ScreenBreakApp:
 
         # Escape = skip break (unless strict mode)
         if self.config.get("strict_mode", False):
-            ov.bind("<Escape>", lambda e: None)  # Disable escape in strict mode
+            ov.bind("<Escape>", self._on_escape_noop)  # Disable escape in strict mode
         else:
-            ov.bind("<Escape>", lambda e: skip_break())
+            self._break_skip = skip_break
+            ov.bind("<Escape>", self._on_escape_skip)
         ov.focus_force()
 
     def _long_countdown(self, ov, rem):
@@ -3396,42 +3771,114 @@ class ScreenBreakApp:
         self._break_rem = rem
         self._long_cd_var.set(self._fmt_mm_ss(rem))
         if rem > 0:
-            ov.after(1000, lambda: self._long_countdown(ov, rem - 1))
+            self._cd_after_id = ov.after(1000, self._long_countdown, ov, rem - 1)
 
     # ━━━ Notes ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
     def _grab_note(self, w: tk.Text) -> None:
+        try:
+            if w.compare("end-1c", "==", "1.0"):
+                return  # untouched box (the usual case): don't fetch the contents
+        except tk.TclError:
+            return
         text = w.get("1.0", "end").strip()
         if not text:
             return
-        self.notes.append({"time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"), "note": text})
+        entry = {"time": datetime.datetime.now().strftime("%Y-%m-%d %H:%M"), "note": text}
+        self.notes.append(entry)
+        if len(self.notes) > NOTES_TAIL:
+            del self.notes[:-NOTES_TAIL]
+        # Called mid-transition (break dismiss); the write waits until Tk is
+        # idle, i.e. after the overlay teardown has been painted.
+        self._notes_pending.append(entry)
+        if len(self._notes_pending) == 1:
+            self.root.after_idle(self._flush_notes)
+
+    def _flush_notes(self) -> None:
+        if not self._notes_pending:
+            return
+        pending, self._notes_pending = self._notes_pending, []
+        # JSON-Lines: one note per line, so saving is an append, not a rewrite
         try:
-            with open(NOTES_FILE, "w", encoding="utf-8") as f:
-                json.dump(self.notes, f, indent=2)
+            with open(NOTES_FILE, "a", encoding="utf-8") as f:
+                f.writelines(json.dumps(e) + "\n" for e in pending)
         except (IOError, OSError) as e:
             print(f"  [!] Notes save error: {e}")
 
-    def _load_notes(self) -> list[dict[str, str]]:
-        if os.path.exists(NOTES_FILE):
+    def _load_notes(self, limit: Optional[int] = NOTES_TAIL) -> list[dict[str, str]]:
+        """Most recent `limit` notes (all of them if None). The file is read
+        backwards from the end until `limit` lines are in hand; a legacy
+        JSON-list file is migrated to JSON-Lines, or moved aside to .bak if
+        it can't be read."""
+        if not os.path.exists(NOTES_FILE):
+            return []
+        # Binary lines: json.loads takes UTF-8 bytes directly, so there is no
+        # text-decoder pass over the whole file.
+        try:
+            with open(NOTES_FILE, "rb") as f:
+                legacy = f.read(64).lstrip()[:1] == b"["
+                f.seek(0)
+                if legacy:
+                    data = f.read()
+                else:
+                    lines = _tail_lines(f, limit) if limit else f.read().splitlines()
+        except (IOError, OSError):
+            return []
+        if legacy:
             try:
-                with open(NOTES_FILE, encoding="utf-8") as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        return data
-            except (json.JSONDecodeError, IOError, OSError):
-                pass
-        return []
+                loaded = json.loads(data)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                loaded = None
+            if not isinstance(loaded, list):
+                # Appending JSON-Lines after a broken list would leave the file
+                # unparseable for good: keep the old one aside, start afresh.
+                try:
+                    os.replace(NOTES_FILE, NOTES_FILE + ".bak")
+                    print(f"  [!] Unreadable notes file moved to {NOTES_FILE}.bak")
+                except OSError as e:
+                    print(f"  [!] Notes load error: {e}")
+                return []
+            notes = [e for e in loaded if isinstance(e, dict)]
+            self._rewrite_notes(notes)
+            return notes[-limit:] if limit else notes
+        notes = []
+        for line in lines:
+            try:
+                e = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue  # skip a torn trailing line rather than lose the file
+            if isinstance(e, dict):
+                notes.append(e)
+        return notes
+
+    def _rewrite_notes(self, notes: list[dict[str, str]]) -> None:
+        """Replace the notes file via a temp file and os.replace (as in
+        _write_json), so a failed rewrite leaves the old history intact."""
+        tmp = NOTES_FILE + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(e) + "\n" for e in notes)
+                f.flush();  os.fsync(f.fileno())
+            os.replace(tmp, NOTES_FILE)
+        except (IOError, OSError) as e:
+            try: os.remove(tmp)
+            except OSError: pass
+            print(f"  [!] Notes save error: {e}")
 
     def _show_notes_win(self) -> None:
         if self._notes_win:
             try: self._notes_win.lift();  self._notes_win.focus_force();  return
             except tk.TclError: self._notes_win = None
+        if self._reuse_window(self._notes_win_cache):
+            self._notes_win = self._notes_win_cache
+            self._refresh_notes_win()
+            return
 
         win = tk.Toplevel(self.root)
         win.title("Screen Break — Notes")
         win.geometry("580x450")
         win.configure(bg=C_BG)
-        self._notes_win = win
+        self._notes_win = win;  self._notes_win_cache = win
 
         tk.Label(win, text="Saved Notes", font=(FONT, 15, "bold"),
                  fg=C_ACCENT2, bg=C_BG).pack(pady=(14, 8))
@@ -3444,13 +3891,8 @@ class ScreenBreakApp:
                       relief="flat", padx=12, pady=10, wrap="word", yscrollcommand=sb.set)
         txt.pack(fill="both", expand=True)
         sb.config(command=txt.yview)
-
-        if not self.notes:
-            txt.insert("end", "No notes yet.\n\nNotes captured during break prompts appear here.")
-        else:
-            for e in reversed(self.notes):
-                txt.insert("end", f"── {e.get('time', 'Unknown')} ──\n{e.get('note', '')}\n\n")
-        txt.configure(state="disabled")
+        self._notes_txt = txt
+        self._refresh_notes_win()
 
         bf = tk.Frame(win, bg=C_BG)
         bf.pack(pady=(0, 12))
@@ -3458,52 +3900,27 @@ class ScreenBreakApp:
         def clear_notes() -> None:
             if not self.notes:
                 return
-            # Show confirmation dialog
-            confirm = tk.Toplevel(win)
-            confirm.title("Confirm Clear")
-            confirm.configure(bg=C_CARD)
-            confirm.geometry("300x120")
-            confirm.transient(win)
-            confirm.grab_set()
-            confirm.protocol("WM_DELETE_WINDOW", confirm.destroy)
-            # Center on parent
-            confirm.geometry(f"+{win.winfo_x() + 140}+{win.winfo_y() + 150}")
-
-            tk.Label(confirm, text=f"Delete all {len(self.notes)} notes?",
-                     font=(FONT, 11, "bold"), fg=C_TEXT, bg=C_CARD).pack(pady=(16, 8))
-            tk.Label(confirm, text="This cannot be undone.",
-                     font=(FONT, 9), fg=C_TEXT_DIM, bg=C_CARD).pack(pady=(0, 12))
-
-            btn_frame = tk.Frame(confirm, bg=C_CARD)
-            btn_frame.pack()
 
             def do_clear():
-                self.notes.clear()
-                try:
-                    with open(NOTES_FILE, "w", encoding="utf-8") as f:
-                        json.dump([], f)
-                except (IOError, OSError):
-                    pass
+                self.notes.clear();  self._notes_pending.clear()
+                self._rewrite_notes([])
                 txt.configure(state="normal")
                 txt.delete("1.0", "end")
                 txt.insert("end", "Notes cleared.")
                 txt.configure(state="disabled")
-                confirm.destroy()
 
-            tk.Button(btn_frame, text="Delete All", font=(FONT, 9), bg=C_ACCENT, fg=C_TEXT,
-                      relief="flat", padx=12, pady=4, cursor="hand2", command=do_clear).pack(side="left", padx=4)
-            tk.Button(btn_frame, text="Cancel", font=(FONT, 9), bg=C_BTN_SEC, fg=C_TEXT,
-                      relief="flat", padx=12, pady=4, cursor="hand2", command=confirm.destroy).pack(side="left", padx=4)
+            self._ask_confirm(win, "Confirm Clear", "Delete all saved notes?", "Delete All", do_clear)
 
         def export_notes() -> None:
             if not self.notes:
                 return
             export_path = os.path.join(os.path.expanduser("~"), "screen_break_notes.md")
             try:
+                self._flush_notes()
+                body = "".join(f"## {e.get('time', 'Unknown')}\n\n{e.get('note', '')}\n\n---\n\n"
+                               for e in self._load_notes(None))
                 with open(export_path, "w", encoding="utf-8") as f:
-                    f.write("# Screen Break Notes\n\n")
-                    for e in self.notes:
-                        f.write(f"## {e.get('time', 'Unknown')}\n\n{e.get('note', '')}\n\n---\n\n")
+                    f.write("# Screen Break Notes\n\n" + body)
                 # Show brief confirmation
                 txt.configure(state="normal")
                 txt.insert("1.0", f"✓ Exported to {export_path}\n\n")
@@ -3513,18 +3930,93 @@ class ScreenBreakApp:
                 txt.insert("1.0", f"⚠ Export failed: {err}\n\n")
                 txt.configure(state="disabled")
 
-        def on_close():
-            self._notes_win = None
-            win.destroy()
-
         tk.Button(bf, text="Export .md", font=(FONT, 9), bg=C_BTN_SEC, fg=C_TEXT_DIM,
                   relief="flat", padx=12, pady=4, cursor="hand2", command=export_notes).pack(side="left", padx=4)
         tk.Button(bf, text="Clear All", font=(FONT, 9), bg=C_BTN_SEC, fg=C_TEXT_DIM,
                   relief="flat", padx=12, pady=4, cursor="hand2", command=clear_notes).pack(side="left", padx=4)
         tk.Button(bf, text="Close", font=(FONT, 10), bg=C_BTN_SEC, fg=C_TEXT,
-                  relief="flat", padx=16, pady=4, cursor="hand2", command=on_close).pack(side="left", padx=4)
+                  relief="flat", padx=16, pady=4, cursor="hand2", command=self._close_notes_win).pack(side="left", padx=4)
 
-        win.protocol("WM_DELETE_WINDOW", on_close)
+        win.protocol("WM_DELETE_WINDOW", self._close_notes_win)
+
+    def _refresh_notes_win(self) -> None:
+        txt = self._notes_txt
+        txt.configure(state="normal")
+        txt.delete("1.0", "end")
+        if not self.notes:
+            txt.insert("end", "No notes yet.\n\nNotes captured during break prompts appear here.")
+        else:
+            # One insert for the whole list: one Tcl call and one relayout
+            txt.insert("end", "".join(f"── {e.get('time', 'Unknown')} ──\n{e.get('note', '')}\n\n"
+                                      for e in reversed(self.notes)))
+        txt.configure(state="disabled")
+
+    def _close_notes_win(self) -> None:
+        if self._notes_win:
+            try: self._notes_win.withdraw()
+            except tk.TclError: self._notes_win_cache = None
+            self._notes_win = None
+
+    def _ask_confirm(self, parent: tk.Toplevel, title: str, msg: str, yes_text: str,
+                     on_yes: Callable[[], None]) -> None:
+        """Modal yes/cancel prompt over `parent`. A single dialog is built on
+        first use, then only retargeted and re-shown."""
+        win = self._confirm_win
+        try:
+            alive = win is not None and win.winfo_exists()
+        except tk.TclError:
+            alive = False
+        if not alive:
+            win = tk.Toplevel(self.root)
+            win.withdraw()
+            win.configure(bg=C_CARD)
+            win.resizable(False, False)
+            self._confirm_msg = tk.StringVar()
+            tk.Label(win, textvariable=self._confirm_msg,
+                     font=(FONT, 11, "bold"), fg=C_TEXT, bg=C_CARD).pack(pady=(16, 8))
+            tk.Label(win, text="This cannot be undone.",
+                     font=(FONT, 9), fg=C_TEXT_DIM, bg=C_CARD).pack(pady=(0, 12))
+            btn_frame = tk.Frame(win, bg=C_CARD)
+            btn_frame.pack()
+            self._confirm_yes = tk.Button(btn_frame, font=(FONT, 9), bg=C_ACCENT, fg=C_TEXT,
+                      relief="flat", padx=12, pady=4, cursor="hand2")
+            self._confirm_yes.pack(side="left", padx=4)
+            tk.Button(btn_frame, text="Cancel", font=(FONT, 9), bg=C_BTN_SEC, fg=C_TEXT,
+                      relief="flat", padx=12, pady=4, cursor="hand2", command=self._close_confirm).pack(side="left", padx=4)
+            win.protocol("WM_DELETE_WINDOW", self._close_confirm)
+            self._confirm_win = win
+
+        def yes():
+            self._close_confirm()
+            on_yes()
+
+        win.title(title)
+        self._confirm_msg.set(msg)
+        self._confirm_yes.configure(text=yes_text, command=yes)
+        win.transient(parent)
+        # Center on parent
+        win.geometry(f"300x120+{parent.winfo_x() + (parent.winfo_width() - 300) // 2}+{parent.winfo_y() + 150}")
+        win.deiconify();  win.lift()
+        win.grab_set()
+
+    def _close_confirm(self) -> None:
+        try:
+            self._confirm_win.grab_release()
+            self._confirm_win.withdraw()
+        except tk.TclError:
+            pass
+
+    def _reuse_window(self, win: Optional[tk.Toplevel]) -> bool:
+        """Re-shows a withdrawn cached window; False if it has to be rebuilt."""
+        if win is None:
+            return False
+        try:
+            if not win.winfo_exists():
+                return False
+            win.deiconify();  win.lift();  win.focus_force()
+            return True
+        except tk.TclError:
+            return False
 
     # ━━━ Statistics Window ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
@@ -3532,15 +4024,16 @@ class ScreenBreakApp:
         if self._stats_win:
             try: self._stats_win.lift();  self._stats_win.focus_force();  return
             except tk.TclError: self._stats_win = None
+        if self._reuse_window(self._stats_win_cache):
+            self._stats_win = self._stats_win_cache
+            self._refresh_stats_win()
+            return
 
         win = tk.Toplevel(self.root)
         win.title("Screen Break — Statistics")
         win.geometry("400x580")
         win.configure(bg=C_BG)
-        self._stats_win = win
-
-        # Refresh stats for today
-        update_stats_for_today(self.stats)
+        self._stats_win = win;  self._stats_win_cache = win
 
         tk.Label(win, text="Your Break Statistics", font=(FONT, 15, "bold"),
                  fg=C_ACCENT2, bg=C_BG).pack(pady=(14, 12))
@@ -3550,20 +4043,15 @@ class ScreenBreakApp:
         tf.pack(fill="x", padx=14, pady=(0, 8))
         tk.Label(tf, text="📅  Today", font=(FONT, 12, "bold"),
                  fg=C_TEXT, bg=C_CARD).pack(anchor="w")
-        today = self.stats.get("today", {})
-        today_text = (f"Eye rests taken: {today.get('eye_rest_taken', 0)}\n"
-                      f"Micro-pauses taken: {today.get('micro_taken', 0)}\n"
-                      f"Scheduled breaks taken: {today.get('scheduled_taken', 0)}")
-        tk.Label(tf, text=today_text, font=(FONT, 10), fg=C_TEXT_DIM,
+        self._stats_today_var = tk.StringVar()
+        tk.Label(tf, textvariable=self._stats_today_var, font=(FONT, 10), fg=C_TEXT_DIM,
                  bg=C_CARD, justify="left").pack(anchor="w", pady=(4, 0))
 
         # Streak
         sf = tk.Frame(win, bg=C_CARD, padx=16, pady=12)
         sf.pack(fill="x", padx=14, pady=(0, 8))
-        streak = self.stats.get("streak_days", 0)
-        streak_emoji = "🔥" if streak >= 7 else "⭐" if streak >= 3 else "📊"
-        tk.Label(sf, text=f"{streak_emoji}  Current Streak: {streak} day{'s' if streak != 1 else ''}",
-                 font=(FONT, 12, "bold"), fg=C_CD if streak >= 3 else C_TEXT, bg=C_CARD).pack(anchor="w")
+        self._stats_streak_lbl = tk.Label(sf, font=(FONT, 12, "bold"), bg=C_CARD)
+        self._stats_streak_lbl.pack(anchor="w")
         tk.Label(sf, text="Days with at least one break taken",
                  font=(FONT, 9), fg=C_TEXT_MUT, bg=C_CARD).pack(anchor="w", pady=(2, 0))
 
@@ -3572,18 +4060,85 @@ class ScreenBreakApp:
         cf.pack(fill="x", padx=14, pady=(0, 8))
         tk.Label(cf, text="📊  Last 7 Days", font=(FONT, 12, "bold"),
                  fg=C_TEXT, bg=C_CARD).pack(anchor="w")
+        self._stats_chart = tk.Canvas(cf, width=340, height=100, bg=C_CARD, highlightthickness=0)
+        self._stats_chart.pack(pady=(8, 4))
+        # Items are created once (3 stacked segments + a label per day) and
+        # only moved/relabelled by _refresh_stats_win.
+        self._chart_rects = [[self._stats_chart.create_rectangle(0, -10, 0, -10, fill=color, outline="")
+                              for color in (C_EYE_ACC, C_ACCENT, C_ACCENT2)] for _ in range(7)]
+        self._chart_labels = [self._stats_chart.create_text(0, 95, font=(FONT, 8), fill=C_TEXT_MUT)
+                              for _ in range(7)]
 
-        # Build chart data - include today + history
-        chart_data = []
-        history = self.stats.get("daily_history", [])
+        # Legend
+        legend_frame = tk.Frame(cf, bg=C_CARD)
+        legend_frame.pack(anchor="w")
+        for color, label in [(C_EYE_ACC, "Eye"), (C_ACCENT, "Micro"), (C_ACCENT2, "Sched")]:
+            lf = tk.Frame(legend_frame, bg=C_CARD)
+            lf.pack(side="left", padx=(0, 12))
+            tk.Canvas(lf, width=10, height=10, bg=color, highlightthickness=0).pack(side="left", padx=(0, 4))
+            tk.Label(lf, text=label, font=(FONT, 8), fg=C_TEXT_MUT, bg=C_CARD).pack(side="left")
+
+        # Lifetime stats
+        lf = tk.Frame(win, bg=C_CARD, padx=16, pady=12)
+        lf.pack(fill="x", padx=14, pady=(0, 8))
+        tk.Label(lf, text="📈  Lifetime", font=(FONT, 12, "bold"),
+                 fg=C_TEXT, bg=C_CARD).pack(anchor="w")
+        self._stats_lt_var = tk.StringVar()
+        tk.Label(lf, textvariable=self._stats_lt_var, font=(FONT, 10), fg=C_TEXT_DIM,
+                 bg=C_CARD, justify="left").pack(anchor="w", pady=(4, 0))
+
+        # Total breaks - cumulative progress
+        self._stats_total_var = tk.StringVar()
+        tk.Label(lf, textvariable=self._stats_total_var, font=(FONT, 11, "bold"),
+                 fg=C_OK, bg=C_CARD).pack(anchor="w", pady=(8, 0))
+
+        # Buttons
+        bf = tk.Frame(win, bg=C_BG)
+        bf.pack(pady=12)
+
+        def reset_stats():
+            if not any(self.stats.get("lifetime", {}).values()):
+                return
+            def do_reset():
+                self.stats = deepcopy(DEFAULT_STATS)
+                self._schedule_stats_save()
+                self._refresh_stats_win()
+            self._ask_confirm(win, "Confirm Reset", "Reset all statistics?", "Reset", do_reset)
+
+        tk.Button(bf, text="Reset Stats", font=(FONT, 9), bg=C_BTN_SEC, fg=C_TEXT_DIM,
+                  relief="flat", padx=12, pady=4, cursor="hand2", command=reset_stats).pack(side="left", padx=4)
+        tk.Button(bf, text="Close", font=(FONT, 10), bg=C_BTN_SEC, fg=C_TEXT,
+                  relief="flat", padx=16, pady=4, cursor="hand2", command=self._close_stats_win).pack(side="left", padx=4)
+
+        win.protocol("WM_DELETE_WINDOW", self._close_stats_win)
+        self._refresh_stats_win()
+
+    def _refresh_stats_win(self) -> None:
+        """Fills the numbers and chart of the (possibly reused) stats window."""
+        update_stats_for_today(self.stats)
+        today = self.stats["today"]
+        eye, micro, sched = today["eye_rest_taken"], today["micro_taken"], today["scheduled_taken"]
+        self._stats_today_var.set(f"Eye rests taken: {eye}\n"
+                                  f"Micro-pauses taken: {micro}\n"
+                                  f"Scheduled breaks taken: {sched}")
+
+        streak = self.stats.get("streak_days", 0)
+        streak_emoji = "🔥" if streak >= 7 else "⭐" if streak >= 3 else "📊"
+        self._stats_streak_lbl.configure(
+            text=f"{streak_emoji}  Current Streak: {streak} day{'s' if streak != 1 else ''}",
+            fg=C_CD if streak >= 3 else C_TEXT)
+
+        # Build chart data - include today + history
+        chart_data = []
+        history = self.stats.get("daily_history", [])
         for entry in history[-6:]:  # Last 6 days from history
             chart_data.append(entry)
         # Add today
         today_entry = {
             "date": datetime.date.today().isoformat(),
-            "eye": today.get("eye_rest_taken", 0),
-            "micro": today.get("micro_taken", 0),
-            "scheduled": today.get("scheduled_taken", 0),
+            "eye": eye,
+            "micro": micro,
+            "scheduled": sched,
         }
         chart_data.append(today_entry)
 
@@ -3591,10 +4146,8 @@ class ScreenBreakApp:
         while len(chart_data) < 7:
             chart_data.insert(0, {"date": "", "eye": 0, "micro": 0, "scheduled": 0})
 
-        # Draw bar chart
-        canvas = tk.Canvas(cf, width=340, height=100, bg=C_CARD, highlightthickness=0)
-        canvas.pack(pady=(8, 4))
-
+        # Update bar chart
+        canvas = self._stats_chart
         bar_width = 35
         gap = 12
         max_val = max(1, max(d["eye"] + d["micro"] + d["scheduled"] for d in chart_data))
@@ -3602,21 +4155,16 @@ class ScreenBreakApp:
 
         for i, day in enumerate(chart_data):
             x = 15 + i * (bar_width + gap)
-            total = day["eye"] + day["micro"] + day["scheduled"]
 
-            # Stacked bars
+            # Stacked bars; empty segments are parked above the canvas
             y = 85
-            if day["eye"] > 0:
-                h = day["eye"] * scale
-                canvas.create_rectangle(x, y - h, x + bar_width, y, fill=C_EYE_ACC, outline="")
-                y -= h
-            if day["micro"] > 0:
-                h = day["micro"] * scale
-                canvas.create_rectangle(x, y - h, x + bar_width, y, fill=C_ACCENT, outline="")
-                y -= h
-            if day["scheduled"] > 0:
-                h = day["scheduled"] * scale
-                canvas.create_rectangle(x, y - h, x + bar_width, y, fill=C_ACCENT2, outline="")
+            for rid, val in zip(self._chart_rects[i], (day["eye"], day["micro"], day["scheduled"])):
+                if val > 0:
+                    h = val * scale
+                    canvas.coords(rid, x, y - h, x + bar_width, y)
+                    y -= h
+                else:
+                    canvas.coords(rid, x, -10, x + bar_width, -10)
 
             # Day label
             if day["date"]:
@@ -3627,74 +4175,21 @@ class ScreenBreakApp:
                     label = ""
             else:
                 label = ""
-            canvas.create_text(x + bar_width // 2, 95, text=label, font=(FONT, 8), fill=C_TEXT_MUT)
-
-        # Legend
-        legend_frame = tk.Frame(cf, bg=C_CARD)
-        legend_frame.pack(anchor="w")
-        for color, label in [(C_EYE_ACC, "Eye"), (C_ACCENT, "Micro"), (C_ACCENT2, "Sched")]:
-            lf = tk.Frame(legend_frame, bg=C_CARD)
-            lf.pack(side="left", padx=(0, 12))
-            tk.Canvas(lf, width=10, height=10, bg=color, highlightthickness=0).pack(side="left", padx=(0, 4))
-            tk.Label(lf, text=label, font=(FONT, 8), fg=C_TEXT_MUT, bg=C_CARD).pack(side="left")
-
-        # Lifetime stats
-        lf = tk.Frame(win, bg=C_CARD, padx=16, pady=12)
-        lf.pack(fill="x", padx=14, pady=(0, 8))
-        tk.Label(lf, text="📈  Lifetime", font=(FONT, 12, "bold"),
-                 fg=C_TEXT, bg=C_CARD).pack(anchor="w")
-        lt = self.stats.get("lifetime", {})
-        lt_text = (f"Eye rests completed: {lt.get('eye_rest_taken', 0)}\n"
-                   f"Micro-pauses completed: {lt.get('micro_taken', 0)}\n"
-                   f"Scheduled breaks completed: {lt.get('scheduled_taken', 0)}")
-        tk.Label(lf, text=lt_text, font=(FONT, 10), fg=C_TEXT_DIM,
-                 bg=C_CARD, justify="left").pack(anchor="w", pady=(4, 0))
-
-        # Total breaks - cumulative progress
-        total_taken = (lt.get('eye_rest_taken', 0) + lt.get('micro_taken', 0) + lt.get('scheduled_taken', 0))
-        tk.Label(lf, text=f"Total breaks: {total_taken}", font=(FONT, 11, "bold"),
-                 fg=C_OK, bg=C_CARD).pack(anchor="w", pady=(8, 0))
-
-        # Buttons
-        bf = tk.Frame(win, bg=C_BG)
-        bf.pack(pady=12)
+            canvas.coords(self._chart_labels[i], x + bar_width // 2, 95)
+            canvas.itemconfigure(self._chart_labels[i], text=label)
 
-        def reset_stats():
-            if not any(self.stats.get("lifetime", {}).values()):
-                return
-            confirm = tk.Toplevel(win)
-            confirm.title("Confirm Reset")
-            confirm.configure(bg=C_CARD)
-            confirm.geometry("280x100")
-            confirm.transient(win)
-            confirm.grab_set()
-            confirm.protocol("WM_DELETE_WINDOW", confirm.destroy)
-            confirm.geometry(f"+{win.winfo_x() + 60}+{win.winfo_y() + 150}")
-            tk.Label(confirm, text="Reset all statistics?", font=(FONT, 11, "bold"),
-                     fg=C_TEXT, bg=C_CARD).pack(pady=(14, 6))
-            cbf = tk.Frame(confirm, bg=C_CARD)
-            cbf.pack()
-            def do_reset():
-                self.stats = json.loads(json.dumps(DEFAULT_STATS))
-                save_stats(self.stats)
-                confirm.destroy()
-                win.destroy()
-                self._stats_win = None
-            tk.Button(cbf, text="Reset", font=(FONT, 9), bg=C_ACCENT, fg=C_TEXT,
-                      relief="flat", padx=12, pady=4, cursor="hand2", command=do_reset).pack(side="left", padx=4)
-            tk.Button(cbf, text="Cancel", font=(FONT, 9), bg=C_BTN_SEC, fg=C_TEXT,
-                      relief="flat", padx=12, pady=4, cursor="hand2", command=confirm.destroy).pack(side="left", padx=4)
+        lt = self.stats["lifetime"]
+        self._stats_lt_var.set(f"Eye rests completed: {lt['eye_rest_taken']}\n"
+                               f"Micro-pauses completed: {lt['micro_taken']}\n"
+                               f"Scheduled breaks completed: {lt['scheduled_taken']}")
+        total_taken = lt['eye_rest_taken'] + lt['micro_taken'] + lt['scheduled_taken']
+        self._stats_total_var.set(f"Total breaks: {total_taken}")
 
-        def on_close():
+    def _close_stats_win(self) -> None:
+        if self._stats_win:
+            try: self._stats_win.withdraw()
+            except tk.TclError: self._stats_win_cache = None
             self._stats_win = None
-            win.destroy()
-
-        tk.Button(bf, text="Reset Stats", font=(FONT, 9), bg=C_BTN_SEC, fg=C_TEXT_DIM,
-                  relief="flat", padx=12, pady=4, cursor="hand2", command=reset_stats).pack(side="left", padx=4)
-        tk.Button(bf, text="Close", font=(FONT, 10), bg=C_BTN_SEC, fg=C_TEXT,
-                  relief="flat", padx=16, pady=4, cursor="hand2", command=on_close).pack(side="left", padx=4)
-
-        win.protocol("WM_DELETE_WINDOW", on_close)
 
     # ━━━ Status & Settings Window ━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
@@ -3702,13 +4197,24 @@ class ScreenBreakApp:
         if self._status_win:
             try: self._status_win.lift();  self._status_win.focus_force();  return
             except tk.TclError: self._status_win = None
+        if self._reuse_window(self._status_win_cache):
+            # Widgets survive the withdraw; only resync them with the saved
+            # config, which may have changed (tray, widget menu) while hidden.
+            self._status_win = self._status_win_cache
+            self.root.bind_all("<KeyPress-Scroll_Lock>", self._deo_settings_gesture_feed)
+            self.root.bind_all("<KeyPress-Pause>", self._deo_settings_gesture_feed)
+            self._load_settings_fields(self.config)
+            self._deo_load_settings_fields()
+            self._deo_update_badge()
+            self._tick_1hz()
+            return
 
         win = tk.Toplevel(self.root)
         win.title("Screen Break — Status & Settings")
         win.configure(bg=C_BG);  win.resizable(False, True)
         if self.config.get("status_always_on_top", False):
             win.attributes("-topmost", True)
-        self._status_win = win
+        self._status_win = win;  self._status_win_cache = win
 
         pad = dict(padx=20)
 
@@ -3716,7 +4222,7 @@ class ScreenBreakApp:
         # focused) + a small "D" badge, shown only when armed, that the parent
         # recognizes but never explains to the child. The hidden-gesture
         # listener that authorizes disarm/settings-edit is only bound while
-        # this window is open (unbound in _close_status) — it must not be
+        # this window is shown (unbound in _close_status) — it must not be
         # possible to pre-authorize a disarm attempt before one has actually
         # started, and unrelated users of this app shouldn't get background
         # key-tracking for a window that isn't even on screen.
@@ -3725,7 +4231,7 @@ class ScreenBreakApp:
         self.root.bind_all("<KeyPress-Pause>", self._deo_settings_gesture_feed)
         deo_badge_row = tk.Frame(win, bg=C_BG)
         deo_badge_row.pack(fill="x", pady=(6, 0), **pad)
-        self._deo_badge = tk.Label(deo_badge_row, text="D", font=(FONT, 10, "bold"),
+        self._deo_badge = tk.Label(deo_badge_row, text="D", font=F_BOLD,
                                     fg=C_DEO_ACC, bg=C_BG, width=2)
         # Visibility (badge + the Deo settings section below) is synced once,
         # further down, after both have been built.
@@ -3734,31 +4240,31 @@ class ScreenBreakApp:
         ctrl_frame = tk.Frame(win, bg=C_BG)
         ctrl_frame.pack(fill="x", pady=(14, 8), **pad)
 
-        self._pause_btn = tk.Button(ctrl_frame, text="⏸ Pause", font=(FONT, 9), bg=C_BTN_SEC, fg=C_TEXT,
+        self._pause_btn = tk.Button(ctrl_frame, text="⏸ Pause", font=F_SMALL, bg=C_BTN_SEC, fg=C_TEXT,
                   relief="flat", width=9, pady=4, cursor="hand2", command=self._toggle_pause_ui)
         self._pause_btn.pack(side="left", padx=(0, 6))
         ToolTip(self._pause_btn, "Pause all break reminders")
 
-        self._gentle_btn = tk.Button(ctrl_frame, text="🪫 Gentle", font=(FONT, 9),
+        self._gentle_btn = tk.Button(ctrl_frame, text="🪫 Gentle", font=F_SMALL,
                   bg=C_BTN_SEC, fg=C_TEXT_DIM, relief="flat", width=9, pady=4, cursor="hand2",
                   command=self._toggle_gentle_ui)
         self._gentle_btn.pack(side="left", padx=(0, 6))
         self._update_gentle_btn()
         ToolTip(self._gentle_btn, "Gentler reminders (1.5x longer intervals)")
 
-        stats_btn = tk.Button(ctrl_frame, text="📊 Stats", font=(FONT, 9), bg=C_BTN_SEC, fg=C_TEXT_DIM,
+        stats_btn = tk.Button(ctrl_frame, text="📊 Stats", font=F_SMALL, bg=C_BTN_SEC, fg=C_TEXT_DIM,
                   relief="flat", padx=10, pady=4, cursor="hand2",
                   command=self._toggle_stats_win)
         stats_btn.pack(side="left", padx=(0, 6))
         ToolTip(stats_btn, "View break statistics and streaks")
 
-        notes_btn = tk.Button(ctrl_frame, text="📝 Notes", font=(FONT, 9), bg=C_BTN_SEC, fg=C_TEXT_DIM,
+        notes_btn = tk.Button(ctrl_frame, text="📝 Notes", font=F_SMALL, bg=C_BTN_SEC, fg=C_TEXT_DIM,
                   relief="flat", padx=10, pady=4, cursor="hand2",
                   command=self._toggle_notes_win)
         notes_btn.pack(side="left", padx=(0, 6))
         ToolTip(notes_btn, "View notes captured during breaks")
 
-        focus_btn = tk.Button(ctrl_frame, text="🎯 Focus", font=(FONT, 9), bg=C_BTN_SEC, fg=C_TEXT_DIM,
+        focus_btn = tk.Button(ctrl_frame, text="🎯 Focus", font=F_SMALL, bg=C_BTN_SEC, fg=C_TEXT_DIM,
                   relief="flat", padx=10, pady=4, cursor="hand2",
                   command=self._show_focus_session_dialog)
         focus_btn.pack(side="left")
@@ -3768,11 +4274,11 @@ class ScreenBreakApp:
         self._st_rows = {}
         for key, icon in [("eye", "🌿  Eye rest"), ("micro", "🧘  Micro-pause"), ("sched", "📋  Next break")]:
             lf = tk.Frame(win, bg=C_CARD, padx=14, pady=8);  lf.pack(fill="x", pady=2, **pad)
-            tk.Label(lf, text=icon, font=(FONT, 10), fg=C_TEXT_DIM, bg=C_CARD, anchor="w").pack(fill="x")
+            tk.Label(lf, text=icon, font=F_BODY, fg=C_TEXT_DIM, bg=C_CARD, anchor="w").pack(fill="x")
             tv = tk.StringVar(value="--:--")
             tk.Label(lf, textvariable=tv, font=(MONO, 18, "bold"), fg=C_CD, bg=C_CARD, anchor="w").pack(fill="x")
             dv = tk.StringVar()
-            tk.Label(lf, textvariable=dv, font=(FONT, 9), fg=C_TEXT_MUT, bg=C_CARD, anchor="w").pack(fill="x")
+            tk.Label(lf, textvariable=dv, font=F_SMALL, fg=C_TEXT_MUT, bg=C_CARD, anchor="w").pack(fill="x")
             self._st_rows[key] = (tv, dv)
 
         # ══════ COLLAPSIBLE SETTINGS SECTION ══════
@@ -3810,10 +4316,10 @@ class ScreenBreakApp:
 
         self._save_fb = tk.StringVar()
         tk.Label(self._settings_btn_frame, textvariable=self._save_fb, font=(FONT, 8), fg=C_OK, bg=C_BG).pack(side="left", padx=(0, 8))
-        tk.Button(self._settings_btn_frame, text="Apply & Save", font=(FONT, 9), bg=C_BTN_PRI, fg=C_TEXT,
+        tk.Button(self._settings_btn_frame, text="Apply & Save", font=F_SMALL, bg=C_BTN_PRI, fg=C_TEXT,
                   relief="flat", padx=10, pady=2, cursor="hand2",
                   command=self._apply_settings).pack(side="left")
-        tk.Button(self._settings_btn_frame, text="Reset", font=(FONT, 9), bg=C_BTN_SEC, fg=C_TEXT_DIM,
+        tk.Button(self._settings_btn_frame, text="Reset", font=F_SMALL, bg=C_BTN_SEC, fg=C_TEXT_DIM,
                   relief="flat", padx=8, pady=2, cursor="hand2",
                   command=self._reset_defaults).pack(side="left", padx=(6, 0))
 
@@ -3834,9 +4340,13 @@ class ScreenBreakApp:
         scroll_frame = tk.Frame(canvas, bg=C_BG)
         canvas_window = canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
 
-        # Mousewheel scrolling (scoped to this canvas)
-        self._scroll_bind_id = None
+        # Mousewheel scrolling: bound on the window, which every child's
+        # bindtags include, and acted on only while the pointer is over the
+        # scroll area — no global binding to add and remove on open/close.
         def _on_mousewheel(event):
+            under = str(canvas.winfo_containing(event.x_root, event.y_root) or "")
+            if under != str(canvas) and not under.startswith(f"{canvas}."):
+                return
             # macOS: delta is +-1..N (no /120 needed); Windows/Linux: delta is multiples of 120
             if IS_MAC:
                 delta = -event.delta
@@ -3844,14 +4354,7 @@ class ScreenBreakApp:
                 delta = int(-1 * (event.delta / 120))
             if delta:
                 canvas.yview_scroll(delta, "units")
-        def _on_enter(event):
-            self._scroll_bind_id = canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        def _on_leave(event):
-            if self._scroll_bind_id:
-                canvas.unbind_all("<MouseWheel>")
-                self._scroll_bind_id = None
-        canvas.bind("<Enter>", _on_enter)
-        canvas.bind("<Leave>", _on_leave)
+        win.bind("<MouseWheel>", _on_mousewheel)
 
         # Update scroll region when content changes
         def _configure_scroll(event):
@@ -3863,388 +4366,80 @@ class ScreenBreakApp:
         spad = dict(padx=20)  # Padding inside scroll area
 
         # ══════ INTERVALS & TIMING ══════
-        tk.Label(scroll_frame, text="Intervals & Timing", font=(FONT, 11, "bold"),
+        tk.Label(scroll_frame, text="Intervals & Timing", font=F_HEAD,
                  fg=C_TEXT_DIM, bg=C_BG).pack(pady=(4, 6), **spad, anchor="w")
 
         ivf = tk.Frame(scroll_frame, bg=C_BG);  ivf.pack(fill="x", **spad)
 
-        ef = tk.Frame(ivf, bg=C_BG);  ef.pack(fill="x", pady=2)
-        tk.Label(ef, text="Eye rest every", font=(FONT, 10), fg=C_TEXT_DIM,
-                 bg=C_BG, width=22, anchor="w").pack(side="left")
-        self._eye_spin = tk.Spinbox(ef, from_=5, to=120, width=4,
-            font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._eye_spin.pack(side="left");  self._eye_spin.delete(0, "end")
-        self._eye_spin.insert(0, str(self.config.get("eye_rest_interval", 20)))
-        tk.Label(ef, text=" min", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-        self._eye_rest_var = tk.BooleanVar(value=self.config.get("eye_rest_enabled", True))
-        tk.Checkbutton(ef, variable=self._eye_rest_var, bg=C_BG, fg=C_TEXT_DIM,
-                       selectcolor=C_CARD_IN, activebackground=C_BG,
-                       activeforeground=C_TEXT_DIM).pack(side="left", padx=(6, 0))
-
-        mf = tk.Frame(ivf, bg=C_BG);  mf.pack(fill="x", pady=2)
-        tk.Label(mf, text="Micro-pause every", font=(FONT, 10), fg=C_TEXT_DIM,
-                 bg=C_BG, width=22, anchor="w").pack(side="left")
-        self._micro_spin = tk.Spinbox(mf, from_=10, to=120, width=4,
-            font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._micro_spin.pack(side="left");  self._micro_spin.delete(0, "end")
-        self._micro_spin.insert(0, str(self.config.get("micro_pause_interval", 45)))
-        tk.Label(mf, text=" min", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-        self._micro_pause_var = tk.BooleanVar(value=self.config.get("micro_pause_enabled", True))
-        tk.Checkbutton(mf, variable=self._micro_pause_var, bg=C_BG, fg=C_TEXT_DIM,
-                       selectcolor=C_CARD_IN, activebackground=C_BG,
-                       activeforeground=C_TEXT_DIM).pack(side="left", padx=(6, 0))
-
-        gf = tk.Frame(ivf, bg=C_BG);  gf.pack(fill="x", pady=2)
-        tk.Label(gf, text="Min gap between breaks", font=(FONT, 10), fg=C_TEXT_DIM,
-                 bg=C_BG, width=22, anchor="w").pack(side="left")
-        self._gap_spin = tk.Spinbox(gf, from_=0, to=60, width=4,
-            font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._gap_spin.pack(side="left");  self._gap_spin.delete(0, "end")
-        self._gap_spin.insert(0, str(self.config.get("minimum_break_gap", 20)))
-        tk.Label(gf, text=" min", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-
-        edf = tk.Frame(ivf, bg=C_BG);  edf.pack(fill="x", pady=2)
-        tk.Label(edf, text="Eye rest duration", font=(FONT, 10), fg=C_TEXT_DIM,
-                 bg=C_BG, width=22, anchor="w").pack(side="left")
-        self._eye_dur_spin = tk.Spinbox(edf, from_=5, to=60, width=4,
-            font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._eye_dur_spin.pack(side="left");  self._eye_dur_spin.delete(0, "end")
-        self._eye_dur_spin.insert(0, str(self.config.get("eye_rest_duration", 20)))
-        tk.Label(edf, text=" sec", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-
-        sf = tk.Frame(ivf, bg=C_BG);  sf.pack(fill="x", pady=2)
-        tk.Label(sf, text="Snooze duration", font=(FONT, 10), fg=C_TEXT_DIM,
-                 bg=C_BG, width=22, anchor="w").pack(side="left")
-        self._snooze_spin = tk.Spinbox(sf, from_=1, to=30, width=4,
-            font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._snooze_spin.pack(side="left");  self._snooze_spin.delete(0, "end")
-        self._snooze_spin.insert(0, str(self.config.get("snooze_minutes", 5)))
-        tk.Label(sf, text=" min", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-
-        warnf = tk.Frame(ivf, bg=C_BG);  warnf.pack(fill="x", pady=2)
-        tk.Label(warnf, text="Warning before break", font=(FONT, 10), fg=C_TEXT_DIM,
-                 bg=C_BG, width=22, anchor="w").pack(side="left")
-        self._warn_spin = tk.Spinbox(warnf, from_=10, to=300, width=4,
-            font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._warn_spin.pack(side="left");  self._warn_spin.delete(0, "end")
-        self._warn_spin.insert(0, str(self.config.get("warning_seconds", 60)))
-        tk.Label(warnf, text=" sec", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
+        self._spin_vars = {};  self._vars = {};  spins = {}
+        for label, key, lo, hi, unit in [
+            ("Eye rest every", "eye_rest_interval", 5, 120, "min"),
+            ("Micro-pause every", "micro_pause_interval", 10, 120, "min"),
+            ("Min gap between breaks", "minimum_break_gap", 0, 60, "min"),
+            ("Eye rest duration", "eye_rest_duration", 5, 60, "sec"),
+            ("Snooze duration", "snooze_minutes", 1, 30, "min"),
+            ("Warning before break", "warning_seconds", 10, 300, "sec"),
+        ]:
+            spins[key] = self._make_spin_row(ivf, label, key, lo, hi, unit)
+
+        # Enable toggles sit at the end of their interval rows
+        for spin_key, key in [("eye_rest_interval", "eye_rest_enabled"), ("micro_pause_interval", "micro_pause_enabled")]:
+            self._vars[key] = tk.BooleanVar(value=self.config.get(key, DEFAULT_CONFIG[key]))
+            tk.Checkbutton(spins[spin_key].master, variable=self._vars[key],
+                           **CHK_KW).pack(side="left", padx=(6, 0))
 
         wf = tk.Frame(ivf, bg=C_BG);  wf.pack(fill="x", pady=2)
-        tk.Label(wf, text="Work hours", font=(FONT, 10), fg=C_TEXT_DIM,
+        tk.Label(wf, text="Work hours", font=F_BODY, fg=C_TEXT_DIM,
                  bg=C_BG, width=22, anchor="w").pack(side="left")
-        self._ws_entry = tk.Entry(wf, width=6, font=(MONO, 10), bg=C_CARD_IN,
-                                  fg=C_TEXT, relief="flat", justify="center")
-        self._ws_entry.pack(side="left");  self._ws_entry.insert(0, self.config.get("work_start", "08:00"))
-        tk.Label(wf, text=" to ", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-        self._we_entry = tk.Entry(wf, width=6, font=(MONO, 10), bg=C_CARD_IN,
-                                  fg=C_TEXT, relief="flat", justify="center")
-        self._we_entry.pack(side="left");  self._we_entry.insert(0, self.config.get("work_end", "20:00"))
+        self._ws_var = tk.StringVar(value=self.config.get("work_start", "08:00"))
+        self._we_var = tk.StringVar(value=self.config.get("work_end", "20:00"))
+        tk.Entry(wf, textvariable=self._ws_var, width=6, font=F_MONO, bg=C_CARD_IN,
+                 fg=C_TEXT, relief="flat", justify="center").pack(side="left")
+        tk.Label(wf, text=" to ", **LBL_MUT_KW).pack(side="left")
+        tk.Entry(wf, textvariable=self._we_var, width=6, font=F_MONO, bg=C_CARD_IN,
+                 fg=C_TEXT, relief="flat", justify="center").pack(side="left")
 
         # Coast margin setting
-        coastf = tk.Frame(ivf, bg=C_BG);  coastf.pack(fill="x", pady=2)
-        tk.Label(coastf, text="Skip if scheduled within", font=(FONT, 10), fg=C_TEXT_DIM,
-                 bg=C_BG, width=22, anchor="w").pack(side="left")
-        self._coast_spin = tk.Spinbox(coastf, from_=0, to=30, width=3,
-            font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._coast_spin.pack(side="left");  self._coast_spin.delete(0, "end")
-        self._coast_spin.insert(0, str(self.config.get("coast_margin_minutes", 10)))
-        tk.Label(coastf, text=" min", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
+        self._make_spin_row(ivf, "Skip if scheduled within", "coast_margin_minutes", 0, 30, "min", width=3)
 
         # ══════ SCHEDULED BREAKS ══════
         tk.Frame(scroll_frame, bg=C_TEXT_MUT, height=1).pack(fill="x", pady=(10, 6), **spad)
-        tk.Label(scroll_frame, text="Scheduled Breaks  (local time)", font=(FONT, 11, "bold"),
+        tk.Label(scroll_frame, text="Scheduled Breaks  (local time)", font=F_HEAD,
                  fg=C_TEXT_DIM, bg=C_BG).pack(pady=(0, 4), **spad, anchor="w")
 
-        hdr = tk.Frame(scroll_frame, bg=C_BG);  hdr.pack(fill="x", **spad)
-        tk.Label(hdr, text="Time", font=(FONT, 9), fg=C_TEXT_MUT, bg=C_BG, width=7, anchor="w").pack(side="left")
-        tk.Label(hdr, text="Dur", font=(FONT, 9), fg=C_TEXT_MUT, bg=C_BG, width=5, anchor="w").pack(side="left")
-        tk.Label(hdr, text="Name", font=(FONT, 9), fg=C_TEXT_MUT, bg=C_BG, anchor="w").pack(side="left", fill="x", expand=True)
-
-        self._brk_container = tk.Frame(scroll_frame, bg=C_BG)
-        self._brk_container.pack(fill="x", **spad)
-        self._brk_rows = []
+        # One Treeview for every break; cells are edited in place on double-click
+        self._style_breaks_tree()
+        self._brk_tv = ttk.Treeview(scroll_frame, columns=("time", "dur", "title"), show="headings",
+                                    height=6, style="Breaks.Treeview", selectmode="browse")
+        for col, text, width, stretch in [("time", "Time", 60, False), ("dur", "Min", 45, False),
+                                          ("title", "Name", 200, True)]:
+            self._brk_tv.heading(col, text=text, anchor="w")
+            self._brk_tv.column(col, width=width, stretch=stretch, anchor="w" if stretch else "center")
+        self._brk_tv.pack(fill="x", **spad)
+        self._brk_tv.bind("<Double-1>", self._edit_brk_cell)
+        self._brk_tv.bind("<Delete>", self._remove_brk_row)
+        self._brk_edit_commit = None
         for brk in self.config.get("breaks", []):
             if isinstance(brk, dict) and "time" in brk and "duration" in brk and "title" in brk:
                 self._add_brk_row(brk["time"], brk["duration"], brk["title"])
 
-        tk.Button(scroll_frame, text="+ Add break", font=(FONT, 9), bg=C_BTN_SEC, fg=C_TEXT_DIM,
+        brkbf = tk.Frame(scroll_frame, bg=C_BG);  brkbf.pack(fill="x", pady=(4, 8), **spad)
+        tk.Button(brkbf, text="+ Add break", font=F_SMALL, bg=C_BTN_SEC, fg=C_TEXT_DIM,
                   relief="flat", padx=10, pady=2, cursor="hand2",
-                  command=lambda: self._add_brk_row("12:00", 15, "New Break")).pack(
-                      pady=(4, 8), **spad, anchor="w")
-
-        # ══════ FEATURES ══════
-        tk.Frame(scroll_frame, bg=C_TEXT_MUT, height=1).pack(fill="x", pady=(6, 6), **spad)
-        tk.Label(scroll_frame, text="Features", font=(FONT, 11, "bold"),
-                 fg=C_TEXT_DIM, bg=C_BG).pack(pady=(0, 4), **spad, anchor="w")
-
-        featf = tk.Frame(scroll_frame, bg=C_BG);  featf.pack(fill="x", **spad)
-
-        # Presentation mode (focus_mode) - auto-pause during fullscreen/Zoom
-        focf = tk.Frame(featf, bg=C_BG);  focf.pack(fill="x", pady=2)
-        self._focus_var = tk.BooleanVar(value=self.config.get("focus_mode", True))
-        tk.Checkbutton(focf, text="Presentation mode (auto-pause during fullscreen/Zoom)", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._focus_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-
-        # Idle detection checkbox and threshold
-        idf = tk.Frame(featf, bg=C_BG);  idf.pack(fill="x", pady=2)
-        self._idle_var = tk.BooleanVar(value=self.config.get("idle_detection", True))
-        tk.Checkbutton(idf, text="Pause when idle for", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._idle_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-        self._idle_spin = tk.Spinbox(idf, from_=60, to=1800, width=4,
-            font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._idle_spin.pack(side="left");  self._idle_spin.delete(0, "end")
-        self._idle_spin.insert(0, str(self.config.get("idle_threshold", 300)))
-        tk.Label(idf, text=" sec", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-
-        # Sound checkbox
-        sndf = tk.Frame(featf, bg=C_BG);  sndf.pack(fill="x", pady=2)
-        self._sound_var = tk.BooleanVar(value=self.config.get("sound_enabled", True))
-        tk.Checkbutton(sndf, text="Play sound when breaks start", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._sound_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-
-        # Exercises checkbox
-        exf = tk.Frame(featf, bg=C_BG);  exf.pack(fill="x", pady=2)
-        self._exercises_var = tk.BooleanVar(value=self.config.get("show_exercises", True))
-        tk.Checkbutton(exf, text="Show exercise suggestions during breaks", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._exercises_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-
-        # Strict mode checkbox
-        strf = tk.Frame(featf, bg=C_BG);  strf.pack(fill="x", pady=2)
-        self._strict_var = tk.BooleanVar(value=self.config.get("strict_mode", False))
-        tk.Checkbutton(strf, text="Strict mode (snooze option only)", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._strict_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-
-        # Screen dimming checkbox
-        dimf = tk.Frame(featf, bg=C_BG);  dimf.pack(fill="x", pady=2)
-        self._dim_var = tk.BooleanVar(value=self.config.get("screen_dim", True))
-        tk.Checkbutton(dimf, text="Dim screen during eye rest (fade in effect)", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._dim_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-
-        # Pomodoro mode checkbox
-        pomf = tk.Frame(featf, bg=C_BG);  pomf.pack(fill="x", pady=2)
-        self._pomo_var = tk.BooleanVar(value=self.config.get("pomodoro_mode", False))
-        tk.Checkbutton(pomf, text="Pomodoro mode (25 min work / 5 min break)", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._pomo_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-
-        # Mini reminders checkbox with interval
-        minif = tk.Frame(featf, bg=C_BG);  minif.pack(fill="x", pady=2)
-        self._mini_var = tk.BooleanVar(value=self.config.get("mini_reminders", False))
-        tk.Checkbutton(minif, text="Mini reminders (posture, hydration) every", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._mini_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-        self._mini_spin = tk.Spinbox(minif, from_=5, to=60, width=3,
-            font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._mini_spin.pack(side="left");  self._mini_spin.delete(0, "end")
-        self._mini_spin.insert(0, str(self.config.get("mini_reminder_interval", 10)))
-        tk.Label(minif, text=" min", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-
-        # Multi-monitor
-        mmf = tk.Frame(featf, bg=C_BG);  mmf.pack(fill="x", pady=2)
-        self._multimon_var = tk.BooleanVar(value=self.config.get("multi_monitor_overlay", True))
-        tk.Checkbutton(mmf, text="Show overlay on all monitors", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._multimon_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-
-        # Floating widget
-        wdgf = tk.Frame(featf, bg=C_BG);  wdgf.pack(fill="x", pady=2)
-        self._widget_var = tk.BooleanVar(value=self.config.get("show_floating_widget", True))
-        tk.Checkbutton(wdgf, text="Floating countdown widget (always visible)", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._widget_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-
-        # Taskbar presence
-        tbf = tk.Frame(featf, bg=C_BG);  tbf.pack(fill="x", pady=2)
-        self._taskbar_var = tk.BooleanVar(value=self.config.get("show_in_taskbar", True))
-        _taskbar_label = "Show in Dock (restart to apply)" if IS_MAC else "Show in taskbar (restart to apply)"
-        tk.Checkbutton(tbf, text=_taskbar_label, font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._taskbar_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-
-        # Always on top for settings window
-        aotf = tk.Frame(featf, bg=C_BG);  aotf.pack(fill="x", pady=2)
-        self._aot_var = tk.BooleanVar(value=self.config.get("status_always_on_top", False))
-        tk.Checkbutton(aotf, text="Settings window always on top", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._aot_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-
-        # --- Breathing circle widget ---
-        bw_header = tk.Label(featf, text="Breathing Circle", font=(FONT, 10, "bold"),
-                             fg=C_ACCENT2, bg=C_BG, anchor="w")
-        bw_header.pack(fill="x", pady=(8, 2))
-
-        bwf = tk.Frame(featf, bg=C_BG);  bwf.pack(fill="x", pady=2)
-        self._breath_enabled_var = tk.BooleanVar(value=self.config.get("breathing_widget_enabled", True))
-        tk.Checkbutton(bwf, text="Breathing circle widget (always visible)", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._breath_enabled_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-
-        bwrow1 = tk.Frame(featf, bg=C_BG);  bwrow1.pack(fill="x", pady=1, padx=(20, 0))
-        tk.Label(bwrow1, text="In:", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-        self._breath_inhale_spin = tk.Spinbox(bwrow1, from_=1, to=20, width=4, increment=0.5,
-            format="%.1f", font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._breath_inhale_spin.pack(side="left");  self._breath_inhale_spin.delete(0, "end")
-        self._breath_inhale_spin.insert(0, str(float(self.config.get("breathing_widget_inhale", 4))))
-        tk.Label(bwrow1, text="s Hold:", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-        self._breath_hold_in_spin = tk.Spinbox(bwrow1, from_=0, to=15, width=4, increment=0.5,
-            format="%.1f", font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._breath_hold_in_spin.pack(side="left");  self._breath_hold_in_spin.delete(0, "end")
-        self._breath_hold_in_spin.insert(0, str(float(self.config.get("breathing_widget_hold_in", 0))))
-        tk.Label(bwrow1, text="s", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-
-        bwrow1b = tk.Frame(featf, bg=C_BG);  bwrow1b.pack(fill="x", pady=1, padx=(20, 0))
-        tk.Label(bwrow1b, text="Out:", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-        self._breath_exhale_spin = tk.Spinbox(bwrow1b, from_=1, to=20, width=4, increment=0.5,
-            format="%.1f", font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._breath_exhale_spin.pack(side="left");  self._breath_exhale_spin.delete(0, "end")
-        self._breath_exhale_spin.insert(0, str(float(self.config.get("breathing_widget_exhale", 8))))
-        tk.Label(bwrow1b, text="s Hold:", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-        self._breath_hold_out_spin = tk.Spinbox(bwrow1b, from_=0, to=15, width=4, increment=0.5,
-            format="%.1f", font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._breath_hold_out_spin.pack(side="left");  self._breath_hold_out_spin.delete(0, "end")
-        self._breath_hold_out_spin.insert(0, str(float(self.config.get("breathing_widget_hold_out", 0))))
-        tk.Label(bwrow1b, text="s", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-
-        bwrow2 = tk.Frame(featf, bg=C_BG);  bwrow2.pack(fill="x", pady=1, padx=(20, 0))
-        tk.Label(bwrow2, text="Size:", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-        self._breath_size_spin = tk.Spinbox(bwrow2, from_=60, to=9999, width=4, increment=10,
-            font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._breath_size_spin.pack(side="left");  self._breath_size_spin.delete(0, "end")
-        self._breath_size_spin.insert(0, str(self.config.get("breathing_widget_size", 1000)))
-        tk.Label(bwrow2, text="px  Opacity:", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-        self._breath_alpha_spin = tk.Spinbox(bwrow2, from_=1, to=100, width=3, increment=5,
-            font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._breath_alpha_spin.pack(side="left");  self._breath_alpha_spin.delete(0, "end")
-        self._breath_alpha_spin.insert(0, str(int(self.config.get("breathing_widget_alpha", 0.10) * 100)))
-        tk.Label(bwrow2, text="%", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-
-        bwrow3 = tk.Frame(featf, bg=C_BG);  bwrow3.pack(fill="x", pady=1, padx=(20, 0))
-        tk.Label(bwrow3, text="Bg:", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-        self._breath_bg_var = tk.StringVar(value=self.config.get("breathing_widget_bg", "transparent"))
-        for bg_name in ["transparent", "dark", "teal"]:
-            tk.Radiobutton(bwrow3, text=bg_name.capitalize(), variable=self._breath_bg_var, value=bg_name,
-                          font=(FONT, 9), fg=C_TEXT_DIM, bg=C_BG, selectcolor=C_CARD_IN,
-                          activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left", padx=2)
-
-        bwrow4 = tk.Frame(featf, bg=C_BG);  bwrow4.pack(fill="x", pady=1, padx=(20, 0))
-        self._breath_ct_var = tk.BooleanVar(value=self.config.get("breathing_widget_click_through", True))
-        tk.Checkbutton(bwrow4, text="Click-through (Ctrl+drag to move)", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._breath_ct_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-
-        # Theme selection (applies instantly)
-        themef = tk.Frame(featf, bg=C_BG);  themef.pack(fill="x", pady=2)
-        tk.Label(themef, text="Theme:", font=(FONT, 10), fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
-        self._theme_var = tk.StringVar(value=self.config.get("theme", "nord"))
-
-        def apply_theme_now():
-            theme = self._theme_var.get()
-            apply_theme(theme)
-            self.config["theme"] = theme
-            save_config(self.config)
-            # Reopen window to show new colors
-            if self._status_win:
-                self._status_win.destroy()
-                self._status_win = None
-                self.root.after(100, self._show_status_window)
-
-        for theme_name in ["dark", "light", "nord"]:
-            tk.Radiobutton(themef, text=theme_name.capitalize(), variable=self._theme_var, value=theme_name,
-                          font=(FONT, 9), fg=C_TEXT_DIM, bg=C_BG, selectcolor=C_CARD_IN,
-                          activebackground=C_BG, activeforeground=C_TEXT_DIM,
-                          command=apply_theme_now).pack(side="left", padx=4)
-
-        # Hydration tracking
-        hydf = tk.Frame(featf, bg=C_BG);  hydf.pack(fill="x", pady=2)
-        self._hydration_var = tk.BooleanVar(value=self.config.get("hydration_tracking", False))
-        tk.Checkbutton(hydf, text="Hydration reminders every", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._hydration_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-        self._hydration_spin = tk.Spinbox(hydf, from_=15, to=120, width=3,
-            font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._hydration_spin.pack(side="left");  self._hydration_spin.delete(0, "end")
-        self._hydration_spin.insert(0, str(self.config.get("hydration_reminder_interval", 30)))
-        tk.Label(hydf, text=" min, goal:", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-        self._hydration_goal_spin = tk.Spinbox(hydf, from_=1, to=20, width=2,
-            font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-            relief="flat", justify="center")
-        self._hydration_goal_spin.pack(side="left");  self._hydration_goal_spin.delete(0, "end")
-        self._hydration_goal_spin.insert(0, str(self.config.get("hydration_goal", 8)))
-        tk.Label(hydf, text=" glasses", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
-
-        # Custom sound
-        csf = tk.Frame(featf, bg=C_BG);  csf.pack(fill="x", pady=2)
-        self._custom_sound_var = tk.BooleanVar(value=self.config.get("custom_sound_enabled", False))
-        tk.Checkbutton(csf, text="Custom sound:", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._custom_sound_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-        self._sound_path_entry = tk.Entry(csf, width=25, font=(FONT, 9), bg=C_CARD_IN,
-                                          fg=C_TEXT, relief="flat")
-        self._sound_path_entry.pack(side="left", padx=2)
-        self._sound_path_entry.insert(0, self.config.get("custom_sound_path", ""))
-
-        def browse_sound():
-            from tkinter import filedialog
-            path = filedialog.askopenfilename(filetypes=[("Audio", "*.mp3 *.wav *.ogg *.m4a"), ("All", "*.*")])
-            if path:
-                self._sound_path_entry.delete(0, "end")
-                self._sound_path_entry.insert(0, path)
-
-        tk.Button(csf, text="...", font=(FONT, 9), bg=C_BTN_SEC, fg=C_TEXT_DIM,
-                  relief="flat", padx=4, cursor="hand2", command=browse_sound).pack(side="left")
-
-        # Custom messages
-        cmf = tk.Frame(featf, bg=C_BG);  cmf.pack(fill="x", pady=2)
-        self._custom_msg_var = tk.BooleanVar(value=self.config.get("use_custom_messages", False))
-        tk.Checkbutton(cmf, text="Use custom break messages", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._custom_msg_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-        tk.Button(cmf, text="Edit...", font=(FONT, 9), bg=C_BTN_SEC, fg=C_TEXT_DIM,
-                  relief="flat", padx=6, cursor="hand2", command=self._show_message_editor).pack(side="left", padx=4)
-
-        # Guided eye exercises
-        eyef = tk.Frame(featf, bg=C_BG);  eyef.pack(fill="x", pady=2)
-        self._guided_eye_var = tk.BooleanVar(value=self.config.get("guided_eye_exercises", False))
-        tk.Checkbutton(eyef, text="Guided eye exercise routines", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._guided_eye_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-
-        # Breathing exercises
-        brf = tk.Frame(featf, bg=C_BG);  brf.pack(fill="x", pady=2)
-        self._breathing_var = tk.BooleanVar(value=self.config.get("breathing_exercises", False))
-        tk.Checkbutton(brf, text="Breathing exercises during breaks", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._breathing_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
-
-        # Desk exercises
-        deskf = tk.Frame(featf, bg=C_BG);  deskf.pack(fill="x", pady=2)
-        self._desk_var = tk.BooleanVar(value=self.config.get("desk_exercises", False))
-        tk.Checkbutton(deskf, text="Animated desk exercises", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._desk_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left")
+                  command=lambda: self._add_brk_row("12:00", 15, "New Break", select=True)).pack(side="left")
+        tk.Button(brkbf, text="× Remove", font=F_SMALL, bg=C_BTN_SEC, fg=C_TEXT_DIM,
+                  relief="flat", padx=10, pady=2, cursor="hand2",
+                  command=self._remove_brk_row).pack(side="left", padx=(6, 0))
+        tk.Label(brkbf, text="double-click a cell to edit", font=F_SMALL,
+                 fg=C_TEXT_MUT, bg=C_BG).pack(side="right")
+
+        # ══════ FEATURES — filled in by _build_features_section once the
+        # window is up, or as soon as the pointer/wheel reaches the scroll area ══════
+        self._features_frame = tk.Frame(scroll_frame, bg=C_BG);  self._features_frame.pack(fill="x")
+        self._features_built = False
+        self._features_after_id = self.root.after(150, self._build_features_section)
+        for seq in ("<Enter>", "<MouseWheel>"):
+            scroll_frame.bind(seq, self._build_features_section, add="+")
 
         # ══════ DEO MODE — built unconditionally but only ever shown (via
         # _deo_update_badge) while armed, so a child browsing Settings while
@@ -4256,72 +4451,73 @@ class ScreenBreakApp:
 
         self._deo_settings_frame = tk.Frame(scroll_frame, bg=C_BG)
         tk.Frame(self._deo_settings_frame, bg=C_TEXT_MUT, height=1).pack(fill="x", pady=(6, 6), **spad)
-        tk.Label(self._deo_settings_frame, text="Deo mode", font=(FONT, 11, "bold"),
+        tk.Label(self._deo_settings_frame, text="Deo mode", font=F_HEAD,
                  fg=C_DEO_ACC, bg=C_BG).pack(pady=(0, 4), **spad, anchor="w")
         deof = tk.Frame(self._deo_settings_frame, bg=C_BG);  deof.pack(fill="x", **spad)
 
+        # Text fields are backed by StringVars (read by _apply_settings, and
+        # refillable while the widgets stay disabled)
+        self._deo_vars = {key: tk.StringVar(value=str(self.config.get(key, DEFAULT_CONFIG[key])))
+                          for key in ("deo_allowed_start", "deo_allowed_end", "deo_daily_limit_minutes",
+                                      "deo_warn_ramp_minutes", "deo_next_activity", "deo_unlock_pin")}
+
         dwf = tk.Frame(deof, bg=C_BG);  dwf.pack(fill="x", pady=2)
-        tk.Label(dwf, text="Allowed", font=(FONT, 10), fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
-        self._deo_start_entry = tk.Entry(dwf, width=6, font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, relief="flat", justify="center")
+        tk.Label(dwf, text="Allowed", font=F_BODY, fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
+        self._deo_start_entry = tk.Entry(dwf, textvariable=self._deo_vars["deo_allowed_start"], width=6,
+                                         font=F_MONO, bg=C_CARD_IN, fg=C_TEXT, relief="flat", justify="center")
         self._deo_start_entry.pack(side="left", padx=4)
-        self._deo_start_entry.insert(0, self.config.get("deo_allowed_start", "09:00"))
         self._deo_start_entry.configure(state="disabled")
         self._deo_settings_widgets.append(self._deo_start_entry)
-        tk.Label(dwf, text="to", font=(FONT, 10), fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
-        self._deo_end_entry = tk.Entry(dwf, width=6, font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, relief="flat", justify="center")
+        tk.Label(dwf, text="to", font=F_BODY, fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
+        self._deo_end_entry = tk.Entry(dwf, textvariable=self._deo_vars["deo_allowed_end"], width=6,
+                                       font=F_MONO, bg=C_CARD_IN, fg=C_TEXT, relief="flat", justify="center")
         self._deo_end_entry.pack(side="left", padx=4)
-        self._deo_end_entry.insert(0, self.config.get("deo_allowed_end", "18:00"))
         self._deo_end_entry.configure(state="disabled")
         self._deo_settings_widgets.append(self._deo_end_entry)
 
         dlf = tk.Frame(deof, bg=C_BG);  dlf.pack(fill="x", pady=2)
-        tk.Label(dlf, text="Daily limit", font=(FONT, 10), fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
-        self._deo_limit_spin = tk.Spinbox(dlf, from_=5, to=600, width=5, font=(MONO, 10),
-            bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC, relief="flat", justify="center")
-        self._deo_limit_spin.pack(side="left", padx=4);  self._deo_limit_spin.delete(0, "end")
-        self._deo_limit_spin.insert(0, str(self.config.get("deo_daily_limit_minutes", 120)))
+        tk.Label(dlf, text="Daily limit", font=F_BODY, fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
+        self._deo_limit_spin = _spin(dlf, 5, 600, self._deo_vars["deo_daily_limit_minutes"], width=5)
+        self._deo_limit_spin.pack(side="left", padx=4)
         self._deo_limit_spin.configure(state="disabled")
         self._deo_settings_widgets.append(self._deo_limit_spin)
-        tk.Label(dlf, text="min", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
+        tk.Label(dlf, text="min", **LBL_MUT_KW).pack(side="left")
 
         drf = tk.Frame(deof, bg=C_BG);  drf.pack(fill="x", pady=2)
-        tk.Label(drf, text="Wind-down warning starts", font=(FONT, 10), fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
-        self._deo_ramp_spin = tk.Spinbox(drf, from_=1, to=30, width=4, font=(MONO, 10),
-            bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC, relief="flat", justify="center")
-        self._deo_ramp_spin.pack(side="left", padx=4);  self._deo_ramp_spin.delete(0, "end")
-        self._deo_ramp_spin.insert(0, str(self.config.get("deo_warn_ramp_minutes", 10)))
+        tk.Label(drf, text="Wind-down warning starts", font=F_BODY, fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
+        self._deo_ramp_spin = _spin(drf, 1, 30, self._deo_vars["deo_warn_ramp_minutes"])
+        self._deo_ramp_spin.pack(side="left", padx=4)
         self._deo_ramp_spin.configure(state="disabled")
         self._deo_settings_widgets.append(self._deo_ramp_spin)
-        tk.Label(drf, text="min before", font=(FONT, 10), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
+        tk.Label(drf, text="min before", **LBL_MUT_KW).pack(side="left")
 
         dmf = tk.Frame(deof, bg=C_BG);  dmf.pack(fill="x", pady=2)
         self._deo_mute_var = tk.BooleanVar(value=self.config.get("deo_mute_audio_on_lock", True))
-        deo_mute_cb = tk.Checkbutton(dmf, text="Mute system audio when a lockout starts", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._deo_mute_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM, state="disabled")
+        deo_mute_cb = tk.Checkbutton(dmf, text="Mute system audio when a lockout starts", variable=self._deo_mute_var,
+                       state="disabled", **CHK_KW)
         deo_mute_cb.pack(side="left")
         self._deo_settings_widgets.append(deo_mute_cb)
 
         dnf = tk.Frame(deof, bg=C_BG);  dnf.pack(fill="x", pady=2)
-        tk.Label(dnf, text="Next activity (optional)", font=(FONT, 10), fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
-        self._deo_next_entry = tk.Entry(dnf, width=22, font=(FONT, 10), bg=C_CARD_IN, fg=C_TEXT, relief="flat")
+        tk.Label(dnf, text="Next activity (optional)", font=F_BODY, fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
+        self._deo_next_entry = tk.Entry(dnf, textvariable=self._deo_vars["deo_next_activity"], width=22,
+                                        font=F_BODY, bg=C_CARD_IN, fg=C_TEXT, relief="flat")
         self._deo_next_entry.pack(side="left", padx=4)
-        self._deo_next_entry.insert(0, self.config.get("deo_next_activity", ""))
         self._deo_next_entry.configure(state="disabled")
         self._deo_settings_widgets.append(self._deo_next_entry)
 
         self._deo_pin_entry = None
         if DEO_PIN_UI_ENABLED:
             dpf = tk.Frame(deof, bg=C_BG);  dpf.pack(fill="x", pady=2)
-            tk.Label(dpf, text="Unlock PIN (optional)", font=(FONT, 10), fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
-            self._deo_pin_entry = tk.Entry(dpf, width=10, show="*", font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT, relief="flat")
+            tk.Label(dpf, text="Unlock PIN (optional)", font=F_BODY, fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
+            self._deo_pin_entry = tk.Entry(dpf, textvariable=self._deo_vars["deo_unlock_pin"], width=10, show="*",
+                                           font=F_MONO, bg=C_CARD_IN, fg=C_TEXT, relief="flat")
             self._deo_pin_entry.pack(side="left", padx=4)
-            self._deo_pin_entry.insert(0, self.config.get("deo_unlock_pin", ""))
             self._deo_pin_entry.configure(state="disabled")
             self._deo_settings_widgets.append(self._deo_pin_entry)
 
         dllf = tk.Frame(deof, bg=C_BG);  dllf.pack(fill="x", pady=2)
-        tk.Label(dllf, text="Lockdown level", font=(FONT, 10), fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
+        tk.Label(dllf, text="Lockdown level", font=F_BODY, fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
         self._deo_level_var = tk.StringVar(value=self.config.get("deo_lockdown_level", "maximum"))
         deo_level_menu = tk.OptionMenu(dllf, self._deo_level_var, "maximum", "strong", "overlay")
         deo_level_menu.configure(state="disabled")
@@ -4330,46 +4526,231 @@ class ScreenBreakApp:
 
         dhf = tk.Frame(deof, bg=C_BG);  dhf.pack(fill="x", pady=2)
         self._deo_hklm_var = tk.BooleanVar(value=self.config.get("deo_use_hklm", False))
-        deo_hklm_cb = tk.Checkbutton(dhf, text="Also apply machine-wide (needs admin)", font=(FONT, 10), fg=C_TEXT_DIM,
-                       bg=C_BG, variable=self._deo_hklm_var, selectcolor=C_CARD_IN,
-                       activebackground=C_BG, activeforeground=C_TEXT_DIM, state="disabled")
+        deo_hklm_cb = tk.Checkbutton(dhf, text="Also apply machine-wide (needs admin)", variable=self._deo_hklm_var,
+                       state="disabled", **CHK_KW)
         deo_hklm_cb.pack(side="left")
         self._deo_settings_widgets.append(deo_hklm_cb)
 
         self._deo_readout_var = tk.StringVar(value="")
-        tk.Label(deof, textvariable=self._deo_readout_var, font=(FONT, 9), fg=C_TEXT_MUT, bg=C_BG,
+        tk.Label(deof, textvariable=self._deo_readout_var, font=F_SMALL, fg=C_TEXT_MUT, bg=C_BG,
                  justify="left", wraplength=340).pack(fill="x", pady=(6, 0))
 
         self._deo_update_badge()  # syncs visibility of the "D" badge + this whole section
 
-        self._update_status()
+        self._tick_1hz()
         win.protocol("WM_DELETE_WINDOW", self._close_status)
 
-    def _add_brk_row(self, time_s="12:00", dur=15, title="New Break"):
-        rf = tk.Frame(self._brk_container, bg=C_BG)
-        rf.pack(fill="x", pady=1)
+    def _build_features_section(self, _event=None) -> None:
+        """Builds the Features part of the settings window into its placeholder
+        (deferred so the window opens without it). Idempotent."""
+        if self._features_built:
+            return
+        self._features_built = True
+        if self._features_after_id:
+            try: self.root.after_cancel(self._features_after_id)
+            except tk.TclError: pass
+            self._features_after_id = None
+        parent = self._features_frame
+        spad = dict(padx=20)
+        tk.Frame(parent, bg=C_TEXT_MUT, height=1).pack(fill="x", pady=(6, 6), **spad)
+        tk.Label(parent, text="Features", font=F_HEAD,
+                 fg=C_TEXT_DIM, bg=C_BG).pack(pady=(0, 4), **spad, anchor="w")
+
+        # One grid for the whole block; rows only get their own frame when
+        # they carry more than a single checkbox.
+        featf = tk.Frame(parent, bg=C_BG);  featf.pack(fill="x", **spad)
+        featf.columnconfigure(0, weight=1)
 
-        te = tk.Entry(rf, width=6, font=(MONO, 10), bg=C_CARD_IN, fg=C_TEXT,
-                      relief="flat", justify="center")
-        te.pack(side="left", padx=(0, 4));  te.insert(0, time_s)
+        for key, text, spin in _FEATURE_SPEC:
+            self._make_check_row(featf, key, text, spin)
 
-        ds = tk.Spinbox(rf, from_=0, to=180, width=4, font=(MONO, 10),
-                        bg=C_CARD_IN, fg=C_TEXT, buttonbackground=C_BTN_SEC,
-                        relief="flat", justify="center")
-        ds.pack(side="left", padx=(0, 2));  ds.delete(0, "end");  ds.insert(0, str(dur))
-        tk.Label(rf, text="m ", font=(FONT, 9), fg=C_TEXT_MUT, bg=C_BG).pack(side="left")
+        # --- Breathing circle widget ---
+        bw_header = tk.Label(featf, text="Breathing Circle", font=F_BOLD,
+                             fg=C_ACCENT2, bg=C_BG, anchor="w")
+        _grid_row(bw_header, sticky="ew", pady=(8, 2))
+
+        self._make_check_row(featf, "breathing_widget_enabled", "Breathing circle widget (always visible)")
+
+        self._breath_vars = {}
+        for specs, tail in _BREATH_SPIN_ROWS:
+            bwrow = tk.Frame(featf, bg=C_BG);  _grid_row(bwrow, pady=1, padx=(20, 0))
+            for label, name, lo, hi, width, step in specs:
+                tk.Label(bwrow, text=label, **LBL_MUT_KW).pack(side="left")
+                key = f"breathing_widget_{name}"
+                var = self._breath_vars[name] = tk.StringVar(
+                    value=_breath_spin_text(name, self.config.get(key, DEFAULT_CONFIG[key])))
+                _spin(bwrow, lo, hi, var, width, step, "%.1f" if isinstance(step, float) else None).pack(side="left")
+            tk.Label(bwrow, text=tail, **LBL_MUT_KW).pack(side="left")
+
+        bwrow3 = tk.Frame(featf, bg=C_BG);  _grid_row(bwrow3, pady=1, padx=(20, 0))
+        tk.Label(bwrow3, text="Bg:", **LBL_MUT_KW).pack(side="left")
+        self._vars["breathing_widget_bg"] = tk.StringVar(value=self.config.get("breathing_widget_bg", "transparent"))
+        for bg_name in ["transparent", "dark", "teal"]:
+            tk.Radiobutton(bwrow3, text=bg_name.capitalize(), variable=self._vars["breathing_widget_bg"], value=bg_name,
+                          font=F_SMALL, fg=C_TEXT_DIM, bg=C_BG, selectcolor=C_CARD_IN,
+                          activebackground=C_BG, activeforeground=C_TEXT_DIM).pack(side="left", padx=2)
 
-        ne = tk.Entry(rf, font=(FONT, 10), bg=C_CARD_IN, fg=C_TEXT, relief="flat")
-        ne.pack(side="left", fill="x", expand=True, padx=(0, 4));  ne.insert(0, title)
+        self._make_check_row(featf, "breathing_widget_click_through", "Click-through (Ctrl+drag to move)",
+                             pady=1, padx=(20, 0))
+
+        # Theme selection (applies instantly)
+        themef = tk.Frame(featf, bg=C_BG);  _grid_row(themef, pady=2)
+        tk.Label(themef, text="Theme:", font=F_BODY, fg=C_TEXT_DIM, bg=C_BG).pack(side="left")
+        self._vars["theme"] = tk.StringVar(value=self.config.get("theme", "nord"))
+
+        def apply_theme_now():
+            theme = self._vars["theme"].get()
+            apply_theme(theme)
+            self.config["theme"] = theme
+            save_config(self.config)
+            # Rebuild windows to show new colors (cached ones would keep the old theme)
+            for close in (self._close_stats_win, self._close_notes_win):
+                close()
+            for cache in (self._stats_win_cache, self._notes_win_cache, self._confirm_win, self._mini_win):
+                if cache is not None:
+                    try: cache.destroy()
+                    except tk.TclError: pass
+            self._stats_win_cache = None;  self._notes_win_cache = None;  self._confirm_win = None
+            self._mini_win = None;  self._mini_dismiss_id = None
+            if self._status_win:
+                # Themes reuse a colour for several roles, so a widget's role
+                # can't be read back from its colours: rebuild instead. Idle,
+                # not immediate: this runs inside a radiobutton of that window.
+                self._close_status(destroy=True)
+                self.root.after_idle(self._show_status_window)
 
-        row = {"frame": rf, "time": te, "dur": ds, "title": ne}
+        for theme_name in ["dark", "light", "nord"]:
+            tk.Radiobutton(themef, text=theme_name.capitalize(), variable=self._vars["theme"], value=theme_name,
+                          font=F_SMALL, fg=C_TEXT_DIM, bg=C_BG, selectcolor=C_CARD_IN,
+                          activebackground=C_BG, activeforeground=C_TEXT_DIM,
+                          command=apply_theme_now).pack(side="left", padx=4)
 
-        def rm():
-            rf.destroy();  self._brk_rows.remove(row)
-        tk.Button(rf, text="×", font=(FONT, 10, "bold"), bg=C_BG, fg=C_ACCENT,
-                  relief="flat", width=2, cursor="hand2", command=rm).pack(side="left")
+        # Hydration tracking
+        hydf = self._make_check_row(featf, "hydration_tracking", "Hydration reminders every",
+                                    ("hydration_reminder_interval", 15, 120, "min, goal:", 3))
+        self._make_spin(hydf, "hydration_goal", 1, 20, 2)
+        tk.Label(hydf, text=" glasses", **LBL_MUT_KW).pack(side="left")
 
-        self._brk_rows.append(row)
+        # Custom sound
+        csf = self._make_check_row(featf, "custom_sound_enabled", "Custom sound:", trailing=True)
+        self._sound_path_var = tk.StringVar(value=self.config.get("custom_sound_path", ""))
+        tk.Entry(csf, textvariable=self._sound_path_var, width=25, font=F_SMALL, bg=C_CARD_IN,
+                 fg=C_TEXT, relief="flat").pack(side="left", padx=2)
+
+        def browse_sound():
+            from tkinter import filedialog
+            path = filedialog.askopenfilename(filetypes=[("Audio", "*.mp3 *.wav *.ogg *.m4a"), ("All", "*.*")])
+            if path:
+                self._sound_path_var.set(path)
+
+        tk.Button(csf, text="...", font=F_SMALL, bg=C_BTN_SEC, fg=C_TEXT_DIM,
+                  relief="flat", padx=4, cursor="hand2", command=browse_sound).pack(side="left")
+
+        # Custom messages
+        cmf = self._make_check_row(featf, "use_custom_messages", "Use custom break messages", trailing=True)
+        tk.Button(cmf, text="Edit...", font=F_SMALL, bg=C_BTN_SEC, fg=C_TEXT_DIM,
+                  relief="flat", padx=6, cursor="hand2", command=self._show_message_editor).pack(side="left", padx=4)
+
+        # Exercise routines shown inside break overlays
+        for key, text, spin in _EXERCISE_SPEC:
+            self._make_check_row(featf, key, text, spin)
+
+    def _make_spin(self, parent: tk.Frame, key: str, lo: int, hi: int, width: int = 4) -> tk.Spinbox:
+        """Spinbox for an integer config value; its StringVar is kept in
+        self._spin_vars[key]."""
+        var = self._spin_vars[key] = tk.StringVar(value=str(self.config.get(key, DEFAULT_CONFIG[key])))
+        spin = _spin(parent, lo, hi, var, width);  spin.pack(side="left")
+        return spin
+
+    def _make_spin_row(self, parent: tk.Frame, label: str, key: str, lo: int, hi: int,
+                       unit: str, width: int = 4) -> tk.Spinbox:
+        """Label + Spinbox + unit row for an integer config value."""
+        row = tk.Frame(parent, bg=C_BG);  row.pack(fill="x", pady=2)
+        tk.Label(row, text=label, font=F_BODY, fg=C_TEXT_DIM,
+                 bg=C_BG, width=22, anchor="w").pack(side="left")
+        spin = self._make_spin(row, key, lo, hi, width)
+        tk.Label(row, text=f" {unit}", **LBL_MUT_KW).pack(side="left")
+        return spin
+
+    def _make_check_row(self, parent: tk.Frame, key: str, text: str, spin: Optional[tuple] = None,
+                        trailing: bool = False, pady: int = 2, padx: Any = 0) -> tk.Widget:
+        """Checkbutton for a boolean config value (var kept in self._vars[key])
+        on the next grid row of parent. A (key, lo, hi, unit, width) spinbox
+        or trailing=True wraps it in a row frame, returned so callers can
+        append more widgets."""
+        self._vars[key] = tk.BooleanVar(value=self.config.get(key, DEFAULT_CONFIG[key]))
+        if not (spin or trailing):
+            return _grid_row(tk.Checkbutton(parent, text=text, variable=self._vars[key], **CHK_KW),
+                             pady=pady, padx=padx)
+        row = tk.Frame(parent, bg=C_BG);  _grid_row(row, pady=pady, padx=padx)
+        tk.Checkbutton(row, text=text, variable=self._vars[key], **CHK_KW).pack(side="left")
+        if spin:
+            spin_key, lo, hi, unit, width = spin
+            self._make_spin(row, spin_key, lo, hi, width)
+            tk.Label(row, text=f" {unit}", **LBL_MUT_KW).pack(side="left")
+        return row
+
+    def _style_breaks_tree(self) -> None:
+        """(Re)applies the theme colours to the breaks Treeview style."""
+        style = ttk.Style(self.root)
+        style.configure("Breaks.Treeview", background=C_CARD_IN, fieldbackground=C_CARD_IN,
+                        foreground=C_TEXT, font=F_BODY, rowheight=22, borderwidth=0)
+        style.configure("Breaks.Treeview.Heading", background=C_BG, foreground=C_TEXT_MUT,
+                        font=F_SMALL, relief="flat")
+        style.map("Breaks.Treeview", background=[("selected", C_BTN_SEC)],
+                  foreground=[("selected", C_TEXT)])
+
+    def _add_brk_row(self, time_s="12:00", dur=15, title="New Break", select=False) -> str:
+        tv = self._brk_tv
+        iid = tv.insert("", "end", values=(time_s, dur, title))
+        tv.configure(height=max(6, len(tv.get_children())))
+        if select:
+            tv.selection_set(iid);  tv.see(iid)
+        return iid
+
+    def _remove_brk_row(self, _event=None) -> None:
+        tv = self._brk_tv
+        for iid in tv.selection():
+            tv.delete(iid)
+        tv.configure(height=max(6, len(tv.get_children())))
+
+    def _edit_brk_cell(self, event) -> Optional[str]:
+        """Overlays an Entry on the double-clicked break cell; Return or
+        focus-out writes it back, Escape discards."""
+        tv = self._brk_tv
+        iid, col = tv.identify_row(event.y), tv.identify_column(event.x)
+        bbox = tv.bbox(iid, col) if iid and col else None
+        if not bbox:
+            return None
+        if self._brk_edit_commit:
+            self._brk_edit_commit()
+        idx = int(col[1:]) - 1
+        x, y, w, h = bbox
+        ed = tk.Entry(tv, font=F_MONO if idx < 2 else (FONT, 10), bg=C_CARD_IN, fg=C_TEXT,
+                      insertbackground=C_TEXT, relief="flat", justify="center" if idx < 2 else "left")
+        ed.insert(0, str(tv.item(iid, "values")[idx]));  ed.select_range(0, "end")
+        ed.place(x=x, y=y, width=w, height=h);  ed.focus_set()
+
+        def close(save: bool) -> str:
+            if self._brk_edit_commit is not commit:
+                return "break"
+            self._brk_edit_commit = None
+            try:
+                if save and tv.exists(iid):
+                    values = list(tv.item(iid, "values"));  values[idx] = ed.get().strip()
+                    tv.item(iid, values=values)
+                ed.destroy()
+            except tk.TclError:
+                pass
+            return "break"
+
+        def commit(_event=None):
+            return close(True)
+        self._brk_edit_commit = commit
+        for seq in ("<Return>", "<KP_Enter>", "<FocusOut>"):
+            ed.bind(seq, commit)
+        ed.bind("<Escape>", lambda _e: close(False))
+        return "break"
 
     def _show_message_editor(self) -> None:
         """Show editor for custom break messages."""
@@ -4396,9 +4777,9 @@ class ScreenBreakApp:
         tk.Label(win, text="Custom Break Messages", font=(FONT, 13, "bold"),
                  fg=C_ACCENT2, bg=C_BG).pack(pady=(14, 8))
         tk.Label(win, text="One message per line. Shown randomly during breaks.",
-                 font=(FONT, 9), fg=C_TEXT_DIM, bg=C_BG).pack()
+                 font=F_SMALL, fg=C_TEXT_DIM, bg=C_BG).pack()
 
-        txt = tk.Text(win, font=(FONT, 10), bg=C_CARD, fg=C_TEXT,
+        txt = tk.Text(win, font=F_BODY, bg=C_CARD, fg=C_TEXT,
                       relief="flat", padx=10, pady=8, height=12, wrap="word")
         txt.pack(fill="both", expand=True, padx=14, pady=10)
 
@@ -4407,314 +4788,268 @@ class ScreenBreakApp:
         txt.insert("1.0", "\n".join(messages))
 
         def save_messages():
-            content = txt.get("1.0", "end").strip()
-            self.config["custom_messages"] = [m.strip() for m in content.split("\n") if m.strip()]
-            save_config(self.config)
+            messages = [m for m in (line.strip() for line in txt.get("1.0", "end").splitlines()) if m]
+            if messages != self.config.get("custom_messages", []):
+                self.config["custom_messages"] = messages
+                save_config(self.config)
             on_close()
 
         bf = tk.Frame(win, bg=C_BG)
         bf.pack(pady=(0, 14))
-        tk.Button(bf, text="Save", font=(FONT, 10), bg=C_BTN_PRI, fg=C_TEXT,
+        tk.Button(bf, text="Save", font=F_BODY, bg=C_BTN_PRI, fg=C_TEXT,
                   relief="flat", padx=16, pady=5, cursor="hand2", command=save_messages).pack(side="left", padx=4)
-        tk.Button(bf, text="Cancel", font=(FONT, 10), bg=C_BTN_SEC, fg=C_TEXT_DIM,
+        tk.Button(bf, text="Cancel", font=F_BODY, bg=C_BTN_SEC, fg=C_TEXT_DIM,
                   relief="flat", padx=12, pady=5, cursor="hand2", command=on_close).pack(side="left")
 
     def _apply_settings(self) -> None:
+        self._build_features_section()  # reads its widgets below
         try:
-            eye = int(self._eye_spin.get())
-            micro = int(self._micro_spin.get())
-            gap = int(self._gap_spin.get())
-            eye_dur = int(self._eye_dur_spin.get())
-            snooze = int(self._snooze_spin.get())
-            warn_sec = int(self._warn_spin.get())
-            idle_threshold = int(self._idle_spin.get())
-
-            if eye < 1 or micro < 1:
-                self._save_fb.set("⚠ Intervals must be ≥ 1 min");  return
-            if eye_dur < 5:
-                self._save_fb.set("⚠ Eye rest duration must be ≥ 5 sec");  return
-            if snooze < 1:
-                self._save_fb.set("⚠ Snooze must be ≥ 1 min");  return
-            if warn_sec < 10:
-                self._save_fb.set("⚠ Warning must be ≥ 10 sec");  return
-            if idle_threshold < 60:
-                self._save_fb.set("⚠ Idle threshold must be ≥ 60 sec");  return
-            if gap > eye:
+            spun = {}
+            for key, var in self._spin_vars.items():
+                try:
+                    spun[key] = int(var.get())
+                except ValueError:
+                    self._save_fb.set(f"⚠ {key.replace('_', ' ').capitalize()} must be a whole number");  return
+            for key, lo, msg in _SPIN_MINIMUMS:
+                if spun[key] < lo:
+                    self._save_fb.set(f"⚠ {msg}");  return
+            if spun["minimum_break_gap"] > spun["eye_rest_interval"]:
                 self._save_fb.set("⚠ Break gap must not exceed eye rest interval");  return
 
-            ws = self._ws_entry.get().strip()
-            we = self._we_entry.get().strip()
-            for ts in [ws, we]:
-                h, m = ts.split(":")
-                if not (0 <= int(h) <= 23 and 0 <= int(m) <= 59):
-                    raise ValueError("Invalid time")
+            ws = _norm_hhmm(self._ws_var.get().strip())
+            we = _norm_hhmm(self._we_var.get().strip())
 
+            if self._brk_edit_commit:
+                self._brk_edit_commit()
             breaks = []
-            for row in self._brk_rows:
-                t = row["time"].get().strip()
-                d = int(row["dur"].get())
-                n = row["title"].get().strip()
+            for iid in self._brk_tv.get_children():
+                # Treeview hands back numeric-looking cells as ints
+                t, d, n = (str(v).strip() for v in self._brk_tv.item(iid, "values"))
+                d = int(d)
                 if not t or not n:
                     continue
-                h, m = t.split(":")
-                if not (0 <= int(h) <= 23 and 0 <= int(m) <= 59):
-                    raise ValueError("Invalid break time")
-                breaks.append({"time": f"{int(h):02d}:{int(m):02d}", "duration": d, "title": n})
-
-            breaks.sort(key=lambda b: b["time"])
-
-            self.config["eye_rest_interval"] = eye
-            self.config["eye_rest_enabled"] = self._eye_rest_var.get()
-            self.config["micro_pause_interval"] = micro
-            self.config["micro_pause_enabled"] = self._micro_pause_var.get()
-            self.config["minimum_break_gap"] = gap
-            self.config["eye_rest_duration"] = eye_dur
-            self.config["snooze_minutes"] = snooze
-            self.config["warning_seconds"] = warn_sec
+                breaks.append({"time": _norm_hhmm(t), "duration": d, "title": n})
+
+            breaks.sort(key=itemgetter("time"))
+
+            before = deepcopy(self.config)
+            self.config.update(spun)
+            for key, var in self._vars.items():
+                self.config[key] = var.get()
             self.config["work_start"] = ws
             self.config["work_end"] = we
             self.config["breaks"] = breaks
-            # New feature settings
-            self.config["idle_detection"] = self._idle_var.get()
-            self.config["idle_threshold"] = idle_threshold
-            self.config["sound_enabled"] = self._sound_var.get()
-            self.config["show_exercises"] = self._exercises_var.get()
-            self.config["strict_mode"] = self._strict_var.get()
-            self.config["screen_dim"] = self._dim_var.get()
-            self.config["pomodoro_mode"] = self._pomo_var.get()
-            self.config["mini_reminders"] = self._mini_var.get()
-            try:
-                mini_interval = int(self._mini_spin.get())
-                if mini_interval >= 5:
-                    self.config["mini_reminder_interval"] = mini_interval
-            except ValueError:
-                pass
-
-            # Advanced settings
-            self.config["focus_mode"] = self._focus_var.get()
-            self.config["multi_monitor_overlay"] = self._multimon_var.get()
-            self.config["theme"] = self._theme_var.get()
-            self.config["hydration_tracking"] = self._hydration_var.get()
-            try:
-                self.config["hydration_reminder_interval"] = int(self._hydration_spin.get())
-                self.config["hydration_goal"] = int(self._hydration_goal_spin.get())
-            except ValueError:
-                pass
-            self.config["custom_sound_enabled"] = self._custom_sound_var.get()
-            self.config["custom_sound_path"] = self._sound_path_entry.get().strip()
-            self.config["use_custom_messages"] = self._custom_msg_var.get()
-            self.config["guided_eye_exercises"] = self._guided_eye_var.get()
-            self.config["breathing_exercises"] = self._breathing_var.get()
-            self.config["desk_exercises"] = self._desk_var.get()
-            try:
-                self.config["coast_margin_minutes"] = int(self._coast_spin.get())
-            except ValueError:
-                pass
-
-            # Widget & taskbar settings
-            self.config["show_floating_widget"] = self._widget_var.get()
-            self.config["show_in_taskbar"] = self._taskbar_var.get()
-            self.config["status_always_on_top"] = self._aot_var.get()
-            if self._status_win:
-                try:
-                    self._status_win.attributes("-topmost", self._aot_var.get())
-                except tk.TclError:
-                    pass
-
-            # Apply floating widget toggle live
-            if self._widget_var.get() and not self._widget_win:
-                self._create_floating_widget()
-            elif not self._widget_var.get() and self._widget_win:
-                self._destroy_floating_widget()
+            self.config["custom_sound_path"] = self._sound_path_var.get().strip()
 
             # Breathing circle widget settings
-            self.config["breathing_widget_enabled"] = self._breath_enabled_var.get()
-            for key, spin, lo in [
-                ("breathing_widget_inhale", self._breath_inhale_spin, 1),
-                ("breathing_widget_hold_in", self._breath_hold_in_spin, 0),
-                ("breathing_widget_exhale", self._breath_exhale_spin, 1),
-                ("breathing_widget_hold_out", self._breath_hold_out_spin, 0),
-            ]:
+            for name, var in self._breath_vars.items():
                 try:
-                    self.config[key] = max(lo, round(float(spin.get()), 1))
+                    self.config[f"breathing_widget_{name}"] = _breath_spin_value(name, var.get())
                 except ValueError:
                     pass
-            try:
-                self.config["breathing_widget_size"] = max(60, int(self._breath_size_spin.get()))
-            except ValueError:
-                pass
-            try:
-                self.config["breathing_widget_alpha"] = max(0.01, min(1.0, int(self._breath_alpha_spin.get()) / 100))
-            except ValueError:
-                pass
-            self.config["breathing_widget_bg"] = self._breath_bg_var.get()
-            self.config["breathing_widget_click_through"] = self._breath_ct_var.get()
 
             # Deo mode settings: only written if the hidden gesture has
             # authorized this session — the fields are disabled in the UI
             # until then anyway, but this is the actual enforcement point.
             if self._deo_settings_authenticated:
-                deo_start = self._deo_start_entry.get().strip()
-                deo_end = self._deo_end_entry.get().strip()
-                for ts in [deo_start, deo_end]:
-                    h, m = ts.split(":")
-                    if not (0 <= int(h) <= 23 and 0 <= int(m) <= 59):
-                        raise ValueError("Invalid Deo time")
+                dv = {key: var.get().strip() for key, var in self._deo_vars.items()}
+                deo_start = _norm_hhmm(dv["deo_allowed_start"])
+                deo_end = _norm_hhmm(dv["deo_allowed_end"])
                 self.config["deo_allowed_start"] = deo_start
                 self.config["deo_allowed_end"] = deo_end
                 try:
-                    deo_limit = int(self._deo_limit_spin.get())
+                    deo_limit = int(dv["deo_daily_limit_minutes"])
                     if deo_limit >= 1:
                         self.config["deo_daily_limit_minutes"] = deo_limit
                 except ValueError:
                     pass
                 try:
-                    deo_ramp = int(self._deo_ramp_spin.get())
+                    deo_ramp = int(dv["deo_warn_ramp_minutes"])
                     if deo_ramp >= 1:
                         self.config["deo_warn_ramp_minutes"] = deo_ramp
                 except ValueError:
                     pass
                 self.config["deo_mute_audio_on_lock"] = self._deo_mute_var.get()
-                self.config["deo_next_activity"] = self._deo_next_entry.get().strip()
+                self.config["deo_next_activity"] = dv["deo_next_activity"]
                 if DEO_PIN_UI_ENABLED and self._deo_pin_entry is not None:
-                    self.config["deo_unlock_pin"] = self._deo_pin_entry.get().strip()
+                    self.config["deo_unlock_pin"] = dv["deo_unlock_pin"]
                 self.config["deo_lockdown_level"] = self._deo_level_var.get()
                 self.config["deo_use_hklm"] = self._deo_hklm_var.get()
 
-            # Apply breathing widget toggle live (recreate to pick up size/bg/alpha changes)
-            if self._breath_enabled_var.get():
-                self._destroy_breathing_widget()
-                self._create_breathing_widget()
-            elif self._breath_win:
-                self._destroy_breathing_widget()
+            # Only act on what actually changed: an untouched Save writes
+            # nothing and leaves the timers running.
+            changed = {k for k, v in self.config.items() if k not in before or before[k] != v}
+            if not changed:
+                msg = "✓ No changes"
+            else:
+                if "status_always_on_top" in changed and self._status_win:
+                    try:
+                        self._status_win.attributes("-topmost", self.config["status_always_on_top"])
+                    except tk.TclError:
+                        pass
 
-            # Apply theme if changed
-            apply_theme(self.config["theme"])
+                # Apply floating widget toggle live
+                if self.config["show_floating_widget"] and not self._widget_win:
+                    self._create_floating_widget()
+                elif not self.config["show_floating_widget"] and self._widget_win:
+                    self._destroy_floating_widget()
 
-            save_config(self.config)
+                # Apply breathing widget live (recreate to pick up size/bg/alpha changes)
+                if any(k.startswith("breathing_widget_") for k in changed):
+                    self._destroy_breathing_widget()
+                    if self.config["breathing_widget_enabled"]:
+                        self._create_breathing_widget()
 
-            self._reset_all_timers()
+                if "theme" in changed:
+                    apply_theme(self.config["theme"])
 
-            self._save_fb.set("✓ Saved — timers reset")
-            def _clear_fb():
-                try: self._save_fb.set("")
-                except tk.TclError: pass
-            self._status_win.after(4000, _clear_fb)
+                # The idle monitor may be sleeping up to a minute on the old values
+                if {"idle_detection", "idle_threshold"} & changed:
+                    self._start_idle_monitor()
+
+                save_config(self.config)
+
+                if changed & _TIMER_KEYS:
+                    self._reset_all_timers();  msg = "✓ Saved — timers reset"
+                else:
+                    msg = "✓ Saved"
+
+            self._flash_save_fb(msg)
 
         except ValueError:
             self._save_fb.set("⚠ Invalid input — check numbers and time format")
 
     def _reset_defaults(self) -> None:
-        dc = json.loads(json.dumps(DEFAULT_CONFIG))
+        dc = deepcopy(DEFAULT_CONFIG)
         # Deo mode must never be touched by the ordinary "Reset to Defaults"
         # button — that would be a silent, discoverable way to disarm or
         # reconfigure it. It only ever changes via Alt+Shift+D + its own fields.
         for key in list(dc.keys()):
             if key.startswith("deo_"):
                 del dc[key]
-        self.config.update(dc);  save_config(self.config)
-
-        # Refresh interval widgets
-        self._eye_spin.delete(0, "end");  self._eye_spin.insert(0, str(dc["eye_rest_interval"]))
-        self._eye_rest_var.set(dc.get("eye_rest_enabled", True))
-        self._micro_spin.delete(0, "end");  self._micro_spin.insert(0, str(dc["micro_pause_interval"]))
-        self._micro_pause_var.set(dc.get("micro_pause_enabled", True))
-        self._gap_spin.delete(0, "end");  self._gap_spin.insert(0, str(dc["minimum_break_gap"]))
-        self._eye_dur_spin.delete(0, "end");  self._eye_dur_spin.insert(0, str(dc["eye_rest_duration"]))
-        self._snooze_spin.delete(0, "end");  self._snooze_spin.insert(0, str(dc["snooze_minutes"]))
-        self._warn_spin.delete(0, "end");  self._warn_spin.insert(0, str(dc["warning_seconds"]))
-        self._ws_entry.delete(0, "end");  self._ws_entry.insert(0, dc["work_start"])
-        self._we_entry.delete(0, "end");  self._we_entry.insert(0, dc["work_end"])
-        self._coast_spin.delete(0, "end");  self._coast_spin.insert(0, str(dc["coast_margin_minutes"]))
-
-        # Reset feature checkboxes
-        self._focus_var.set(dc["focus_mode"])
-        self._idle_var.set(dc["idle_detection"])
-        self._idle_spin.delete(0, "end");  self._idle_spin.insert(0, str(dc["idle_threshold"]))
-        self._sound_var.set(dc["sound_enabled"])
-        self._exercises_var.set(dc["show_exercises"])
-        self._strict_var.set(dc["strict_mode"])
-        self._dim_var.set(dc["screen_dim"])
-        self._pomo_var.set(dc["pomodoro_mode"])
-        self._mini_var.set(dc["mini_reminders"])
-        self._mini_spin.delete(0, "end");  self._mini_spin.insert(0, str(dc["mini_reminder_interval"]))
-        self._multimon_var.set(dc["multi_monitor_overlay"])
-        self._theme_var.set(dc["theme"])
-        self._hydration_var.set(dc["hydration_tracking"])
-        self._hydration_spin.delete(0, "end");  self._hydration_spin.insert(0, str(dc["hydration_reminder_interval"]))
-        self._hydration_goal_spin.delete(0, "end");  self._hydration_goal_spin.insert(0, str(dc["hydration_goal"]))
-        self._custom_sound_var.set(dc["custom_sound_enabled"])
-        self._sound_path_entry.delete(0, "end");  self._sound_path_entry.insert(0, dc["custom_sound_path"])
-        self._custom_msg_var.set(dc["use_custom_messages"])
-        self._guided_eye_var.set(dc["guided_eye_exercises"])
-        self._breathing_var.set(dc["breathing_exercises"])
-        self._desk_var.set(dc["desk_exercises"])
-        self._aot_var.set(dc["status_always_on_top"])
-        self._widget_var.set(dc["show_floating_widget"])
-        self._taskbar_var.set(dc["show_in_taskbar"])
-
-        # Reset breathing widget controls
-        self._breath_enabled_var.set(dc["breathing_widget_enabled"])
-        for spin, key in [
-            (self._breath_inhale_spin, "breathing_widget_inhale"),
-            (self._breath_hold_in_spin, "breathing_widget_hold_in"),
-            (self._breath_exhale_spin, "breathing_widget_exhale"),
-            (self._breath_hold_out_spin, "breathing_widget_hold_out"),
-        ]:
-            spin.delete(0, "end");  spin.insert(0, str(dc[key]))
-        self._breath_size_spin.delete(0, "end");  self._breath_size_spin.insert(0, str(dc["breathing_widget_size"]))
-        self._breath_alpha_spin.delete(0, "end");  self._breath_alpha_spin.insert(0, str(int(dc["breathing_widget_alpha"] * 100)))
-        self._breath_bg_var.set(dc["breathing_widget_bg"])
-        self._breath_ct_var.set(dc["breathing_widget_click_through"])
-        self._destroy_breathing_widget()
-        if dc["breathing_widget_enabled"]:
-            self._create_breathing_widget()
+        changed = {k for k, v in dc.items() if self.config.get(k) != v}
+        self.config.update(dc)
+        if changed:
+            save_config(self.config)
 
-        # Reset scheduled breaks
-        for row in list(self._brk_rows):
-            row["frame"].destroy()
-        self._brk_rows.clear()
-        for brk in dc["breaks"]:
-            self._add_brk_row(brk["time"], brk["duration"], brk["title"])
+        # All fields are refilled through their vars; Tk repaints them in
+        # the single idle pass flushed below.
+        self._load_settings_fields(dc)
+        if any(k.startswith("breathing_widget_") for k in changed):
+            self._destroy_breathing_widget()
+            if dc["breathing_widget_enabled"]:
+                self._create_breathing_widget()
+        if {"idle_detection", "idle_threshold"} & changed:
+            self._start_idle_monitor()
 
         self._reset_all_timers()
-        self._save_fb.set("✓ Reset to defaults")
-        def _clear_fb():
-            try: self._save_fb.set("")
-            except tk.TclError: pass
-        self._status_win.after(4000, _clear_fb)
-
-    def _close_status(self) -> None:
-        # Clean up mousewheel binding from settings scroll area
+        self._flash_save_fb("✓ Reset to defaults")
         try:
-            if self._scroll_bind_id:
-                self.root.unbind_all("<MouseWheel>")
-                self._scroll_bind_id = None
+            self._status_win.update_idletasks()
         except tk.TclError:
             pass
+
+    def _flash_save_fb(self, msg: str) -> None:
+        """Shows msg in the settings feedback label for 4 s, replacing any
+        clear still pending from an earlier save."""
+        if self._fb_after_id:
+            try: self.root.after_cancel(self._fb_after_id)
+            except tk.TclError: pass
+        self._save_fb.set(msg)
+        self._fb_after_id = self.root.after(4000, self._clear_save_fb)
+
+    def _clear_save_fb(self) -> None:
+        self._fb_after_id = None
+        try: self._save_fb.set("")
+        except tk.TclError: pass
+
+    def _load_settings_fields(self, dc: dict[str, Any]) -> None:
+        """Writes a config dict into the settings widgets (reset, or reopening
+        the cached window)."""
+        self._build_features_section()
+        # Spinboxes and checkboxes
+        for key, var in self._spin_vars.items():
+            var.set(str(dc[key]))
+        for key, var in self._vars.items():
+            var.set(dc[key])
+        self._ws_var.set(dc["work_start"]);  self._we_var.set(dc["work_end"])
+        self._sound_path_var.set(dc["custom_sound_path"])
+
+        # Breathing widget controls
+        for name, var in self._breath_vars.items():
+            var.set(_breath_spin_text(name, dc[f"breathing_widget_{name}"]))
+
+        # Scheduled breaks
+        self._brk_tv.delete(*self._brk_tv.get_children())
+        for brk in dc["breaks"]:
+            if isinstance(brk, dict) and "time" in brk and "duration" in brk and "title" in brk:
+                self._add_brk_row(brk["time"], brk["duration"], brk["title"])
+
+    def _deo_load_settings_fields(self) -> None:
+        """Resyncs the Deo fields with the saved config and re-locks them."""
+        for key, var in self._deo_vars.items():
+            var.set(str(self.config.get(key, DEFAULT_CONFIG[key])))
+        self._deo_mute_var.set(self.config.get("deo_mute_audio_on_lock", True))
+        self._deo_level_var.set(self.config.get("deo_lockdown_level", "maximum"))
+        self._deo_hklm_var.set(self.config.get("deo_use_hklm", False))
+        self._deo_set_settings_widgets_state("disabled")
+
+    def _close_status(self, destroy: bool = False) -> None:
+        if destroy and self._features_after_id:
+            try: self.root.after_cancel(self._features_after_id)
+            except tk.TclError: pass
+            self._features_after_id = None
         if self._status_win:
             try:
-                self._status_win.destroy()
+                if destroy:
+                    self._status_win.destroy()
+                else:
+                    self._status_win.withdraw()  # kept for a cheap reopen
             except tk.TclError:
-                pass
+                destroy = True
+            if destroy:
+                self._status_win_cache = None
             self._status_win = None
+            if not self._widget_win and self._1hz_after_id:
+                # Nothing left for the 1 Hz refresh to draw: stop it now
+                # rather than letting one more tick find that out
+                try: self.root.after_cancel(self._1hz_after_id)
+                except tk.TclError: pass
+                self._1hz_after_id = None
+        # A withdrawn window keeps its widgets, so re-lock the Deo fields here
+        # rather than relying on a fresh build to start them disabled.
         self._deo_settings_authenticated = False
+        self._deo_set_settings_widgets_state("disabled")
+        badge = getattr(self, "_deo_badge", None)
+        if badge is not None:
+            try:
+                badge.configure(fg=C_DEO_ACC)
+            except tk.TclError:
+                pass
         try:
             self.root.unbind_all("<KeyPress-Scroll_Lock>")
             self.root.unbind_all("<KeyPress-Pause>")
         except tk.TclError:
             pass
 
-    def _toggle_status_window(self) -> None:
-        """Toggle status window - close if open, open if closed."""
-        if self._status_win:
+    def _toggle_win(self, attr: str, show: Callable[[], None], close: Callable[[], None],
+                    beside_status: bool = False) -> None:
+        """Close the window held in self.<attr> if it's open, else show it
+        (optionally positioned beside the status window)."""
+        win = getattr(self, attr)
+        if win:
             try:
-                if self._status_win.winfo_exists():
-                    self._close_status()
-                    return
+                if win.winfo_exists():
+                    close();  return
             except tk.TclError:
-                self._status_win = None
-        self._show_status_window()
+                setattr(self, attr, None)
+        show()
+        if beside_status:
+            self._position_popup(getattr(self, attr))
+
+    def _toggle_status_window(self) -> None:
+        """Toggle status window - close if open, open if closed."""
+        self._toggle_win("_status_win", self._show_status_window, self._close_status)
 
     def _toggle_pause_ui(self) -> None:
         """Toggle pause and update UI button."""
@@ -4749,29 +5084,11 @@ class ScreenBreakApp:
 
     def _toggle_stats_win(self) -> None:
         """Toggle stats window - close if open, open positioned to side."""
-        if self._stats_win:
-            try:
-                if self._stats_win.winfo_exists():
-                    self._stats_win.destroy()
-                    self._stats_win = None
-                    return
-            except tk.TclError:
-                self._stats_win = None
-        self._show_stats_win()
-        self._position_popup(self._stats_win)
+        self._toggle_win("_stats_win", self._show_stats_win, self._close_stats_win, True)
 
     def _toggle_notes_win(self) -> None:
         """Toggle notes window - close if open, open positioned to side."""
-        if self._notes_win:
-            try:
-                if self._notes_win.winfo_exists():
-                    self._notes_win.destroy()
-                    self._notes_win = None
-                    return
-            except tk.TclError:
-                self._notes_win = None
-        self._show_notes_win()
-        self._position_popup(self._notes_win)
+        self._toggle_win("_notes_win", self._show_notes_win, self._close_notes_win, True)
 
     def _position_popup(self, popup_win) -> None:
         """Position popup window to the side of status window, away from screen edge."""
@@ -4800,121 +5117,140 @@ class ScreenBreakApp:
         except tk.TclError:
             pass
 
-    def _update_status(self) -> None:
-        if not self._status_win:
+    def _tick_1hz(self, _scheduled: bool = False) -> None:
+        """Once-a-second refresh shared by the status window and the floating
+        widget: works out the countdowns once and renders whichever is open.
+        Stops rescheduling when neither is; calling it restarts it."""
+        if not _scheduled:
+            self._1hz_deadline = time.monotonic()
+        if self._1hz_after_id:
+            try: self.root.after_cancel(self._1hz_after_id)
+            except tk.TclError: pass
+            self._1hz_after_id = None
+        for attr in ("_status_win", "_widget_win"):
+            win = getattr(self, attr)
+            try:
+                if win and not win.winfo_exists(): setattr(self, attr, None)
+            except tk.TclError:
+                setattr(self, attr, None)
+        if not self._status_win and not self._widget_win:
             return
+        st = self._countdown_state()
+        if self._status_win:
+            self._render_status_rows(st)
+        if self._widget_win:
+            self._render_floating_label(st)
+        # Aim at a fixed 1 s cadence so time spent here doesn't push every later
+        # refresh back; after a stall, skip ahead rather than firing a burst.
+        now_m = time.monotonic()
+        self._1hz_deadline += 1.0
+        if self._1hz_deadline < now_m:
+            self._1hz_deadline = now_m + 1.0
         try:
-            if not self._status_win.winfo_exists():
-                self._status_win = None
-                return
+            self._1hz_after_id = self.root.after(
+                int((self._1hz_deadline - now_m) * 1000), self._tick_1hz, True)
         except tk.TclError:
-            self._status_win = None
-            return
+            pass
 
-        now = datetime.datetime.now()
+    def _countdown_state(self) -> dict:
+        """Snapshot of the timers both countdown views display."""
+        now = datetime.datetime.now();  today = now.date()
         # When paused, use pause_started time for calculations (timers frozen)
         calc_time = self.pause_started if self.paused and self.pause_started else now
 
         # Check if outside work hours
-        t = now.time()
-        outside_hours = False
-        try:
-            ws = self._pt(self.config.get("work_start", "08:00"))
-            we = self._pt(self.config.get("work_end", "20:00"))
-            outside_hours = t < ws or t >= we
-        except ValueError:
-            pass
+        bounds = self._get_work_bounds()
+        outside_hours = bounds is not None and not (bounds[0] <= now.time() < bounds[1])
+
+        eye_rem = max(0, self.eye_iv * 60 - (calc_time - self.last_eye_rest).total_seconds())
+        micro_rem = max(0, self.micro_iv * 60 - (calc_time - self.last_micro).total_seconds())
+
+        # Soonest un-acked scheduled break: the status row also counts one just
+        # past (catch-up window), the widget only future ones.
+        nxt = nxt_future = None
+        rows = self._get_sched_rows(now);  acked = self.acked_today
+        start = bisect_right(rows, now - datetime.timedelta(seconds=60), key=itemgetter(3))
+        for key, title, dur, bt in rows[start:]:
+            if acked.get(key) == today: continue
+            diff = (bt - now).total_seconds()
+            if nxt is None:
+                dl = f" ({dur}m)" if dur > 0 else ""
+                nxt = (diff, f"{self._fmt12(key)} — {title}{dl}")
+            if diff > 0:
+                nxt_future = diff
+                break
+        presenting = self.config.get("focus_mode", True) and self.fullscreen_active
+        return {"outside_hours": outside_hours, "presenting": presenting,
+                "eye_rem": eye_rem, "micro_rem": micro_rem,
+                "next_sched": nxt, "next_sched_rem": nxt_future}
+
+    def _render_status_rows(self, st: dict) -> None:
+        outside_hours = st["outside_hours"]
 
         # ── Eye rest ──
         tv, dv = self._st_rows["eye"]
         if not self.config.get("eye_rest_enabled", True):
-            tv.set("OFF")
-            dv.set("disabled")
+            _sv(tv, "OFF")
+            _sv(dv, "disabled")
         elif outside_hours:
-            tv.set("—")
-            dv.set("outside work hours")
+            _sv(tv, "—")
+            _sv(dv, "outside work hours")
         elif self.idle:
-            tv.set("IDLE")
-            dv.set("timers paused — awaiting activity")
-        elif self.config.get("focus_mode", True) and self.fullscreen_active:
-            tv.set("PRESENTING")
-            dv.set("auto-paused — fullscreen detected")
+            _sv(tv, "IDLE")
+            _sv(dv, "timers paused — awaiting activity")
+        elif st["presenting"]:
+            _sv(tv, "PRESENTING")
+            _sv(dv, "auto-paused — fullscreen detected")
         elif self.paused:
-            tv.set("PAUSED")
-            dv.set(f"every {int(self.eye_iv)} min")
+            _sv(tv, "PAUSED")
+            _sv(dv, f"every {int(self.eye_iv)} min")
         else:
-            el = (calc_time - self.last_eye_rest).total_seconds()
-            rem = max(0, self.eye_iv * 60 - el)
-            m, s = divmod(int(rem), 60)
-            tv.set(f"{m:02d}:{s:02d}")
-            dv.set(f"every {int(self.eye_iv)} min")
+            _sv(tv, _mm_ss(*divmod(int(st["eye_rem"]), 60)))
+            _sv(dv, f"every {int(self.eye_iv)} min")
 
         # ── Micro-pause ──
         tv, dv = self._st_rows["micro"]
         if not self.config.get("micro_pause_enabled", True):
-            tv.set("OFF")
-            dv.set("disabled")
+            _sv(tv, "OFF")
+            _sv(dv, "disabled")
         elif outside_hours:
-            tv.set("—")
-            dv.set("outside work hours")
+            _sv(tv, "—")
+            _sv(dv, "outside work hours")
         elif self.idle:
-            tv.set("IDLE")
-            dv.set("timers paused — awaiting activity")
-        elif self.config.get("focus_mode", True) and self.fullscreen_active:
-            tv.set("PRESENTING")
-            dv.set("auto-paused — fullscreen detected")
+            _sv(tv, "IDLE")
+            _sv(dv, "timers paused — awaiting activity")
+        elif st["presenting"]:
+            _sv(tv, "PRESENTING")
+            _sv(dv, "auto-paused — fullscreen detected")
         elif self.paused:
-            tv.set("PAUSED")
-            dv.set(f"every {int(self.micro_iv)} min")
+            _sv(tv, "PAUSED")
+            _sv(dv, f"every {int(self.micro_iv)} min")
         else:
-            el = (calc_time - self.last_micro).total_seconds()
-            rem = max(0, self.micro_iv * 60 - el)
-            m, s = divmod(int(rem), 60)
-            tv.set(f"{m:02d}:{s:02d}")
-            dv.set(f"every {int(self.micro_iv)} min")
+            _sv(tv, _mm_ss(*divmod(int(st["micro_rem"]), 60)))
+            _sv(dv, f"every {int(self.micro_iv)} min")
 
         # ── Next scheduled break ──
         tv, dv = self._st_rows["sched"]
         if outside_hours:
-            tv.set("—")
-            dv.set("outside work hours")
+            _sv(tv, "—")
+            _sv(dv, "outside work hours")
         elif self.paused:
-            tv.set("PAUSED")
+            _sv(tv, "PAUSED")
             # Still show which break is next, just paused
-            nxt = None
-            for brk in self.config.get("breaks", []):
-                key = brk["time"]
-                if self.acked_today.get(key) == now.date(): continue
-                try:
-                    bt = datetime.datetime.combine(now.date(), self._pt(brk["time"]))
-                except (ValueError, AttributeError): continue
-                diff = (bt - now).total_seconds()
-                if diff > -60 and (nxt is None or diff < nxt[0]):
-                    dl = f" ({brk['duration']}m)" if brk["duration"] > 0 else ""
-                    nxt = (diff, f"{self._fmt12(brk['time'])} — {brk['title']}{dl}")
-            dv.set(nxt[1] if nxt else "no more scheduled breaks today")
+            nxt = st["next_sched"]
+            _sv(dv, nxt[1] if nxt else "no more scheduled breaks today")
         elif self.warning_up and self.pending_break:
-            tv.set(f"00:{self._warn_rem:02d}")
-            dv.set("⏳ break imminent")
+            _sv(tv, _mm_ss(*divmod(self._warn_rem, 60)))
+            _sv(dv, "⏳ break imminent")
         else:
-            nxt = None
-            for brk in self.config.get("breaks", []):
-                key = brk["time"]
-                if self.acked_today.get(key) == now.date(): continue
-                try:
-                    bt = datetime.datetime.combine(now.date(), self._pt(brk["time"]))
-                except (ValueError, AttributeError): continue
-                diff = (bt - now).total_seconds()
-                if diff > -60 and (nxt is None or diff < nxt[0]):
-                    dl = f" ({brk['duration']}m)" if brk["duration"] > 0 else ""
-                    nxt = (diff, f"{self._fmt12(brk['time'])} — {brk['title']}{dl}")
+            nxt = st["next_sched"]
             if nxt and nxt[0] > 0:
                 m, s = divmod(int(nxt[0]), 60)
                 h, m = divmod(m, 60)
-                tv.set(f"{h}h {m:02d}m" if h > 0 else f"{m:02d}:{s:02d}")
-                dv.set(nxt[1])
+                _sv(tv, f"{h}h {_TWOD[m]}m" if h > 0 else _mm_ss(m, s))
+                _sv(dv, nxt[1])
             else:
-                tv.set("—");  dv.set("no more scheduled breaks today")
+                _sv(tv, "—");  _sv(dv, "no more scheduled breaks today")
 
         # Update control buttons
         self._update_pause_btn()
@@ -4922,11 +5258,6 @@ class ScreenBreakApp:
         if self.config.get("deo_mode_enabled", False):
             self._deo_update_readout()
 
-        try:
-            self._status_win.after(1000, self._update_status)
-        except tk.TclError:
-            self._status_win = None
-
     # ━━━ Startup ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
     def _show_startup(self):
@@ -5022,13 +5353,13 @@ class ScreenBreakApp:
         if pos and isinstance(pos, list) and len(pos) == 2:
             x, y = int(pos[0]), int(pos[1])
             # Clamp to screen bounds
-            x = max(0, min(x, sw - w))
-            y = max(0, min(y, sh - h))
+            x, y = _clamp(x, 0, sw - w), _clamp(y, 0, sh - h)
         else:
             x, y = sw - w - 20, sh - h - 60
         win.geometry(f"{w}x{h}+{x}+{y}")
 
-        lbl = tk.Label(win, text="Screen Break", font=(FONT, 9, "bold"),
+        self._widget_tv = tk.StringVar(win, value="Screen Break")
+        lbl = tk.Label(win, textvariable=self._widget_tv, font=(FONT, 9, "bold"),
                        fg="#ffffff", bg=C_ACCENT, cursor="hand2", padx=8)
         lbl.pack(fill="both", expand=True)
 
@@ -5043,7 +5374,20 @@ class ScreenBreakApp:
             for btn in RIGHT_CLICK:
                 widget.bind(btn, self._widget_menu)
 
-        self._update_floating_widget()
+        self._tick_1hz()
+
+    def _queue_move(self, win: tk.Toplevel, x: int, y: int) -> None:
+        """Coalesce drag motion: only the latest position per window is
+        applied, once, when Tk next goes idle."""
+        if not self._pending_moves:
+            self.root.after_idle(self._flush_moves)
+        self._pending_moves[win] = (x, y)
+
+    def _flush_moves(self) -> None:
+        moves, self._pending_moves = self._pending_moves, {}
+        for win, (x, y) in moves.items():
+            try: win.geometry(f"+{x}+{y}")
+            except tk.TclError: pass
 
     def _widget_press(self, event) -> None:
         """Record mouse position for drag."""
@@ -5055,12 +5399,13 @@ class ScreenBreakApp:
         """Move widget with mouse."""
         x = event.x_root - self._widget_drag_x
         y = event.y_root - self._widget_drag_y
-        self._widget_win.geometry(f"+{x}+{y}")
+        self._queue_move(self._widget_win, x, y)
         self._widget_dragged = True
 
     def _widget_release(self, event) -> None:
         """On release: save position if dragged, else open status window."""
         if self._widget_dragged:
+            self._flush_moves()
             # Save position
             x = self._widget_win.winfo_x()
             y = self._widget_win.winfo_y()
@@ -5089,83 +5434,38 @@ class ScreenBreakApp:
         if hasattr(self, '_pause_btn') and self._pause_btn:
             self._update_pause_btn()
 
-    def _update_floating_widget(self) -> None:
-        """Refresh the widget countdown every second."""
-        if not self._widget_win:
-            return
-        try:
-            if not self._widget_win.winfo_exists():
-                self._widget_win = None
-                return
-        except tk.TclError:
-            self._widget_win = None
-            return
-
-        now = datetime.datetime.now()
-        calc_time = self.pause_started if self.paused and self.pause_started else now
-
-        # Check work hours
-        t = now.time()
-        outside_hours = False
-        try:
-            ws = self._pt(self.config.get("work_start", "08:00"))
-            we = self._pt(self.config.get("work_end", "20:00"))
-            outside_hours = t < ws or t >= we
-        except ValueError:
-            pass
-
+    def _render_floating_label(self, st: dict) -> None:
+        """Show the soonest countdown on the widget."""
         # Determine text
-        if outside_hours:
+        if st["outside_hours"]:
             text = "Off hours"
         elif self.idle:
             text = "IDLE"
-        elif self.config.get("focus_mode", True) and self.fullscreen_active:
+        elif st["presenting"]:
             text = "Presenting"
         elif self.paused:
             text = "PAUSED"
         else:
             # Find the soonest countdown
-            best_label = "Eye"
-            el = (calc_time - self.last_eye_rest).total_seconds()
-            best_rem = max(0, self.eye_iv * 60 - el)
-
-            el = (calc_time - self.last_micro).total_seconds()
-            micro_rem = max(0, self.micro_iv * 60 - el)
-            if micro_rem < best_rem:
-                best_rem = micro_rem
-                best_label = "Micro"
-
-            # Check scheduled breaks
-            for brk in self.config.get("breaks", []):
-                key = brk["time"]
-                if self.acked_today.get(key) == now.date():
-                    continue
-                try:
-                    bt = datetime.datetime.combine(now.date(), self._pt(brk["time"]))
-                except (ValueError, AttributeError):
-                    continue
-                diff = (bt - now).total_seconds()
-                if diff > 0 and diff < best_rem:
-                    best_rem = diff
-                    best_label = "Break"
+            best_label, best_rem = "Eye", st["eye_rem"]
+            if st["micro_rem"] < best_rem:
+                best_label, best_rem = "Micro", st["micro_rem"]
+            sched_rem = st["next_sched_rem"]
+            if sched_rem is not None and sched_rem < best_rem:
+                best_label, best_rem = "Break", sched_rem
 
             m, s = divmod(int(best_rem), 60)
             h, m2 = divmod(m, 60)
             if h > 0:
-                text = f"{best_label} {h}h {m2:02d}m"
+                text = f"{best_label} {h}h {_TWOD[m2]}m"
             else:
-                text = f"{best_label} {m:02d}:{s:02d}"
+                text = f"{best_label} {_mm_ss(m, s)}"
 
         try:
-            self._widget_label.config(text=text)
+            _sv(self._widget_tv, text)
         except tk.TclError:
             pass
 
-        try:
-            self._widget_win.after(1000, self._update_floating_widget)
-        except tk.TclError:
-            self._widget_win = None
-
     def _destroy_floating_widget(self) -> None:
         """Tear down the floating widget."""
         if self._widget_win:
@@ -5174,7 +5474,7 @@ class ScreenBreakApp:
             except tk.TclError:
                 pass
             self._widget_win = None
-            self._widget_label = None
+            self._widget_label = None;  self._widget_tv = None
 
     # ━━━ Breathing Circle Widget ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
@@ -5189,7 +5489,12 @@ class ScreenBreakApp:
         (20, 184, 166),  #            #14b8a6
         (45, 212, 191),  # core       #2dd4bf
     ]
+    # The same bands as a BGRA palette for the layered path: index 0 is fully
+    # transparent, ring i is index i + 1. Every pixel is either opaque or
+    # (0,0,0,0), so premultiplying is the identity and B,G,R order is all it takes.
+    _BREATH_BGRA_PALETTE = [0, 0, 0, 0] + [c for r, g, b in _BREATH_TEAL for c in (b, g, r, 255)]
     _BREATH_RING_STEP = 0.18  # radius multiplier increment per ring
+    _BREATH_CACHE_BYTES = 64 * 1024 * 1024  # memory cap for cached animation frames
 
     def _create_breathing_widget(self) -> None:
         """Create an always-on-top breathing circle widget."""
@@ -5255,8 +5560,7 @@ class ScreenBreakApp:
         sh = win.winfo_screenheight()
         if pos and isinstance(pos, list) and len(pos) == 2:
             x, y = int(pos[0]), int(pos[1])
-            x = max(0, min(x, sw - win_w))
-            y = max(0, min(y, sh - win_h))
+            x, y = _clamp(x, 0, sw - win_w), _clamp(y, 0, sh - win_h)
         else:
             x, y = max(0, sw - win_w - 20), max(0, sh - win_h - 100)
         win.geometry(f"{win_w}x{win_h}+{x}+{y}")
@@ -5273,6 +5577,7 @@ class ScreenBreakApp:
         self._breath_img_id = canvas.create_image(win_w // 2, win_h // 2, anchor="center")
         self._breath_win_w = win_w
         self._breath_win_h = win_h
+        self._breath_reset_frames()
 
         for widget in (win, canvas):
             widget.bind("<Button-1>", self._breath_press)
@@ -5304,14 +5609,24 @@ class ScreenBreakApp:
             except Exception:
                 self._breath_use_layered = False
 
+        # Settings the animation reads every frame. Changing any breathing_widget_*
+        # key rebuilds the widget, so they can't go stale.
+        self._breath_click_through = bool(self.config.get("breathing_widget_click_through", True))
+        # Integer-ns ends of inhale / hold-in / exhale / hold-out within one cycle
+        ends, t_ns = [], 0
+        for key, lo, dflt in (("inhale", 1.0, 4), ("hold_in", 0.0, 0),
+                              ("exhale", 1.0, 8), ("hold_out", 0.0, 0)):
+            t_ns += int(max(lo, float(self.config.get(f"breathing_widget_{key}", dflt))) * 1e9)
+            ends.append(t_ns)
+        self._breath_phase_ends = tuple(ends)
+
         # Click-through (Windows only — no macOS/Linux equivalent)
-        if IS_WIN and self._breath_hwnd and self.config.get("breathing_widget_click_through", True):
+        if IS_WIN and self._breath_hwnd and self._breath_click_through:
             self._breath_set_click_through(True)
 
+        self._breath_pack = self._breath_cache_mode(win_w, win_h)
         self._breath_running = True
         self._animate_breathing_widget()
-        if IS_WIN:
-            self._breath_poll_ctrl()
 
     def _breath_set_click_through(self, enable: bool) -> None:
         """Toggle WS_EX_TRANSPARENT on the breathing widget (Windows only)."""
@@ -5331,35 +5646,26 @@ class ScreenBreakApp:
         except Exception:
             pass
 
-    def _breath_poll_ctrl(self) -> None:
-        """Poll Ctrl key independently of animation (Windows only)."""
-        if not IS_WIN or not self._breath_win or not self._breath_hwnd:
+    def _breath_check_ctrl(self) -> None:
+        """Holding Ctrl lifts click-through so the widget can be dragged or
+        right-clicked (Windows only). Checked from the animation frame."""
+        if not IS_WIN or not self._breath_hwnd or not self._breath_click_through:
             return
         try:
-            if not self._breath_win.winfo_exists():
-                return
-        except tk.TclError:
-            return
-        if self.config.get("breathing_widget_click_through", True):
-            try:
-                VK_CONTROL = 0x11
-                ctrl_held = (ctypes.windll.user32.GetAsyncKeyState(VK_CONTROL) & 0x8000) != 0
-                if ctrl_held and self._breath_ct_active:
-                    self._breath_set_click_through(False)
-                elif not ctrl_held and not self._breath_ct_active and not self._breath_dragged:
-                    self._breath_set_click_through(True)
-            except Exception:
-                pass
-        try:
-            self._breath_win.after(50, self._breath_poll_ctrl)
-        except tk.TclError:
+            VK_CONTROL = 0x11
+            ctrl_held = (ctypes.windll.user32.GetAsyncKeyState(VK_CONTROL) & 0x8000) != 0
+            if ctrl_held and self._breath_ct_active:
+                self._breath_set_click_through(False)
+            elif not ctrl_held and not self._breath_ct_active and not self._breath_dragged:
+                self._breath_set_click_through(True)
+        except Exception:
             pass
 
     def _breath_draw_rings(self, img_w: int, img_h: int, core_r: float,
                            bg: tuple[int, ...]) -> Image.Image:
-        """Draw the 6 teal rings at a given resolution on the specified background."""
-        img = Image.new("RGB", (img_w, img_h), bg)
-        draw = ImageDraw.Draw(img)
+        """Draw the 6 teal rings at a given resolution on the specified background.
+        Returns the shared scratch image: copy or convert it before the next call."""
+        img, draw = self._breath_scratch_image("RGB", (img_w, img_h), tuple(bg))
         cx, cy = img_w // 2, img_h // 2
         n = len(self._BREATH_TEAL)
         step = self._BREATH_RING_STEP
@@ -5369,6 +5675,76 @@ class ScreenBreakApp:
             draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=rgb)
         return img
 
+    def _breath_ring_indices(self, w: int, h: int, core_r: float,
+                             palette: list[int], rawmode: str) -> Image.Image:
+        """Paletted image of the rings: index 0 is the background, ring i is
+        index i + 1. Filling one byte per pixel and colouring through the
+        palette in a single convert beats drawing RGBA and swizzling channels."""
+        img, draw = self._breath_scratch_image("P", (w, h), 0)
+        img.putpalette(palette, rawmode)
+        cx, cy = w // 2, h // 2
+        n = len(self._BREATH_TEAL)
+        step = self._BREATH_RING_STEP
+        for i in range(n):
+            r = core_r * (1.0 + (n - 1 - i) * step)
+            draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=i + 1)
+        return img
+
+    def _breath_scratch_image(self, mode: str, size: tuple[int, int],
+                              fill: Any) -> tuple[Image.Image, ImageDraw.ImageDraw]:
+        """A drawing surface cleared to fill, kept between renders so cache
+        misses don't allocate (and page in) a fresh full-size image each time."""
+        img, draw = self._breath_scratch or (None, None)
+        if img is None or img.mode != mode or img.size != size:
+            img = Image.new(mode, size, fill);  draw = ImageDraw.Draw(img)
+            self._breath_scratch = (img, draw)
+        else:
+            img.paste(fill, (0, 0) + size)
+        return img, draw
+
+    def _breath_cache_mode(self, w: int, h: int) -> Optional[str]:
+        """How _breath_frame stores frames for this widget: "raw" bytes when
+        every radius of the inhale/exhale sweep fits in _BREATH_CACHE_BYTES,
+        otherwise "zlib" on the canvas path and None (no cache) on the layered
+        one. Measured per changed frame at 1000 px: the canvas render takes
+        ~17 ms against ~3 ms to decompress, but the paletted layered render
+        (~2 ms) is no slower than decompressing its 4 MB frame."""
+        n = len(self._BREATH_TEAL)
+        max_r = min(w, h) / 2 / (1.0 + (n - 1) * self._BREATH_RING_STEP)
+        radii = int(max_r * 0.67) + 2  # whole-pixel radii from min_r to max_r
+        if radii * w * h * (4 if self._breath_use_layered else 3) <= self._BREATH_CACHE_BYTES:
+            return "raw"
+        return None if self._breath_use_layered else "zlib"
+
+    def _breath_frame(self, rkey: int, render: Callable[[int], bytes]) -> bytes:
+        """Return the frame bytes for a quantized radius, rendering them on a
+        miss. Storage follows _breath_pack; the LRU is capped by
+        _BREATH_CACHE_BYTES of stored bytes."""
+        pack = self._breath_pack
+        if pack is None:
+            return render(rkey)
+        cache = self._breath_frame_cache
+        stored = cache.get(rkey)
+        if stored is not None:
+            cache.move_to_end(rkey)
+            return zlib.decompress(stored) if pack == "zlib" else stored
+        frame = render(rkey)
+        stored = cache[rkey] = zlib.compress(frame, 1) if pack == "zlib" else frame
+        self._breath_cache_bytes += len(stored)
+        while self._breath_cache_bytes > self._BREATH_CACHE_BYTES and len(cache) > 1:
+            self._breath_cache_bytes -= len(cache.popitem(last=False)[1])
+        return frame
+
+    def _breath_reset_frames(self) -> None:
+        """Drop cached frames (size or background changed)."""
+        self._breath_frame_cache.clear();  self._breath_cache_bytes = 0
+        self._breath_last_key = None
+
+    def _breath_render_layered(self, w: int, h: int, core_r: float) -> bytes:
+        """Premultiplied BGRA bytes of the rings on a transparent background."""
+        img = self._breath_ring_indices(w, h, core_r, self._BREATH_BGRA_PALETTE, "RGBA")
+        return img.convert("RGBA").tobytes()
+
     def _breath_init_gdi(self, w: int, h: int) -> bool:
         """Create and cache GDI resources for layered window rendering."""
         self._breath_free_gdi()
@@ -5402,6 +5778,18 @@ class ScreenBreakApp:
             self._breath_hbmp = hbmp
             self._breath_ppv = ppv
             self._breath_old_bmp = gdi32.SelectObject(hdc_mem, hbmp)
+            alpha_byte = max(1, min(255, int(
+                self.config.get("breathing_widget_alpha", 0.10) * 255)))
+            ulw = user32.UpdateLayeredWindow
+            if not ulw.argtypes:  # declared once so ctypes skips per-call type inference
+                from ctypes import wintypes
+                ulw.argtypes = [wintypes.HWND, wintypes.HDC, ctypes.c_void_p, ctypes.c_void_p,
+                                wintypes.HDC, ctypes.c_void_p, wintypes.DWORD, ctypes.c_void_p,
+                                wintypes.DWORD]
+                ulw.restype = wintypes.BOOL
+            self._breath_ulw_args = (ulw,
+                                     (ctypes.c_long * 2)(w, h), (ctypes.c_long * 2)(0, 0),
+                                     (ctypes.c_ubyte * 4)(0, 0, alpha_byte, 1))
             return True
         except Exception:
             return False
@@ -5426,6 +5814,7 @@ class ScreenBreakApp:
         self._breath_hbmp = None
         self._breath_ppv = None
         self._breath_old_bmp = None
+        self._breath_ulw_args = None
 
     def _breath_update_layered_window(self, bgra_bytes: bytes, w: int, h: int) -> None:
         """Send BGRA pixels to the window via UpdateLayeredWindow (cached GDI)."""
@@ -5436,49 +5825,43 @@ class ScreenBreakApp:
                 return
         try:
             ctypes.memmove(self._breath_ppv, bgra_bytes, len(bgra_bytes))
-
-            alpha_byte = max(1, min(255, int(
-                self.config.get("breathing_widget_alpha", 0.10) * 255)))
-            blend = (ctypes.c_ubyte * 4)(0, 0, alpha_byte, 1)
-            sz = (ctypes.c_long * 2)(w, h)
-            pt_src = (ctypes.c_long * 2)(0, 0)
-
-            ctypes.windll.user32.UpdateLayeredWindow(
-                self._breath_hwnd, self._breath_hdc_screen, None, sz,
-                self._breath_hdc_mem, pt_src, 0, blend, 2)
+            ulw, sz, pt_src, blend = self._breath_ulw_args
+            ulw(self._breath_hwnd, self._breath_hdc_screen, None, sz,
+                self._breath_hdc_mem, pt_src, 0, blend, 2)  # ULW_ALPHA
         except Exception:
             pass
 
+    @_tk_alive("_breath_win")
     def _animate_breathing_widget(self) -> None:
-        """60fps animation — 6-ring teal circle, per-pixel alpha or canvas rendering."""
-        if not self._breath_running or not self._breath_win:
-            return
-        try:
-            if not self._breath_win.winfo_exists():
-                self._breath_win = None
-                return
-        except tk.TclError:
-            self._breath_win = None
+        """60fps animation — 6-ring teal circle, per-pixel alpha or canvas rendering.
+        While paused it ticks slowly only if the Windows Ctrl check needs it."""
+        self._breath_after_id = None
+        self._breath_check_ctrl()
+        if not self._breath_running:
+            # Elsewhere the loop stops; _breath_toggle_pause restarts it on resume
+            if IS_WIN and self._breath_hwnd and self._breath_click_through:
+                try:
+                    self._breath_after_id = self._breath_win.after(50, self._animate_breathing_widget)
+                except tk.TclError:
+                    pass
             return
 
+        frame_start = time.perf_counter()
+
         # --- Compute breath factor (0=contracted, 1=expanded) ---
-        inhale_t = max(1.0, float(self.config.get("breathing_widget_inhale", 4)))
-        hold_in_t = max(0.0, float(self.config.get("breathing_widget_hold_in", 0)))
-        exhale_t = max(1.0, float(self.config.get("breathing_widget_exhale", 8)))
-        hold_out_t = max(0.0, float(self.config.get("breathing_widget_hold_out", 0)))
-        total_cycle = inhale_t + hold_in_t + exhale_t + hold_out_t
-
-        t = time.time() % total_cycle
-        if t < inhale_t:
-            progress = t / inhale_t
-            breath = 0.5 - 0.5 * math.cos(math.pi * progress)
-        elif t < inhale_t + hold_in_t:
-            breath = 1.0
-        elif t < inhale_t + hold_in_t + exhale_t:
-            progress = (t - inhale_t - hold_in_t) / exhale_t
+        # Integer nanoseconds: exact phase at any uptime, no float modulo
+        inhale_end, hold_in_end, exhale_end, cycle = self._breath_phase_ends
+        t = time.time_ns() % cycle
+        hold_left = 0.0  # seconds until a hold phase ends; the circle is static till then
+        if t < inhale_end:
+            breath = 0.5 - 0.5 * math.cos(math.pi * t / inhale_end)
+        elif t < hold_in_end:
+            breath = 1.0;  hold_left = (hold_in_end - t) / 1e9
+        elif t < exhale_end:
+            progress = (t - hold_in_end) / (exhale_end - hold_in_end)
             breath = 0.5 + 0.5 * math.cos(math.pi * progress)
         else:
-            breath = 0.0
+            breath = 0.0;  hold_left = (cycle - t) / 1e9
 
         # --- Common geometry ---
         win_w = self._breath_win_w
@@ -5492,22 +5875,11 @@ class ScreenBreakApp:
             half = min(win_w, win_h) / 2
             max_r = (half - 4) / outermost_factor
             min_r = max_r * 0.33
-            core_r = min_r + (max_r - min_r) * breath
-
-            # Draw rings directly on transparent RGBA
-            rgba = Image.new("RGBA", (win_w, win_h), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(rgba)
-            cx, cy = win_w // 2, win_h // 2
-            for i, rgb in enumerate(self._BREATH_TEAL):
-                factor = 1.0 + (n - 1 - i) * step
-                r = core_r * factor
-                draw.ellipse([cx - r, cy - r, cx + r, cy + r], fill=rgb + (255,))
-
-            # All pixels are either (R,G,B,255) or (0,0,0,0) so premultiply
-            # is identity — just swap R<->B for BGRA byte order
-            r_ch, g_ch, b_ch, a_ch = rgba.split()
-            bgra = Image.merge("RGBA", (b_ch, g_ch, r_ch, a_ch))
-            self._breath_update_layered_window(bgra.tobytes(), win_w, win_h)
+            rkey = round(min_r + (max_r - min_r) * breath)  # whole pixels
+            if rkey != self._breath_last_key:  # unchanged frame: nothing to push
+                bgra = self._breath_frame(rkey, lambda r: self._breath_render_layered(win_w, win_h, r))
+                self._breath_update_layered_window(bgra, win_w, win_h)
+                self._breath_last_key = rkey
         else:
             # --- Canvas path (2x supersample for dark/teal backgrounds) ---
             scale = 2
@@ -5515,22 +5887,38 @@ class ScreenBreakApp:
             half = min(img_w, img_h) / 2
             max_r = (half - 8 * scale) / outermost_factor
             min_r = max_r * 0.33
-            core_r = min_r + (max_r - min_r) * breath
-            rgb_img = self._breath_draw_rings(img_w, img_h, core_r, self._breath_bg_rgb)
-            rgb_img = rgb_img.filter(ImageFilter.GaussianBlur(radius=1.0))
-            rgb_img = rgb_img.resize((win_w, win_h), Image.LANCZOS)
-            try:
-                self._breath_photo = ImageTk.PhotoImage(rgb_img)
-                self._breath_canvas.itemconfig(self._breath_img_id, image=self._breath_photo)
-            except tk.TclError:
-                return
+            # Quantized to whole on-screen pixels, then drawn at 2x
+            rkey = round((min_r + (max_r - min_r) * breath) / scale)
+
+            def render(r: int) -> bytes:
+                # A 2x2 box average of the supersampled frame is the antialiasing;
+                # the Gaussian blur + LANCZOS it replaces cost ~60x as much.
+                return self._breath_draw_rings(img_w, img_h, r * scale, self._breath_bg_rgb).reduce(scale).tobytes()
+
+            if rkey != self._breath_last_key:
+                rgb_img = Image.frombuffer("RGB", (win_w, win_h), self._breath_frame(rkey, render), "raw", "RGB", 0, 1)
+                try:
+                    if self._breath_photo is None:
+                        self._breath_photo = ImageTk.PhotoImage(rgb_img)
+                        self._breath_canvas.itemconfig(self._breath_img_id, image=self._breath_photo)
+                    else:  # same size every frame: write into the existing Tk image
+                        self._breath_photo.paste(rgb_img)
+                except tk.TclError:
+                    return
+                self._breath_last_key = rkey
 
         # Schedule next frame (~60fps on Windows, ~30fps on macOS for large sizes)
         _frame_ms = 16
         if IS_MAC and max(win_w, win_h) > 500:
             _frame_ms = 33  # ~30fps to reduce CPU on non-layered rendering path
+        if hold_left:
+            # Nothing to draw during a hold: wake at the Ctrl-poll rate instead
+            _frame_ms = max(_frame_ms, min(50, int(hold_left * 1000)))
+        # The interval is frame start to frame start: take off this frame's
+        # render time so a slow (cache-miss) frame doesn't also delay the next
+        _frame_ms = max(1, _frame_ms - int((time.perf_counter() - frame_start) * 1000))
         try:
-            self._breath_win.after(_frame_ms, self._animate_breathing_widget)
+            self._breath_after_id = self._breath_win.after(_frame_ms, self._animate_breathing_widget)
         except tk.TclError:
             self._breath_running = False
 
@@ -5544,19 +5932,20 @@ class ScreenBreakApp:
         """Move breathing widget with mouse."""
         x = event.x_root - self._breath_drag_x
         y = event.y_root - self._breath_drag_y
-        self._breath_win.geometry(f"+{x}+{y}")
+        self._queue_move(self._breath_win, x, y)
         self._breath_dragged = True
 
     def _breath_release(self, event) -> None:
         """Save position if dragged, then re-enable click-through."""
         if self._breath_dragged:
+            self._flush_moves()
             x = self._breath_win.winfo_x()
             y = self._breath_win.winfo_y()
             self.config["breathing_widget_position"] = [x, y]
             save_config(self.config)
             self._breath_dragged = False
             # Re-enable click-through after drag completes (Windows only)
-            if IS_WIN and self._breath_hwnd and self.config.get("breathing_widget_click_through", True):
+            if IS_WIN and self._breath_hwnd and self._breath_click_through:
                 self._breath_set_click_through(True)
 
     def _breath_menu(self, event) -> None:
@@ -5578,15 +5967,17 @@ class ScreenBreakApp:
 
     def _breath_toggle_pause(self) -> None:
         """Toggle breathing animation pause/resume."""
-        if self._breath_running:
-            self._breath_running = False
-        else:
-            self._breath_running = True
-            self._animate_breathing_widget()
+        self._breath_running = not self._breath_running  # a running frame loop picks it up
+        if self._breath_running and self._breath_after_id is None and self._breath_win:
+            self._animate_breathing_widget()  # the loop stopped while paused
 
     def _destroy_breathing_widget(self) -> None:
         """Tear down the breathing circle widget."""
         self._breath_running = False
+        if self._breath_after_id:
+            try: self.root.after_cancel(self._breath_after_id)
+            except tk.TclError: pass
+            self._breath_after_id = None
         self._breath_free_gdi()
         if self._breath_hwnd:
             self._breath_set_click_through(False)
@@ -5600,11 +5991,22 @@ class ScreenBreakApp:
             self._breath_win = None
             self._breath_canvas = None
             self._breath_photo = None
+        self._breath_reset_frames()
+        self._breath_scratch = None
 
     # ━━━ System Tray ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+    _tray_icon_cache: dict[bool, Image.Image] = {}  # paused -> icon; they never change
+
     def _create_tray_icon(self, paused: bool = False) -> Image.Image:
-        """Create Windows 3.1 style stopwatch tray icon."""
+        """Windows 3.1 style stopwatch tray icon, drawn once per state."""
+        icon = self._tray_icon_cache.get(paused)
+        if icon is None:
+            icon = self._tray_icon_cache[paused] = self._draw_tray_icon(paused)
+        return icon
+
+    @staticmethod
+    def _draw_tray_icon(paused: bool) -> Image.Image:
         size = 64
         img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
         draw = ImageDraw.Draw(img)
@@ -5636,38 +6038,43 @@ class ScreenBreakApp:
         draw.ellipse([cx-r_outer+1, cy-r_outer+1, cx+r_outer-1, cy+r_outer-1], fill=TEAL)
 
         # Rim bevel
-        for a_deg in range(200, 345):
-            a = math.radians(a_deg)
-            bx = int(cx + (r_outer-2) * math.cos(a))
-            by = int(cy + (r_outer-2) * math.sin(a))
-            draw.point((bx, by), fill=LIGHT_CYAN)
-        for a_deg in range(20, 165):
-            a = math.radians(a_deg)
-            bx = int(cx + (r_outer-2) * math.cos(a))
-            by = int(cy + (r_outer-2) * math.sin(a))
-            draw.point((bx, by), fill=DARK_TEAL)
+        def rim(degrees: range) -> list[tuple[int, int]]:
+            return [(int(cx + (r_outer-2) * math.cos(a)), int(cy + (r_outer-2) * math.sin(a)))
+                    for a in map(math.radians, degrees)]
+        draw.point(rim(range(200, 345)), fill=LIGHT_CYAN)
+        draw.point(rim(range(20, 165)), fill=DARK_TEAL)
 
         # Inner face
         draw.ellipse([cx-r_inner-1, cy-r_inner-1, cx+r_inner+1, cy+r_inner+1], fill=BLACK)
         draw.ellipse([cx-r_inner, cy-r_inner, cx+r_inner, cy+r_inner], fill=WHITE)
 
-        # Crosshatch on face
+        # Crosshatch on face: each diagonal runs between the first and last
+        # integer x (u = x - cx) inside the face, where u² + (u + d)² <= r_sq
         r_sq = (r_inner - 1) ** 2
+        u_min, u_max = -r_inner + 1, r_inner - 1
+
+        def chord(d: int) -> Optional[tuple[int, int]]:
+            disc = 2 * r_sq - d * d
+            if disc < 0:
+                return None
+            root = math.sqrt(disc)
+            inside = lambda u: u * u + (u + d) * (u + d) <= r_sq
+            lo = max(math.ceil((-d - root) / 2), u_min)
+            hi = min(math.floor((-d + root) / 2), u_max)
+            # Nudge the float roots onto the exact integer boundary
+            while lo > u_min and inside(lo - 1): lo -= 1
+            while lo <= hi and not inside(lo): lo += 1
+            while hi < u_max and inside(hi + 1): hi += 1
+            while hi >= lo and not inside(hi): hi -= 1
+            return (lo, hi) if hi > lo else None
+
         for offset in range(-2*r_inner, 2*r_inner+1, 4):
-            pts = []
-            for x in range(cx-r_inner+1, cx+r_inner):
-                y = x + offset
-                if (x-cx)**2 + (y-cy)**2 <= r_sq:
-                    pts.append((x, y))
-            if len(pts) >= 2:
-                draw.line([pts[0], pts[-1]], fill=TEAL)
-            pts = []
-            for x in range(cx-r_inner+1, cx+r_inner):
-                y = -x + offset + 2*cy
-                if (x-cx)**2 + (y-cy)**2 <= r_sq:
-                    pts.append((x, y))
-            if len(pts) >= 2:
-                draw.line([pts[0], pts[-1]], fill=TEAL)
+            span = chord(offset + cx - cy)          # y = x + offset
+            if span:
+                draw.line([(cx + u, cx + u + offset) for u in span], fill=TEAL)
+            span = chord(cx - cy - offset)          # y = -x + offset + 2*cy
+            if span:
+                draw.line([(cx + u, 2*cy - cx - u + offset) for u in span], fill=TEAL)
 
         # Tick marks
         for h in [0, 90, 180, 270]:
@@ -5762,7 +6169,7 @@ class ScreenBreakApp:
     def _quit(self, icon: Optional[Any] = None, item: Optional[Any] = None) -> None:
         if self.config.get("deo_mode_enabled", False):
             return  # Deo mode: the hidden gesture is the only way out
-        save_stats(self.stats)
+        self._flush_stats();  self._flush_notes()
         self._destroy_breathing_widget()
         if HAS_TRAY and hasattr(self, "tray"):
             self.tray.stop()
@@ -5789,7 +6196,7 @@ class ScreenBreakApp:
         if not apply_update_and_restart(result["repo"]):
             messagebox.showerror("Screen Break", "Update failed (local changes may conflict). Nothing was changed.")
             return
-        save_stats(self.stats)
+        self._flush_stats();  self._flush_notes()
         self._destroy_breathing_widget()
         if HAS_TRAY and hasattr(self, "tray"):
             self.tray.stop()
@@ -0,0 +1,103 @@
+"""Unit tests for the notes file: JSON-Lines loading, the one-time migration
+from the legacy JSON-list format, and recovery from damaged files.
+
+Runs headless — no Tk. The notes helpers only touch NOTES_FILE, so the tests
+call them on a bare ScreenBreakApp (no __init__) against a temp file.
+"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import screen_break as sb
+
+
+@pytest.fixture
+def notes_file(tmp_path, monkeypatch):
+    path = tmp_path / "screen_break_notes.json"
+    monkeypatch.setattr(sb, "NOTES_FILE", str(path))
+    return path
+
+
+@pytest.fixture
+def app():
+    app = sb.ScreenBreakApp.__new__(sb.ScreenBreakApp)
+    app._notes_pending = []
+    return app
+
+
+def note(i):
+    return {"time": f"2026-07-24 09:{i:02d}", "note": f"note {i}"}
+
+
+def test_missing_file_loads_empty(notes_file, app):
+    assert app._load_notes() == []
+
+
+def test_legacy_list_is_migrated_to_json_lines(notes_file, app):
+    legacy = [note(i) for i in range(3)]
+    notes_file.write_text(json.dumps(legacy, indent=2), encoding="utf-8")
+    assert app._load_notes() == legacy
+    lines = notes_file.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == legacy
+    assert not os.path.exists(str(notes_file) + ".tmp")
+
+
+def test_migrated_file_accepts_appends(notes_file, app):
+    notes_file.write_text(json.dumps([note(0)], indent=2), encoding="utf-8")
+    app._load_notes()
+    app._notes_pending = [note(1)]
+    app._flush_notes()
+    assert app._load_notes() == [note(0), note(1)]
+
+
+def test_torn_trailing_line_is_skipped(notes_file, app):
+    good = [note(i) for i in range(3)]
+    text = "".join(json.dumps(e) + "\n" for e in good) + '{"time": "2026-07-24 09:0'
+    notes_file.write_text(text, encoding="utf-8")
+    assert app._load_notes() == good
+
+
+def test_tail_keeps_only_the_newest_notes(notes_file, app):
+    notes_file.write_text("".join(json.dumps(note(i)) + "\n" for i in range(10)),
+                          encoding="utf-8")
+    assert app._load_notes(3) == [note(7), note(8), note(9)]
+    assert len(app._load_notes(None)) == 10
+
+
+def test_corrupt_legacy_file_is_moved_aside(notes_file, app):
+    broken = '[\n  {"time": "2026-07-24 09:00", "note": "unfinished'
+    notes_file.write_text(broken, encoding="utf-8")
+    assert app._load_notes() == []
+    assert not notes_file.exists()
+    assert (notes_file.parent / (notes_file.name + ".bak")).read_text(encoding="utf-8") == broken
+    # New notes start a fresh, readable JSON-Lines file
+    app._notes_pending = [note(1)]
+    app._flush_notes()
+    assert app._load_notes() == [note(1)]
+
+
+def test_failed_migration_keeps_the_legacy_file(notes_file, app, monkeypatch):
+    legacy = [note(i) for i in range(3)]
+    text = json.dumps(legacy, indent=2)
+    notes_file.write_text(text, encoding="utf-8")
+
+    def full_disk(fd):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(sb.os, "fsync", full_disk)
+    assert app._load_notes() == legacy
+    assert notes_file.read_text(encoding="utf-8") == text
+    assert not os.path.exists(str(notes_file) + ".tmp")
+
+
+def test_tail_spanning_several_read_blocks(notes_file, app):
+    text = "".join(json.dumps(note(i % 60)) + "\n" for i in range(3000))
+    notes_file.write_text(text, encoding="utf-8")
+    expected = [note(i % 60) for i in range(2500, 3000)]
+    assert app._load_notes(500) == expected
+    with open(notes_file, "rb") as f:
+        assert sb._tail_lines(f, 7, block=16) == text.encode().splitlines()[-7:]
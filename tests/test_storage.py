@@ -0,0 +1,58 @@
+"""Unit tests for _write_json, the atomic JSON writer behind config and
+stats saves.
+
+Runs headless — no Tk; only touches files under pytest's tmp_path.
+"""
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import screen_break as sb
+
+
+@pytest.fixture
+def path(tmp_path, monkeypatch):
+    monkeypatch.setattr(sb, "_last_written", {})
+    return str(tmp_path / "screen_break_config.json")
+
+
+def test_writes_json(path):
+    sb._write_json(path, {"a": 1})
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == {"a": 1}
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_unchanged_save_rewrites_a_deleted_file(path):
+    sb._write_json(path, {"a": 1})
+    os.remove(path)
+    sb._write_json(path, {"a": 1})
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == {"a": 1}
+
+
+def test_unchanged_save_replaces_a_hand_edited_file(path):
+    sb._write_json(path, {"a": 1})
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"a": 2, "edited": true}')
+    sb._write_json(path, {"a": 1})
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == {"a": 1}
+
+
+def test_failed_write_removes_the_temp_file(path, monkeypatch):
+    sb._write_json(path, {"a": 1})
+
+    def full_disk(fd):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(sb.os, "fsync", full_disk)
+    with pytest.raises(OSError):
+        sb._write_json(path, {"a": 2})
+    assert not os.path.exists(path + ".tmp")
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f) == {"a": 1}